@@ -0,0 +1,337 @@
+"""
+오디오 후처리 마이크로 벤치마크
+
+오디오 처리 워커가 실행하는 대사 병합(merge_lines), 음질 향상(enhance), 배경음악 합성(mix_background)을
+합성 음성 유사 오디오로 측정합니다. 측정 항목:
+    - wall_seconds: 실행 시간 (반복 중 중앙값)
+    - peak_rss_mb: 파이썬 프로세스 최대 메모리 (측정마다 새 프로세스에서 실행, VmHWM)
+    - ffmpeg_peak_rss_mb: ffmpeg/ffprobe 자식 프로세스 중 최대 메모리 (샘플링)
+    - subprocesses: 실행된 외부 프로세스 수 (실행 파일 이름별)
+
+에피소드 길이(분) × 대사 수 조합별로 대사 MP3를 미리 만들어 두고(fixtures), 결과는 JSON으로 저장합니다.
+--baseline으로 이전 결과 파일을 주면 변화율을 함께 출력합니다.
+
+--mode streaming이면 ffmpeg 파이프 기반 스트리밍 구현(AUDIO_RENDER_MODE=streaming)을 측정합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_audio --minutes 1,5,15,30,60 --lines 8,32,128,500 --output audio.json
+    python -m benchmarks.bench_audio --quick --baseline audio.json
+    python -m benchmarks.bench_audio --quick --mode streaming --baseline audio.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.common import add_common_arguments, int_list, use_fake_api_keys, write_report
+from benchmarks.synthetic import speech_like_segment
+
+
+EPISODE_MINUTES = (1, 5, 15, 30, 60)
+LINE_COUNTS = (8, 32, 128, 500)
+OPERATIONS = ("merge", "enhance", "background_music")
+PAUSE_MS = 500
+CLIP_BUCKET_MS = 250
+MAX_SYNTH_MS = 30_000  # 이보다 긴 대사는 합성한 구간을 반복해서 만듦
+SPEAKERS = ("rachel", "adam", "elli")
+
+
+def _encode(segment, path: Path, bitrate: str = "128k"):
+    # ElevenLabs 기본 출력(mp3_44100_128)과 같은 형식
+    segment.export(str(path), format="mp3", bitrate=bitrate)
+
+
+def _line_durations(minutes: int, lines: int, seed: int) -> List[int]:
+    """대사 사이 무음을 포함해 전체 길이가 minutes가 되도록 대사별 길이(ms) 생성 (±30% 편차)"""
+    rng = random.Random(seed)
+    speech_ms = max(lines * CLIP_BUCKET_MS, minutes * 60_000 - (lines - 1) * PAUSE_MS)
+    weights = [rng.uniform(0.7, 1.3) for _ in range(lines)]
+    total = sum(weights)
+    return [max(CLIP_BUCKET_MS, int(speech_ms * w / total) // CLIP_BUCKET_MS * CLIP_BUCKET_MS) for w in weights]
+
+
+def _clip(fixtures: Path, duration_ms: int) -> Path:
+    """길이별 대사 MP3 (한 번만 인코딩하고 재사용)"""
+    path = fixtures / "_clips" / f"{duration_ms}.mp3"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        base = speech_like_segment(min(duration_ms, MAX_SYNTH_MS), seed=duration_ms)
+        segment = base * (duration_ms // len(base) + 1) if duration_ms > len(base) else base
+        _encode(segment[:duration_ms], path)
+    return path
+
+
+def prepare_lines(fixtures: Path, minutes: int, lines: int) -> Path:
+    """에피소드 길이 × 대사 수 조합의 대사 MP3 디렉토리 생성"""
+    directory = fixtures / f"{minutes}m_{lines}l"
+    if (directory / "script.json").exists():
+        return directory
+
+    directory.mkdir(parents=True, exist_ok=True)
+    script = []
+    for i, duration_ms in enumerate(_line_durations(minutes, lines, seed=minutes * 1000 + lines)):
+        shutil.copyfile(_clip(fixtures, duration_ms), directory / f"line_{i:04d}.mp3")
+        script.append({"speaker": SPEAKERS[i % 2], "text": f"대사 {i}"})
+    (directory / "script.json").write_text(json.dumps(script, ensure_ascii=False), encoding="utf-8")
+    return directory
+
+
+def prepare_episode(fixtures: Path, minutes: int) -> Path:
+    """에피소드 길이의 MP3 (대사 파일을 ffmpeg concat으로 이어 붙여 메모리 사용 없이 생성)"""
+    path = fixtures / f"episode_{minutes}m.mp3"
+    if path.exists():
+        return path
+
+    lines_dir = prepare_lines(fixtures, minutes, LINE_COUNTS[0])
+    concat_list = lines_dir / "concat.txt"
+    concat_list.write_text(
+        "".join(f"file '{p.name}'\n" for p in sorted(lines_dir.glob("line_*.mp3"))),
+        encoding="utf-8"
+    )
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", str(concat_list), "-c", "copy", str(path)],
+        check=True
+    )
+    return path
+
+
+def prepare_music(fixtures: Path) -> Path:
+    """배경음악 대용 60초 MP3 (낮은 음높이의 합성 신호)"""
+    path = fixtures / "music.mp3"
+    if not path.exists():
+        _encode(speech_like_segment(60_000, seed=7, base_pitch=110.0), path, bitrate="192k")
+    return path
+
+
+def _status_mb(pid: str, field: str) -> float:
+    """/proc/<pid>/status의 메모리 항목(VmRSS, VmHWM 등)을 MB로 반환 (프로세스가 끝났으면 0)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+class ChildMemorySampler:
+    """자식 프로세스(ffmpeg)의 최대 메모리를 주기적으로 샘플링
+
+    ru_maxrss는 fork/exec 이전 부모 프로세스의 메모리까지 포함하므로 사용하지 않고,
+    exec 이후 새로 시작되는 /proc/<pid>/status의 VmHWM을 읽습니다.
+    아주 짧게 끝나는 프로세스는 놓칠 수 있지만 최대값은 긴 인코딩/디코딩에서 나옵니다.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _children(self) -> List[str]:
+        pids = []
+        for task in os.listdir("/proc/self/task"):
+            try:
+                with open(f"/proc/self/task/{task}/children") as f:
+                    pids.extend(f.read().split())
+            except OSError:
+                continue
+        return pids
+
+    def _run(self):
+        python = os.path.realpath(sys.executable)
+        while not self._stop.is_set():
+            for pid in self._children():
+                # fork 직후 exec 전에는 부모 메모리를 공유하므로 건너뜀
+                try:
+                    if os.path.realpath(os.readlink(f"/proc/{pid}/exe")) == python:
+                        continue
+                except OSError:
+                    continue
+                self.peak_mb = max(self.peak_mb, _status_mb(pid, "VmHWM"))
+            time.sleep(self.interval)
+
+    def __enter__(self) -> "ChildMemorySampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+def _measure(operation: str, fixture: Dict[str, str], output_dir: str, mode: str) -> dict:
+    """새 프로세스에서 작업 하나를 실행하고 시간/메모리/자식 프로세스 수 측정"""
+    subprocesses: Dict[str, int] = {}
+
+    def audit(event, args):
+        if event == "subprocess.Popen":
+            command = args[1]
+            program = command[0] if isinstance(command, (list, tuple)) else str(command).split()[0]
+            name = os.path.basename(str(program))
+            subprocesses[name] = subprocesses.get(name, 0) + 1
+
+    from src.tts import audio_ops
+
+    operations = audio_ops.OPERATIONS[mode]
+    output_path = os.path.join(output_dir, f"{operation}_{os.getpid()}.mp3")
+    rss_before = _status_mb("self", "VmRSS")
+    sys.addaudithook(audit)
+
+    sampler = ChildMemorySampler()
+    started = time.perf_counter()
+    with sampler:
+        if operation == "merge":
+            lines_dir = Path(fixture["lines_dir"])
+            script = json.loads((lines_dir / "script.json").read_text(encoding="utf-8"))
+            line_files = [str(lines_dir / f"line_{i:04d}.mp3") for i in range(len(script))]
+            operations["merge"](line_files, output_path, pause_ms=PAUSE_MS)
+        elif operation == "enhance":
+            operations["enhance"](fixture["episode"], output_path)
+        elif operation == "background_music":
+            # 배경음악 디코딩 캐시는 fixture와 함께 유지 (첫 측정만 디코딩 비용 포함)
+            operations["mix"](fixture["episode"], fixture["music"], output_path, 0.1,
+                              str(Path(fixture["music"]).parent / "_music_cache"))
+        else:
+            raise ValueError(f"알 수 없는 작업: {operation}")
+    wall = time.perf_counter() - started
+
+    output_bytes = os.path.getsize(output_path)
+    os.remove(output_path)
+    return {
+        "wall_seconds": wall,
+        "rss_before_mb": rss_before,
+        "peak_rss_mb": _status_mb("self", "VmHWM"),
+        "ffmpeg_peak_rss_mb": sampler.peak_mb,
+        "subprocesses": subprocesses,
+        "output_bytes": output_bytes
+    }
+
+
+def run_case(operation: str, fixture: Dict[str, str], output_dir: Path, repeat: int, mode: str) -> dict:
+    """같은 조합을 repeat번 측정 (매번 새 프로세스)"""
+    runs = []
+    for _ in range(repeat):
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            runs.append(pool.submit(_measure, operation, fixture, str(output_dir), mode).result())
+
+    walls = [r["wall_seconds"] for r in runs]
+    return {
+        "wall_seconds": round(statistics.median(walls), 4),
+        "wall_seconds_all": [round(w, 4) for w in walls],
+        "rss_before_mb": round(max(r["rss_before_mb"] for r in runs), 1),
+        "peak_rss_mb": round(max(r["peak_rss_mb"] for r in runs), 1),
+        "ffmpeg_peak_rss_mb": round(max(r["ffmpeg_peak_rss_mb"] for r in runs), 1),
+        "subprocesses": runs[-1]["subprocesses"],
+        "output_bytes": runs[-1]["output_bytes"]
+    }
+
+
+def _ffmpeg_version() -> Optional[str]:
+    try:
+        output = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True).stdout
+        return output.splitlines()[0] if output else None
+    except FileNotFoundError:
+        return None
+
+
+def _case_key(row: dict) -> tuple:
+    return row["operation"], row["minutes"], row.get("lines")
+
+
+def print_results(results: List[dict], baseline: Optional[List[dict]] = None):
+    previous = {_case_key(row): row for row in baseline or []}
+    print(f"{'operation':>17} {'min':>4} {'lines':>6} {'wall(s)':>9} {'rss(MB)':>8} {'ffmpeg(MB)':>10} {'procs':>6}  change")
+    for row in results:
+        procs = sum(row["subprocesses"].values())
+        change = ""
+        old = previous.get(_case_key(row))
+        if old:
+            wall_delta = (row["wall_seconds"] / old["wall_seconds"] - 1) * 100 if old["wall_seconds"] else 0
+            rss_delta = row["peak_rss_mb"] - old["peak_rss_mb"]
+            change = f"wall {wall_delta:+.1f}%, rss {rss_delta:+.1f}MB, procs {procs - sum(old['subprocesses'].values()):+d}"
+        print(
+            f"{row['operation']:>17} {row['minutes']:>4} {str(row.get('lines') or '-'):>6} "
+            f"{row['wall_seconds']:>9} {row['peak_rss_mb']:>8} {row['ffmpeg_peak_rss_mb']:>10} {procs:>6}  {change}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오디오 후처리 마이크로 벤치마크")
+    parser.add_argument("--minutes", type=int_list, default=list(EPISODE_MINUTES), help="에피소드 길이(분) 목록")
+    parser.add_argument("--lines", type=int_list, default=list(LINE_COUNTS), help="대사 수 목록 (merge에만 적용)")
+    parser.add_argument("--operations", type=lambda v: v.split(","), default=list(OPERATIONS))
+    parser.add_argument("--quick", action="store_true", help="1, 5분 × 8, 32줄, 1회 반복만 측정")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--mode", choices=["pydub", "streaming"], default="pydub",
+                        help="렌더링 방식 (AUDIO_RENDER_MODE와 같음)")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    if args.quick:
+        args.minutes, args.lines, args.repeat = [1, 5], [8, 32], 1
+
+    use_fake_api_keys()
+    fixtures = Path(args.fixtures).resolve()
+    output_dir = fixtures / "_out"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    cases = []
+    for minutes in args.minutes:
+        if "merge" in args.operations:
+            for lines in args.lines:
+                cases.append(("merge", minutes, lines))
+        for operation in ("enhance", "background_music"):
+            if operation in args.operations:
+                cases.append((operation, minutes, None))
+
+    results = []
+    for operation, minutes, lines in cases:
+        print(f"준비/측정: {operation} {minutes}분 {lines or ''}", file=sys.stderr)
+        fixture = {
+            "lines_dir": str(prepare_lines(fixtures, minutes, lines)) if lines else "",
+            "episode": str(prepare_episode(fixtures, minutes)) if operation != "merge" else "",
+            "music": str(prepare_music(fixtures)) if operation == "background_music" else ""
+        }
+        results.append({
+            "operation": operation,
+            "minutes": minutes,
+            "lines": lines,
+            **run_case(operation, fixture, output_dir, args.repeat, args.mode)
+        })
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "ffmpeg": _ffmpeg_version()
+            },
+            "repeat": args.repeat,
+            "mode": args.mode,
+            "results": results
+        }
+        write_report(args.output, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+오프라인 종단 간(end-to-end) 팟캐스트 생성 벤치마크
+
+로컬 대역 서버(fake_services)를 띄우고 OPENAI_BASE_URL / ELEVENLABS_BASE_URL을 그쪽으로 지정한 뒤,
+대화 턴 수 × 동시 작업 수 조합별로 실제 파이프라인(LLM → TTS → 병합 → 후처리)을 실행합니다.
+유료 API 키 없이 처리량, 작업 지연 시간 p50/p99, 단계별 소요 시간을 측정합니다.
+
+모드:
+    generator: PodcastGenerator를 직접 호출 (단계별 시간은 결과의 stage_timings)
+    api: FastAPI 앱을 uvicorn으로 띄우고 HTTP로 /podcasts/generate 호출
+         (단계별 시간은 /podcasts/{id}/trace의 stage 스팬)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_e2e --turns 8,16,32 --concurrency 1,4 --jobs 4 --output e2e.json
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.common import int_list, use_fake_api_keys, write_report
+from benchmarks.fake_services import UvicornThread, add_arguments, config_from_args, create_fake_app
+
+
+CUSTOM_VOICES = {"화자A": "rachel", "화자B": "adam", "화자C": "elli"}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def job_request(args: argparse.Namespace, turns: int, index: int) -> dict:
+    custom_voices = {f"화자{chr(65 + i)}": CUSTOM_VOICES[f"화자{chr(65 + i)}"] for i in range(args.num_speakers)}
+    return {
+        "topic": f"벤치마크 주제 {index}",
+        "language": args.language,
+        "num_speakers": args.num_speakers,
+        "custom_voices": custom_voices,
+        "turns": turns
+    }
+
+
+async def run_generator_job(generator, request: dict) -> Dict[str, float]:
+    """PodcastGenerator로 작업 하나 실행 후 단계별 시간 반환"""
+    result = await generator.generate_podcast(podcast_id=str(uuid.uuid4()), **request)
+    return result.get("stage_timings", {})
+
+
+async def run_api_job(client, request: dict) -> Dict[str, float]:
+    """HTTP API로 작업 하나 실행 후 트레이스에서 단계별 시간 반환"""
+    payload = dict(request)
+    # API는 분 단위로 받으므로 (1분 = 8턴) 턴 수를 분으로 환산
+    payload["duration_minutes"] = max(1, payload.pop("turns") // 8)
+    response = await client.post("/podcasts/generate", json=payload)
+    response.raise_for_status()
+    podcast_id = response.json()["podcast_id"]
+
+    trace = (await client.get(f"/podcasts/{podcast_id}/trace")).json()
+    return {
+        row["name"].removeprefix("stage."): row["duration_ms"] / 1000
+        for row in trace.get("spans", [])
+        if row["kind"] == "stage"
+    }
+
+
+async def run_cell(args: argparse.Namespace, runner, turns: int, concurrency: int) -> dict:
+    """턴 수 × 동시 작업 수 조합 하나 측정"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    stage_totals: Dict[str, List[float]] = {}
+    errors = 0
+
+    async def one(index: int):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                timings = await runner(job_request(args, turns, index))
+            except Exception as e:
+                errors += 1
+                print(f"  작업 실패: {e}", file=sys.stderr)
+                return
+            latencies.append(time.perf_counter() - started)
+            for stage, seconds in timings.items():
+                stage_totals.setdefault(stage, []).append(seconds)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.jobs)))
+    wall = time.perf_counter() - started
+
+    return {
+        "turns": turns,
+        "concurrency": concurrency,
+        "jobs": args.jobs,
+        "errors": errors,
+        "wall_seconds": round(wall, 3),
+        "throughput_jobs_per_minute": round(len(latencies) / wall * 60, 3) if wall else 0.0,
+        "latency_p50_seconds": round(percentile(latencies, 50), 3),
+        "latency_p99_seconds": round(percentile(latencies, 99), 3),
+        "stages_mean_seconds": {
+            stage: round(statistics.mean(values), 3) for stage, values in stage_totals.items()
+        }
+    }
+
+
+async def run_matrix(args: argparse.Namespace) -> List[dict]:
+    if args.mode == "generator":
+        from src.podcast.generator import PodcastGenerator
+
+        generator = PodcastGenerator()
+        runner = lambda request: run_generator_job(generator, request)  # noqa: E731
+        return [
+            await run_cell(args, runner, turns, concurrency)
+            for turns in args.turns for concurrency in args.concurrency
+        ]
+
+    import httpx
+    from main import app
+
+    api_server = UvicornThread(app).start()
+    try:
+        async with httpx.AsyncClient(base_url=api_server.base_url, timeout=None) as client:
+            runner = lambda request: run_api_job(client, request)  # noqa: E731
+            return [
+                await run_cell(args, runner, turns, concurrency)
+                for turns in args.turns for concurrency in args.concurrency
+            ]
+    finally:
+        api_server.stop()
+
+
+def print_table(results: List[dict]):
+    print(f"{'turns':>6} {'conc':>5} {'jobs/min':>9} {'p50(s)':>8} {'p99(s)':>8} {'err':>4}  stages(mean s)")
+    for row in results:
+        stages = ", ".join(f"{k}={v}" for k, v in row["stages_mean_seconds"].items())
+        print(
+            f"{row['turns']:>6} {row['concurrency']:>5} {row['throughput_jobs_per_minute']:>9} "
+            f"{row['latency_p50_seconds']:>8} {row['latency_p99_seconds']:>8} {row['errors']:>4}  {stages}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 종단 간 팟캐스트 생성 벤치마크")
+    parser.add_argument("--mode", choices=["generator", "api"], default="generator")
+    parser.add_argument("--turns", type=int_list, default=[8, 16])
+    parser.add_argument("--concurrency", type=int_list, default=[1, 4])
+    parser.add_argument("--jobs", type=int, default=4, help="조합별 작업 수")
+    parser.add_argument("--num-speakers", type=int, choices=[2, 3], default=2)
+    parser.add_argument("--language", choices=["ko", "en"], default="ko")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--workdir", help="output/ 디렉토리를 만들 작업 디렉토리 (기본: 임시 디렉토리)")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    fake_server = UvicornThread(create_fake_app(config_from_args(args))).start()
+
+    # src 모듈이 설정을 읽기 전에 API 주소를 대역 서버로 지정
+    os.environ["OPENAI_BASE_URL"] = f"{fake_server.base_url}/v1"
+    os.environ["ELEVENLABS_BASE_URL"] = fake_server.base_url
+    use_fake_api_keys()
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+    from loguru import logger
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    output_path = Path(args.output).resolve() if args.output else None
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="podcast-bench-"))
+    (workdir / "output").mkdir(parents=True, exist_ok=True)
+    os.chdir(workdir)
+
+    try:
+        results = asyncio.run(run_matrix(args))
+    finally:
+        fake_server.stop()
+
+    print_table(results)
+    report = {
+        "mode": args.mode,
+        "args": vars(args),
+        "fake_service_stats": dict(fake_server.app.state.services.stats),
+        "results": results
+    }
+    write_report(output_path, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+FastAPI 서비스 HTTP 부하 시나리오
+
+프론트엔드(frontend/src/services/api.ts)와 같은 방식으로 서비스를 호출하는 가상 사용자를 단계적으로 늘리며
+단일 워커가 어디까지 버티는지 측정합니다. 외부 API는 로컬 대역 서버(fake_services)가 대신합니다.
+
+가상 사용자 종류:
+    creator:  POST /podcasts/generate (완료까지 대기하는 동기 요청)
+    poller:   GET /podcasts/status/{id}를 일정 간격으로 폴링
+    browser:  GET /voices, GET /podcasts/list
+    listener: GET /podcasts/download/{id}/audio에 Range 헤더로 임의 위치 탐색
+
+단계(step)마다 엔드포인트별 지연 시간 p50/p95/p99, 오류율, 처리량과
+서버 이벤트 루프 지연(/metrics의 podcast_event_loop_lag_seconds)을 보고하고,
+오류율 또는 p99가 기준을 넘는 첫 단계를 포화 지점으로 표시합니다.
+/metrics는 요청을 받은 워커 하나의 값이므로 (prometheus_client multiprocess 모드 아님)
+--workers 2 이상에서는 이벤트 루프 지연을 보고하지 않습니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_load --scenario mixed --users 10,50,100,200 --step-seconds 20 --output load.json
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+
+from benchmarks.bench_e2e import percentile
+from benchmarks.common import int_list, write_report
+from benchmarks.fake_services import add_arguments
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+LAG_METRIC = "podcast_event_loop_lag_seconds"
+
+# 시나리오별 가상 사용자 구성 비율
+SCENARIOS: Dict[str, Dict[str, float]] = {
+    "poll": {"poller": 1.0},
+    "browse": {"browser": 1.0},
+    "seek": {"listener": 1.0},
+    "generate": {"creator": 0.1, "poller": 0.9},
+    "mixed": {"creator": 0.05, "poller": 0.5, "browser": 0.25, "listener": 0.2},
+}
+
+
+class LoadStats:
+    """엔드포인트별 지연 시간과 상태 코드 집계"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float, status: Optional[int]):
+        self.latencies.setdefault(endpoint, []).append(seconds)
+        key = str(status) if status is not None else "exception"
+        counts = self.statuses.setdefault(endpoint, {})
+        counts[key] = counts.get(key, 0) + 1
+        if status is None or status >= 400:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def summary(self, elapsed: float) -> Dict[str, dict]:
+        result = {}
+        for endpoint, values in self.latencies.items():
+            result[endpoint] = {
+                "requests": len(values),
+                "requests_per_second": round(len(values) / elapsed, 2),
+                "error_rate": round(self.errors.get(endpoint, 0) / len(values), 4),
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+                "p99_ms": round(percentile(values, 99) * 1000, 1),
+                "max_ms": round(max(values) * 1000, 1),
+                "statuses": self.statuses[endpoint]
+            }
+        return result
+
+
+class LoadContext:
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace, podcast_ids: List[str], audio_sizes: Dict[str, int]):
+        self.client = client
+        self.args = args
+        self.podcast_ids = podcast_ids
+        self.audio_sizes = audio_sizes
+        self.stats = LoadStats()
+        self.rng = random.Random(args.seed)
+
+    async def call(self, endpoint: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.stats.record(endpoint, time.perf_counter() - started, None)
+            return None
+        self.stats.record(endpoint, time.perf_counter() - started, response.status_code)
+        return response
+
+
+def generate_payload(args: argparse.Namespace, index: int) -> dict:
+    return {
+        "topic": f"부하 테스트 주제 {index}",
+        "duration_minutes": args.duration_minutes,
+        "language": "ko",
+        "num_speakers": 2,
+        "custom_voices": {"화자A": "rachel", "화자B": "adam"}
+    }
+
+
+async def creator(ctx: LoadContext, deadline: float, index: int):
+    while time.perf_counter() < deadline:
+        response = await ctx.call("POST /podcasts/generate", "POST", "/podcasts/generate",
+                                  json=generate_payload(ctx.args, index))
+        if response is not None and response.status_code == 200:
+            ctx.podcast_ids.append(response.json()["podcast_id"])
+
+
+async def poller(ctx: LoadContext, deadline: float, index: int):
+    # 사용자마다 폴링 시점이 겹치지 않도록 시작 시각을 분산
+    await asyncio.sleep(ctx.rng.uniform(0, ctx.args.poll_interval))
+    while time.perf_counter() < deadline:
+        podcast_id = ctx.rng.choice(ctx.podcast_ids)
+        await ctx.call("GET /podcasts/status/{id}", "GET", f"/podcasts/status/{podcast_id}")
+        await asyncio.sleep(ctx.args.poll_interval)
+
+
+async def browser(ctx: LoadContext, deadline: float, index: int):
+    await asyncio.sleep(ctx.rng.uniform(0, ctx.args.think_time))
+    while time.perf_counter() < deadline:
+        await ctx.call("GET /voices", "GET", "/voices")
+        await ctx.call("GET /podcasts/list", "GET", "/podcasts/list")
+        await asyncio.sleep(ctx.args.think_time)
+
+
+async def listener(ctx: LoadContext, deadline: float, index: int):
+    await asyncio.sleep(ctx.rng.uniform(0, ctx.args.think_time))
+    while time.perf_counter() < deadline:
+        podcast_id = ctx.rng.choice(list(ctx.audio_sizes))
+        size = ctx.audio_sizes[podcast_id]
+        start = ctx.rng.randrange(0, max(1, size - ctx.args.range_bytes))
+        headers = {"Range": f"bytes={start}-{start + ctx.args.range_bytes - 1}"}
+        await ctx.call("GET /podcasts/download/{id}/audio (Range)", "GET",
+                       f"/podcasts/download/{podcast_id}/audio", headers=headers)
+        await asyncio.sleep(ctx.args.think_time)
+
+
+USER_TYPES = {"creator": creator, "poller": poller, "browser": browser, "listener": listener}
+
+
+def lag_histogram(metrics_text: str) -> Dict[float, float]:
+    """/metrics 응답에서 이벤트 루프 지연 히스토그램의 누적 버킷 {상한: 개수} 추출"""
+    buckets = {}
+    for family in text_string_to_metric_families(metrics_text):
+        if family.name != LAG_METRIC:
+            continue
+        for sample in family.samples:
+            if sample.name.endswith("_bucket"):
+                buckets[float(sample.labels["le"])] = sample.value
+    return buckets
+
+
+def lag_summary(before: Dict[float, float], after: Dict[float, float]) -> dict:
+    """두 시점 히스토그램의 차이로 단계 동안의 지연 분포 추정 (버킷 상한 기준)"""
+    delta = {bound: after.get(bound, 0) - before.get(bound, 0) for bound in after}
+    total = delta.get(float("inf"), 0)
+    if not total:
+        return {"samples": 0}
+
+    def quantile(q: float) -> Optional[float]:
+        # 가장 큰 버킷을 넘으면 None (over_largest_bucket 참고)
+        for bound in sorted(delta):
+            if delta[bound] >= total * q:
+                return bound if bound != float("inf") else None
+        return None
+
+    finite = sorted(b for b in delta if b != float("inf"))
+    over_largest = total - delta[finite[-1]] if finite else 0
+    return {
+        "samples": int(total),
+        "p50_le_seconds": quantile(0.5),
+        "p99_le_seconds": quantile(0.99),
+        "max_le_seconds": quantile(1.0),
+        "over_100ms": int(total - delta.get(0.1, 0)),
+        "over_largest_bucket": int(over_largest)
+    }
+
+
+async def run_step(args: argparse.Namespace, client: httpx.AsyncClient, users: int,
+                   podcast_ids: List[str], audio_sizes: Dict[str, int]) -> dict:
+    """가상 사용자 users명으로 step_seconds 동안 부하 생성"""
+    ctx = LoadContext(client, args, podcast_ids, audio_sizes)
+    # 워커가 여러 개면 두 번의 스크레이프를 서로 다른 워커가 응답할 수 있어 차이를 구할 수 없음
+    measure_lag = args.workers == 1
+    lag_before = lag_histogram((await client.get("/metrics")).text) if measure_lag else None
+
+    mix = SCENARIOS[args.scenario]
+    tasks = []
+    deadline = time.perf_counter() + args.step_seconds
+    started = time.perf_counter()
+    for kind, share in mix.items():
+        count = max(1, round(users * share)) if share else 0
+        tasks.extend(USER_TYPES[kind](ctx, deadline, i) for i in range(count))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    lag = None
+    if measure_lag:
+        lag = lag_summary(lag_before, lag_histogram((await client.get("/metrics")).text))
+    endpoints = ctx.stats.summary(elapsed)
+    return {
+        "users": users,
+        "elapsed_seconds": round(elapsed, 2),
+        "endpoints": endpoints,
+        "event_loop_lag": lag
+    }
+
+
+def find_saturation(steps: List[dict], max_error_rate: float, slo_ms: float) -> Optional[int]:
+    """오류율 또는 p99가 기준을 넘는 첫 단계의 사용자 수 (생성 요청은 p99 기준에서 제외)"""
+    for step in steps:
+        for endpoint, stats in step["endpoints"].items():
+            if stats["error_rate"] > max_error_rate:
+                return step["users"]
+            if not endpoint.startswith("POST /podcasts/generate") and stats["p99_ms"] > slo_ms:
+                return step["users"]
+    return None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(url: str, process: subprocess.Popen, timeout: float = 30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버 프로세스가 종료되었습니다: {url}")
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise TimeoutError(f"서버가 시작되지 않았습니다: {url}")
+
+
+def start_servers(args: argparse.Namespace, workdir: Path) -> tuple:
+    """대역 서버와 API 서버를 별도 프로세스로 실행 (부하 생성기와 GIL을 공유하지 않도록)"""
+    fake_port, api_port = free_port(), free_port()
+    fake_args = [
+        "--llm-median-ms", str(args.llm_median_ms), "--llm-p99-ms", str(args.llm_p99_ms),
+        "--tts-median-ms", str(args.tts_median_ms), "--tts-p99-ms", str(args.tts_p99_ms),
+        "--tts-per-char-ms", str(args.tts_per_char_ms),
+        "--llm-error-rate", str(args.llm_error_rate), "--tts-error-rate", str(args.tts_error_rate),
+        "--chars-per-second", str(args.chars_per_second), "--line-chars", str(args.line_chars),
+        "--seed", str(args.seed)
+    ]
+    fake = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fake_services", "--port", str(fake_port), *fake_args],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL
+    )
+    wait_ready(f"http://127.0.0.1:{fake_port}/stats", fake)
+
+    env = dict(
+        os.environ,
+        OPENAI_BASE_URL=f"http://127.0.0.1:{fake_port}/v1",
+        ELEVENLABS_BASE_URL=f"http://127.0.0.1:{fake_port}",
+        OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY", "fake-key"),
+        ELEVENLABS_API_KEY=os.environ.get("ELEVENLABS_API_KEY", "fake-key"),
+        STATE_BACKEND=args.state_backend,
+        PYTHONPATH=str(BACKEND_DIR)
+    )
+    api = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", str(BACKEND_DIR),
+         "--port", str(api_port), "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"],
+        cwd=workdir, env=env, stderr=subprocess.DEVNULL if not args.server_logs else None
+    )
+    wait_ready(f"http://127.0.0.1:{api_port}/voices", api)
+    return fake, api, f"http://127.0.0.1:{api_port}"
+
+
+async def seed_podcasts(client: httpx.AsyncClient, args: argparse.Namespace) -> tuple:
+    """상태 조회/오디오 탐색 대상이 될 완성된 팟캐스트 생성"""
+    podcast_ids, audio_sizes = [], {}
+    for i in range(args.seed_jobs):
+        response = await client.post("/podcasts/generate", json=generate_payload(args, i))
+        response.raise_for_status()
+        podcast_id = response.json()["podcast_id"]
+        podcast_ids.append(podcast_id)
+        audio = await client.get(f"/podcasts/download/{podcast_id}/audio")
+        audio_sizes[podcast_id] = len(audio.content)
+    return podcast_ids, audio_sizes
+
+
+async def run_load(args: argparse.Namespace, base_url: str) -> dict:
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        print(f"시드 팟캐스트 {args.seed_jobs}개 생성 중...", file=sys.stderr)
+        podcast_ids, audio_sizes = await seed_podcasts(client, args)
+
+        steps = []
+        for users in args.users:
+            print(f"단계: 사용자 {users}명, {args.step_seconds}초", file=sys.stderr)
+            steps.append(await run_step(args, client, users, podcast_ids, audio_sizes))
+            print_step(steps[-1])
+
+    return {
+        "scenario": args.scenario,
+        "mix": SCENARIOS[args.scenario],
+        "steps": steps,
+        "saturation_users": find_saturation(steps, args.max_error_rate, args.slo_ms)
+    }
+
+
+def print_step(step: dict):
+    lag = step["event_loop_lag"]
+    if lag is None:
+        print(f"\n사용자 {step['users']}명 — 이벤트 루프 지연: 워커 여러 개에서는 측정하지 않음 (/metrics는 워커별)")
+    else:
+        print(f"\n사용자 {step['users']}명 — 이벤트 루프 지연 p50≤{lag.get('p50_le_seconds')}s "
+              f"p99≤{lag.get('p99_le_seconds')}s, 100ms 초과 {lag.get('over_100ms', 0)}회")
+    print(f"{'endpoint':>46} {'req/s':>7} {'err':>6} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for endpoint, stats in step["endpoints"].items():
+        print(f"{endpoint:>46} {stats['requests_per_second']:>7} {stats['error_rate']:>6} "
+              f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FastAPI 서비스 HTTP 부하 시나리오")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--users", type=int_list, default=[10, 50, 100, 200],
+                        help="단계별 가상 사용자 수")
+    parser.add_argument("--step-seconds", type=float, default=20)
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="상태 폴링 간격 (초)")
+    parser.add_argument("--think-time", type=float, default=1.0, help="browser/listener 요청 사이 대기 (초)")
+    parser.add_argument("--range-bytes", type=int, default=65536, help="오디오 탐색 한 번에 요청할 바이트 수")
+    parser.add_argument("--duration-minutes", type=int, default=1, help="creator가 요청하는 팟캐스트 길이")
+    parser.add_argument("--seed-jobs", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=120, help="요청 타임아웃 (api.ts의 2분과 동일)")
+    parser.add_argument("--slo-ms", type=float, default=1000, help="포화 판정 p99 기준 (생성 요청 제외)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--server-logs", action="store_true", help="API 서버 로그 출력")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="API 서버 워커 프로세스 수 (2 이상이면 이벤트 루프 지연은 보고하지 않음)")
+    parser.add_argument("--state-backend", choices=["file", "sqlite"], default="file",
+                        help="작업 상태 저장소 (워커 2개 이상이면 sqlite 필요)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    add_arguments(parser)
+    args = parser.parse_args()
+    if args.workers > 1 and args.state_backend != "sqlite":
+        parser.error("--workers 2 이상은 --state-backend sqlite와 함께 사용해야 합니다.")
+
+    workdir = Path(tempfile.mkdtemp(prefix="podcast-load-"))
+    (workdir / "output").mkdir()
+    fake, api, base_url = start_servers(args, workdir)
+    try:
+        report = asyncio.run(run_load(args, base_url))
+    finally:
+        for process in (api, fake):
+            process.terminate()
+            process.wait(timeout=10)
+
+    print(f"\n포화 지점: {report['saturation_users'] or '측정 범위 안에서 없음'}")
+    if args.output:
+        report["args"] = vars(args)
+        write_report(args.output, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+라우드니스 측정 벤치마크
+
+대사별 라우드니스 측정(audio_ops.measure_loudness: 디코딩 + K-가중 + 블록 에너지)과
+기존 peak 정규화(pydub normalize: 디코딩 + 최대값 탐색 + 게인)의 처리 속도를 비교합니다.
+측정 항목:
+    - realtime_x: 오디오 길이 / 실행 시간 (클수록 빠름, 반복 중 중앙값)
+    - meter_realtime_x: 디코딩을 뺀 라우드니스 계산(loudness.measure)만의 속도
+    - predicted_lufs / merged_lufs: 대사별 측정값으로 예측한 에피소드 라우드니스와
+      게인을 적용해 병합한 파일을 다시 측정한 값 (병합 후 전체 패스가 필요 없음을 확인)
+    - limited_db: 피크 상한 때문에 목표보다 낮춘 게인
+
+bench_audio.py와 같은 합성 대사/에피소드 fixture를 사용합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_loudness --minutes 1,5,15 --lines 32 --output loudness.json
+    python -m benchmarks.bench_loudness --quick
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+from pydub import AudioSegment
+
+from benchmarks.bench_audio import PAUSE_MS, SPEAKERS, prepare_episode, prepare_lines
+from benchmarks.common import add_common_arguments, int_list, use_fake_api_keys, write_report
+
+
+def _samples(segment: AudioSegment) -> np.ndarray:
+    samples = np.array(segment.get_array_of_samples(), dtype=np.float64).reshape(-1, segment.channels)
+    return samples / segment.max_possible_amplitude
+
+
+def _median_seconds(fn: Callable[[], object], repeat: int) -> float:
+    walls = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        walls.append(time.perf_counter() - started)
+    return statistics.median(walls)
+
+
+def run_case(fixtures: Path, minutes: int, lines: int, repeat: int, target_lufs: float) -> dict:
+    from src.tts import audio_ops, loudness
+
+    lines_dir = prepare_lines(fixtures, minutes, lines)
+    script = json.loads((lines_dir / "script.json").read_text(encoding="utf-8"))
+    line_files = [str(lines_dir / f"line_{i:04d}.mp3") for i in range(len(script))]
+    episode = str(prepare_episode(fixtures, minutes))
+
+    decoded = [AudioSegment.from_mp3(path) for path in line_files]
+    audio_seconds = sum(len(segment) for segment in decoded) / 1000
+
+    # 대사별 측정 (워커 프로세스에서 실행되는 것과 같은 함수)
+    measure_seconds = _median_seconds(lambda: [audio_ops.measure_loudness(path) for path in line_files], repeat)
+    # 디코딩을 뺀 계산만
+    arrays = [(_samples(segment), segment.frame_rate) for segment in decoded]
+    meter_seconds = _median_seconds(lambda: [loudness.measure(samples, rate) for samples, rate in arrays], repeat)
+    # 기존 방식: 병합된 에피소드 전체를 디코딩해 normalize
+    normalize_seconds = _median_seconds(lambda: AudioSegment.from_mp3(episode).normalize(), repeat)
+    episode_seconds = len(AudioSegment.from_mp3(episode)) / 1000
+
+    # 예측값과 실제 병합 결과 비교
+    stats = [audio_ops.measure_loudness(path)[0] for path in line_files]
+    speakers = [SPEAKERS[i % 2] for i in range(len(line_files))]
+    levels = loudness.speaker_gains(stats, speakers, [s["peak_dbfs"] for s in stats], target_lufs, PAUSE_MS)
+    merged_path = fixtures / "_out" / f"loudness_{os.getpid()}.mp3"
+    merged_path.parent.mkdir(parents=True, exist_ok=True)
+    audio_ops.merge_lines_streaming(
+        line_files, str(merged_path), PAUSE_MS, [levels["gains_db"][speaker] for speaker in speakers]
+    )
+    merged = AudioSegment.from_mp3(str(merged_path))
+    merged_lufs = loudness.measure(_samples(merged), merged.frame_rate)["lufs"]
+    merged_path.unlink()
+
+    return {
+        "minutes": minutes,
+        "lines": lines,
+        "audio_seconds": round(audio_seconds, 1),
+        "measure_seconds": round(measure_seconds, 4),
+        "realtime_x": round(audio_seconds / measure_seconds, 1),
+        "meter_realtime_x": round(audio_seconds / meter_seconds, 1),
+        "normalize_seconds": round(normalize_seconds, 4),
+        "normalize_realtime_x": round(episode_seconds / normalize_seconds, 1),
+        "predicted_lufs": levels["episode_lufs"],
+        "merged_lufs": merged_lufs,
+        "limited_db": levels["limited_db"]
+    }
+
+
+def print_results(results: List[dict]):
+    print(f"{'min':>4} {'lines':>6} {'measure(x)':>11} {'meter(x)':>9} {'normalize(x)':>13} {'predicted':>10} {'merged':>8} {'limited':>8}")
+    for row in results:
+        print(
+            f"{row['minutes']:>4} {row['lines']:>6} {row['realtime_x']:>11} {row['meter_realtime_x']:>9} "
+            f"{row['normalize_realtime_x']:>13} {str(row['predicted_lufs']):>10} {str(row['merged_lufs']):>8} {row['limited_db']:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라우드니스 측정 벤치마크")
+    parser.add_argument("--minutes", type=int_list, default=[1, 5, 15], help="에피소드 길이(분) 목록")
+    parser.add_argument("--lines", type=int_list, default=[32], help="대사 수 목록")
+    parser.add_argument("--target", type=float, default=-16.0, help="목표 통합 라우드니스 (LUFS)")
+    parser.add_argument("--quick", action="store_true", help="1분 × 8줄, 1회 반복만 측정")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    if args.quick:
+        args.minutes, args.lines, args.repeat = [1], [8], 1
+
+    use_fake_api_keys()
+    fixtures = Path(args.fixtures).resolve()
+
+    results = []
+    for minutes in args.minutes:
+        for lines in args.lines:
+            print(f"준비/측정: {minutes}분 {lines}줄", file=sys.stderr)
+            results.append(run_case(fixtures, minutes, lines, args.repeat, args.target))
+    print_results(results)
+
+    if args.output:
+        report = {"repeat": args.repeat, "target_lufs": args.target, "results": results}
+        write_report(args.output, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+TTS 텍스트 정규화 벤치마크
+
+측정 전에 골든 코퍼스(normalizer_golden.tsv)로 정규화 결과를 검사하고, 하나라도 다르면 측정하지 않고 종료합니다.
+측정 항목 (대사 수 × 반복 중 중앙값):
+    - legacy: 기존 _preprocess_korean_text (호출마다 re.sub에 패턴 문자열 전달, 간격 정리만)
+    - rules: 컴파일된 규칙을 대사마다 적용 (캐시 없음)
+    - batch: 캐시가 빈 정규화기의 normalize_batch (캐시에 없는 대사를 이어 붙여 규칙마다 한 번 실행)
+    - cached: 같은 대사를 다시 정규화 (재렌더링/재시도처럼 모두 캐시 적중)
+
+대사는 골든 코퍼스 입력, 숫자/약어가 섞인 합성 대사, 숫자/영문이 없는 대사를 섞어 만듭니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_normalizer --lines 100,1000,10000 --output normalizer.json
+    python -m benchmarks.bench_normalizer --check
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from benchmarks.common import add_common_arguments, int_list, write_report
+from src.tts import normalizer
+
+GOLDEN_PATH = Path(__file__).with_name("normalizer_golden.tsv")
+TEMPLATES = (
+    "오늘은 {n}명의 청취자가 보내준 사연을 {k}개 골랐어요.",
+    "{year}년 {m}월 {d}일에 {acronym}가 발표한 자료를 보면 {p}%가 늘었대요.",
+    "하루 {n}km씩 {k}시간 동안 걸었더니 {w}kg이 빠졌다고요?",
+    "가격이 ${price}로 올랐는데, 그래도 {acronym} 시장은 계속 커지고 있어요.",
+    "{k}번째 질문은 {h}:{mm}에 들어왔어요. 진짜 대박이죠!",
+    # 숫자/영문이 없는 대사 (실제 대본의 대부분)
+    "오늘 이야기는 정말 흥미로운데요, 조금 더 자세히 들여다보면 재미있는 사실이 많아요.",
+    "맞아요, 저도 준비하면서 새롭게 알게 된 게 많더라고요. 그럼 본론으로 들어가 볼까요?"
+)
+ACRONYMS = ("AI", "GPU", "CEO", "NASA", "GPT-4", "IT")
+
+
+def legacy_preprocess(text: str) -> str:
+    """정규화기 도입 전의 TTSEngine._preprocess_korean_text"""
+    import re
+
+    text = re.sub(r'([\가-\힣])([A-Za-z])', r'\1 \2', text)
+    text = re.sub(r'([A-Za-z])([\가-\힣])', r'\1 \2', text)
+    text = re.sub(r'([,.])([^\s])', r'\1 \2', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def load_golden(path: Path = GOLDEN_PATH) -> List[Tuple[str, str]]:
+    cases = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        source, expected = line.split("\t")
+        cases.append((source, expected))
+    return cases
+
+
+def check_golden(cases: List[Tuple[str, str]]) -> List[Tuple[str, str, str]]:
+    """골든 코퍼스와 다른 결과 [(입력, 기대, 실제), ...] (대사별 처리와 배치 처리 모두 검사)"""
+    failures = []
+    batch = normalizer.TextNormalizer().normalize_batch(source for source, _ in cases)
+    for (source, expected), batched in zip(cases, batch):
+        actual = normalizer.apply_rules(source)
+        if actual != expected:
+            failures.append((source, expected, actual))
+        elif batched != expected:
+            failures.append((source, expected, f"(batch) {batched}"))
+    return failures
+
+
+def make_lines(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    golden = [source for source, _ in load_golden()]
+    lines = []
+    for i in range(count):
+        if i % 4 == 0:
+            lines.append(golden[i // 4 % len(golden)])
+            continue
+        lines.append(rng.choice(TEMPLATES).format(
+            n=rng.randint(1, 99), k=rng.randint(1, 30), w=rng.randint(1, 20), p=rng.randint(1, 100),
+            year=rng.randint(1990, 2030), m=rng.randint(1, 12), d=rng.randint(1, 28),
+            h=rng.randint(0, 23), mm=f"{rng.randint(0, 59):02d}", price=f"{rng.randint(1, 99999):,}",
+            acronym=rng.choice(ACRONYMS)
+        ))
+    return lines
+
+
+def median_wall(run: Callable[[], object], repeat: int) -> float:
+    walls = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        walls.append(time.perf_counter() - started)
+    return statistics.median(walls)
+
+
+def run_case(count: int, repeat: int) -> dict:
+    lines = make_lines(count)
+    chars = sum(len(line) for line in lines)
+
+    def batch():
+        normalizer.TextNormalizer(cache_size=count).normalize_batch(lines)
+
+    warm = normalizer.TextNormalizer(cache_size=count)
+    warm.normalize_batch(lines)
+
+    walls = {
+        "legacy": median_wall(lambda: [legacy_preprocess(line) for line in lines], repeat),
+        "rules": median_wall(lambda: [normalizer.apply_rules(line) for line in lines], repeat),
+        "batch": median_wall(batch, repeat),
+        "cached": median_wall(lambda: [warm.normalize(line) for line in lines], repeat)
+    }
+    row = {"lines": count, "chars": chars}
+    for name, wall in walls.items():
+        row[f"{name}_us_per_line"] = round(wall / count * 1e6, 2)
+        row[f"{name}_lines_per_second"] = round(count / wall)
+    return row
+
+
+def print_results(results: List[dict]):
+    names = ("legacy", "rules", "batch", "cached")
+    print(f"{'lines':>7} " + " ".join(f"{name + '(us)':>12}" for name in names) + f" {'batch(lines/s)':>15}")
+    for row in results:
+        print(
+            f"{row['lines']:>7} " + " ".join(f"{row[name + '_us_per_line']:>12}" for name in names)
+            + f" {row['batch_lines_per_second']:>15}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TTS 텍스트 정규화 벤치마크")
+    parser.add_argument("--lines", type=int_list, default=[100, 1000, 10000], help="대사 수 목록")
+    parser.add_argument("--check", action="store_true", help="골든 코퍼스 검사만 실행")
+    add_common_arguments(parser, repeat=5, fixtures=False)
+    args = parser.parse_args()
+
+    cases = load_golden()
+    failures = check_golden(cases)
+    for source, expected, actual in failures:
+        print(f"불일치: {source!r}\n  기대: {expected!r}\n  실제: {actual!r}", file=sys.stderr)
+    print(f"골든 코퍼스: {len(cases) - len(failures)}/{len(cases)} 일치", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+    if args.check:
+        return
+
+    results = []
+    for count in args.lines:
+        print(f"측정: 대사 {count}개", file=sys.stderr)
+        results.append(run_case(count, args.repeat))
+    print_results(results)
+
+    if args.output:
+        report = {"repeat": args.repeat, "golden_cases": len(cases), "results": results}
+        write_report(args.output, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+렌디션 인코딩 벤치마크
+
+후처리(enhance)에서 최종 MP3와 함께 Opus/AAC/HLS 렌디션을 같은 PCM으로부터 인코딩할 때의 비용을 측정합니다.
+렌디션마다 하나씩 추가한 경우와 모두 함께 인코딩한 경우를 MP3만 만드는 경우와 비교합니다.
+측정 항목:
+    - wall_seconds: 후처리 전체 실행 시간 (반복 중 중앙값)
+    - encode_seconds: 그중 인코더에 PCM을 넘기고 끝날 때까지 기다린 시간
+    - cpu_<이름>: 인코더 프로세스별 CPU 시간 (병렬로 돌기 때문에 합이 wall보다 클 수 있음)
+    - kb_<이름> / kbps_<이름>: 출력 크기와 실제 비트레이트 (hls는 세그먼트 합계)
+
+bench_audio.py와 같은 합성 에피소드 fixture를 사용합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_renditions --minutes 1,5,15 --output renditions.json
+    python -m benchmarks.bench_renditions --quick --mode streaming
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from pydub import AudioSegment
+
+from benchmarks.bench_audio import prepare_episode
+from benchmarks.common import add_common_arguments, int_list, use_fake_api_keys, write_report
+
+# 비교할 렌디션 조합 (빈 조합은 MP3만)
+COMBINATIONS = [(), ("opus",), ("aac",), ("hls",), ("opus", "aac", "hls")]
+
+
+def _size_bytes(path: Path) -> int:
+    if path.is_dir():
+        return sum(child.stat().st_size for child in path.iterdir())
+    return path.stat().st_size
+
+
+def run_case(fixtures: Path, minutes: int, combination: tuple, repeat: int, mode: str) -> dict:
+    from src.tts import audio_ops
+
+    episode = str(prepare_episode(fixtures, minutes))
+    audio_seconds = AudioSegment.from_mp3(episode).duration_seconds
+    output_dir = fixtures / "_out" / f"renditions_{os.getpid()}"
+
+    walls, runs = [], []
+    for _ in range(repeat):
+        shutil.rmtree(output_dir, ignore_errors=True)
+        output_dir.mkdir(parents=True)
+        renditions = {name: str(output_dir / audio_ops.RENDITIONS[name]) for name in combination}
+        started = time.perf_counter()
+        timings = audio_ops.OPERATIONS[mode]["enhance"](
+            episode, str(output_dir / "podcast.mp3"), renditions=renditions or None
+        )
+        walls.append(time.perf_counter() - started)
+        runs.append(timings)
+
+    row = {
+        "minutes": minutes,
+        "renditions": "+".join(combination) or "mp3",
+        "wall_seconds": round(statistics.median(walls), 3),
+        "encode_seconds": round(statistics.median(run["encode"] for run in runs), 3),
+    }
+    for name in ("mp3", *combination):
+        if f"encode_{name}" in runs[0]:
+            row[f"cpu_{name}"] = round(statistics.median(run[f"encode_{name}"] for run in runs), 3)
+        size = _size_bytes(output_dir / ("podcast.mp3" if name == "mp3" else audio_ops.RENDITIONS[name]))
+        row[f"kb_{name}"] = round(size / 1024, 1)
+        row[f"kbps_{name}"] = round(size * 8 / 1000 / audio_seconds, 1)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    return row
+
+
+def print_results(results: List[dict]):
+    print(f"{'min':>4} {'renditions':<16} {'wall(s)':>8} {'encode(s)':>10}  encoder cpu(s) / kbps")
+    for row in results:
+        encoders = "  ".join(
+            f"{key[4:]} {row[key]}/{row['kbps_' + key[4:]]}" for key in row if key.startswith("cpu_")
+        ) or f"mp3 -/{row['kbps_mp3']}"
+        print(f"{row['minutes']:>4} {row['renditions']:<16} {row['wall_seconds']:>8} {row['encode_seconds']:>10}  {encoders}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="렌디션 인코딩 벤치마크")
+    parser.add_argument("--minutes", type=int_list, default=[1, 5, 15], help="에피소드 길이(분) 목록")
+    parser.add_argument("--mode", choices=["pydub", "streaming"], default="streaming", help="오디오 렌더링 방식")
+    parser.add_argument("--quick", action="store_true", help="1분 에피소드, 1회 반복만 측정")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    if args.quick:
+        args.minutes, args.repeat = [1], 1
+
+    use_fake_api_keys()
+    fixtures = Path(args.fixtures).resolve()
+
+    results: List[Dict] = []
+    for minutes in args.minutes:
+        for combination in COMBINATIONS:
+            print(f"측정: {minutes}분 {'+'.join(combination) or 'mp3'}", file=sys.stderr)
+            results.append(run_case(fixtures, minutes, combination, args.repeat, args.mode))
+    print_results(results)
+
+    if args.output:
+        report = {"repeat": args.repeat, "mode": args.mode, "cpu_count": os.cpu_count(), "results": results}
+        write_report(args.output, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+기록된 LLM/TTS 호출(cassette)을 재생하여 실제 작업을 다시 실행하는 벤치마크
+
+운영 서버를 CASSETTE_MODE=record로 실행해 두면 OpenAI/ElevenLabs 호출이 CASSETTE_DIR에 기록되고,
+작업 파라미터는 output/<id>/job.json에 남습니다. 이 스크립트는 그 job.json들을 같은 파라미터로
+네트워크 없이 다시 실행하여 단계별 시간을 측정합니다.
+--latency-scale 1이면 기록된 API 지연 시간을 그대로 재현하고, 0이면 로컬 처리 시간만 측정합니다.
+
+URL 작업은 웹 페이지 파싱이 네트워크를 사용하므로 건너뜁니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_replay --cassette cassettes --jobs-from output --latency-scale 1 --output replay.json
+    python -m benchmarks.bench_replay --cassette cassettes --jobs-from output --baseline replay.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.bench_e2e import percentile
+from benchmarks.common import use_fake_api_keys, write_report
+
+
+async def replay_jobs(job_dirs: List[Path], concurrency: int) -> List[dict]:
+    from src.podcast.generator import PodcastGenerator
+
+    generator = PodcastGenerator()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(job_dir: Path) -> dict:
+        job = generator._load_job(job_dir)
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await generator._run_pipeline(str(uuid.uuid4()), **job)
+            except Exception as e:
+                return {"source": job_dir.name, "error": str(e)}
+            return {
+                "source": job_dir.name,
+                "content_type": job.get("content_type"),
+                "turns": job.get("turns"),
+                "wall_seconds": round(time.perf_counter() - started, 3),
+                "stage_timings": {name: round(seconds, 3) for name, seconds in result["stage_timings"].items()}
+            }
+
+    return await asyncio.gather(*(one(job_dir) for job_dir in job_dirs))
+
+
+def summarize(jobs: List[dict]) -> dict:
+    completed = [job for job in jobs if "error" not in job]
+    walls = [job["wall_seconds"] for job in completed]
+    stages: Dict[str, List[float]] = {}
+    for job in completed:
+        for name, seconds in job["stage_timings"].items():
+            stages.setdefault(name, []).append(seconds)
+    return {
+        "jobs": len(jobs),
+        "errors": len(jobs) - len(completed),
+        "latency_p50_seconds": round(percentile(walls, 50), 3),
+        "latency_p99_seconds": round(percentile(walls, 99), 3),
+        "stages_mean_seconds": {name: round(statistics.mean(values), 3) for name, values in stages.items()}
+    }
+
+
+def print_summary(summary: dict, baseline: dict = None):
+    print(f"작업 {summary['jobs']}개, 실패 {summary['errors']}개")
+    rows = [("p50", summary["latency_p50_seconds"], (baseline or {}).get("latency_p50_seconds")),
+            ("p99", summary["latency_p99_seconds"], (baseline or {}).get("latency_p99_seconds"))]
+    for name, seconds in summary["stages_mean_seconds"].items():
+        rows.append((name, seconds, (baseline or {}).get("stages_mean_seconds", {}).get(name)))
+
+    for name, seconds, previous in rows:
+        change = f"  ({(seconds / previous - 1) * 100:+.1f}%)" if previous else ""
+        print(f"  {name:>10}: {seconds:>8.3f}s{change}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 LLM/TTS 호출을 재생하여 작업 재실행")
+    parser.add_argument("--cassette", required=True, help="CASSETTE_DIR로 기록한 디렉토리")
+    parser.add_argument("--jobs-from", default="output", help="job.json이 있는 작업 디렉토리들의 상위 디렉토리")
+    parser.add_argument("--latency-scale", type=float, default=0.0, help="기록된 API 지연 재현 배율 (1: 실제 시간)")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--limit", type=int, help="재실행할 최대 작업 수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    job_dirs = []
+    for job_file in sorted(Path(args.jobs_from).resolve().glob("*/job.json")):
+        job = json.loads(job_file.read_text(encoding="utf-8"))
+        if job.get("content_type") == "url":
+            print(f"URL 작업 건너뜀: {job_file.parent.name}", file=sys.stderr)
+            continue
+        job_dirs.append(job_file.parent)
+    job_dirs = job_dirs[:args.limit] if args.limit else job_dirs
+    if not job_dirs:
+        parser.error(f"{args.jobs_from}에서 재실행할 작업(job.json)을 찾지 못했습니다.")
+
+    # src 모듈이 설정을 읽기 전에 재생 모드 지정
+    os.environ["CASSETTE_MODE"] = "replay"
+    os.environ["CASSETTE_DIR"] = str(Path(args.cassette).resolve())
+    os.environ["CASSETTE_LATENCY_SCALE"] = str(args.latency_scale)
+    use_fake_api_keys("replay")
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+    from loguru import logger
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    output_path = Path(args.output).resolve() if args.output else None
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["summary"]
+
+    workdir = Path(tempfile.mkdtemp(prefix="podcast-replay-"))
+    (workdir / "output").mkdir()
+    os.chdir(workdir)
+
+    jobs = asyncio.run(replay_jobs(job_dirs, args.concurrency))
+    for job in jobs:
+        if "error" in job:
+            print(f"재실행 실패 {job['source']}: {job['error']}", file=sys.stderr)
+
+    summary = summarize(jobs)
+    print_summary(summary, baseline)
+
+    if output_path:
+        report = {
+            "cassette": os.environ["CASSETTE_DIR"],
+            "latency_scale": args.latency_scale,
+            "concurrency": args.concurrency,
+            "summary": summary,
+            "jobs": jobs
+        }
+        write_report(output_path, report)
+
+
+if __name__ == "__main__":
+    main()
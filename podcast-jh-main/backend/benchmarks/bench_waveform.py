@@ -0,0 +1,117 @@
+"""
+파형 피크 벤치마크
+
+후처리에서 최종 PCM과 함께 계산하는 파형 피크(waveform.PeakAccumulator)의 비용을 측정합니다.
+측정 항목:
+    - realtime_x: 디코딩된 PCM을 1초 블록으로 넣었을 때 피크 계산만의 속도 (오디오 길이 / 실행 시간)
+    - enhance_seconds / enhance_peaks_seconds: 피크 없이/함께 후처리한 전체 시간 (반복 중 중앙값)
+    - peaks_seconds: 후처리 중 피크 계산과 저장에 쓴 시간 ("peaks" 구간)
+    - peaks_kb / mp3_kb: peaks.json과 최종 MP3 크기
+
+bench_audio.py와 같은 합성 에피소드 fixture를 사용합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_waveform --minutes 1,5,15 --output waveform.json
+    python -m benchmarks.bench_waveform --quick --mode pydub
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from pydub import AudioSegment
+
+from benchmarks.bench_audio import prepare_episode
+from benchmarks.common import add_common_arguments, int_list, use_fake_api_keys, write_report
+
+
+def run_case(fixtures: Path, minutes: int, repeat: int, mode: str) -> dict:
+    from src.tts import audio_ops, waveform
+
+    episode = str(prepare_episode(fixtures, minutes))
+    segment = AudioSegment.from_mp3(episode)
+    data = segment.raw_data
+    block_bytes = segment.frame_rate * segment.channels * segment.sample_width
+
+    def accumulate():
+        peaks = waveform.PeakAccumulator(segment.frame_rate, segment.channels)
+        for offset in range(0, len(data), block_bytes):
+            peaks.add(data[offset:offset + block_bytes])
+        return peaks.result()
+
+    accumulate_walls = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        accumulate()
+        accumulate_walls.append(time.perf_counter() - started)
+
+    output_dir = fixtures / "_out"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"waveform_{os.getpid()}.mp3"
+    peaks_path = output_dir / f"waveform_{os.getpid()}.json"
+    enhance = audio_ops.OPERATIONS[mode]["enhance"]
+
+    plain_walls, peaks_walls, peaks_timings = [], [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        enhance(episode, str(output_path))
+        plain_walls.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        timings = enhance(episode, str(output_path), peaks_path=str(peaks_path))
+        peaks_walls.append(time.perf_counter() - started)
+        peaks_timings.append(timings["peaks"])
+
+    row = {
+        "minutes": minutes,
+        "realtime_x": round(segment.duration_seconds / statistics.median(accumulate_walls), 1),
+        "enhance_seconds": round(statistics.median(plain_walls), 3),
+        "enhance_peaks_seconds": round(statistics.median(peaks_walls), 3),
+        "peaks_seconds": round(statistics.median(peaks_timings), 4),
+        "peaks_kb": round(peaks_path.stat().st_size / 1024, 1),
+        "mp3_kb": round(output_path.stat().st_size / 1024, 1)
+    }
+    output_path.unlink()
+    peaks_path.unlink()
+    return row
+
+
+def print_results(results: List[dict]):
+    print(f"{'min':>4} {'peaks(x)':>10} {'enhance(s)':>11} {'+peaks(s)':>10} {'peaks(s)':>9} {'peaks(KB)':>10} {'mp3(KB)':>9}")
+    for row in results:
+        print(
+            f"{row['minutes']:>4} {row['realtime_x']:>10} {row['enhance_seconds']:>11} {row['enhance_peaks_seconds']:>10} "
+            f"{row['peaks_seconds']:>9} {row['peaks_kb']:>10} {row['mp3_kb']:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파형 피크 벤치마크")
+    parser.add_argument("--minutes", type=int_list, default=[1, 5, 15], help="에피소드 길이(분) 목록")
+    parser.add_argument("--mode", choices=["pydub", "streaming"], default="streaming", help="오디오 렌더링 방식")
+    parser.add_argument("--quick", action="store_true", help="1분 에피소드, 1회 반복만 측정")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    if args.quick:
+        args.minutes, args.repeat = [1], 1
+
+    use_fake_api_keys()
+    fixtures = Path(args.fixtures).resolve()
+
+    results = []
+    for minutes in args.minutes:
+        print(f"측정: {minutes}분", file=sys.stderr)
+        results.append(run_case(fixtures, minutes, args.repeat, args.mode))
+    print_results(results)
+
+    if args.output:
+        report = {"repeat": args.repeat, "mode": args.mode, "results": results}
+        write_report(args.output, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+벤치마크 스크립트 공통 CLI 도우미
+
+벤치마크마다 반복되던 인자(--repeat, --fixtures, --output), 쉼표 구분 정수 목록 파싱,
+설정 로딩용 가짜 API 키, 결과 JSON 저장을 한곳에 둡니다.
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+def int_list(value: str) -> List[int]:
+    """쉼표로 구분한 정수 목록 인자 ("1,5,15" → [1, 5, 15])"""
+    return [int(x) for x in value.split(",")]
+
+
+def add_common_arguments(parser: argparse.ArgumentParser, repeat: int = 3, fixtures: bool = True):
+    """--repeat, --output 인자 추가 (합성 오디오를 쓰는 벤치마크는 --fixtures도)
+
+    Args:
+        parser: 벤치마크 인자 파서
+        repeat: --repeat 기본값
+        fixtures: 합성 오디오 캐시 디렉토리(--fixtures) 인자 추가 여부
+    """
+    parser.add_argument("--repeat", type=int, default=repeat)
+    if fixtures:
+        parser.add_argument("--fixtures", default=".bench_fixtures", help="합성 오디오 캐시 디렉토리")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+
+
+def use_fake_api_keys(value: str = "fake-key"):
+    """src 설정이 요구하는 API 키를 가짜 값으로 채움 (환경 변수에 실제 키가 있으면 그대로 둠)"""
+    os.environ.setdefault("OPENAI_API_KEY", value)
+    os.environ.setdefault("ELEVENLABS_API_KEY", value)
+
+
+def write_report(path: Optional[Union[str, Path]], report: dict):
+    """결과를 JSON 파일로 저장 (path가 없으면 저장하지 않음)"""
+    if not path:
+        return
+    Path(path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"결과 저장: {path}")
@@ -0,0 +1,308 @@
+"""
+OpenAI Chat API / ElevenLabs TTS API 로컬 대역(stand-in) 서버
+
+유료 API 없이 성능 실험을 하기 위한 가짜 서버입니다. 실제 API와 같은 경로/응답 형식을 제공하므로
+OPENAI_BASE_URL=http://127.0.0.1:<port>/v1, ELEVENLABS_BASE_URL=http://127.0.0.1:<port>로
+지정하면 OpenAIClient와 TTSEngine이 코드 수정 없이 이 서버를 사용합니다.
+
+- 지연 시간: 로그정규 분포 (중앙값, p99 지정), TTS는 문자 수에 비례하는 지연 추가 가능
+- 오류율: 지정한 확률로 429/500 응답
+- 오디오 길이: 텍스트 길이 / 발화 속도(문자/초)만큼의 음성 유사 MP3
+
+단독 실행:
+    python -m benchmarks.fake_services --port 9100 --llm-median-ms 800 --tts-median-ms 400
+"""
+import argparse
+import asyncio
+import io
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from benchmarks.synthetic import speech_like_segment
+
+
+class LatencyModel:
+    """로그정규 분포 지연 시간 모델
+
+    Args:
+        median_ms: 지연 시간 중앙값 (밀리초)
+        p99_ms: 지연 시간 99 백분위수 (밀리초, median_ms 이상)
+        per_char_ms: 입력 문자당 추가 지연 (밀리초)
+    """
+
+    def __init__(self, median_ms: float, p99_ms: Optional[float] = None, per_char_ms: float = 0.0):
+        self.median_ms = median_ms
+        self.p99_ms = max(p99_ms or median_ms * 3, median_ms)
+        self.per_char_ms = per_char_ms
+        # p99 = median * exp(2.326 * sigma)
+        self.sigma = math.log(self.p99_ms / median_ms) / 2.326 if median_ms > 0 else 0.0
+
+    def sample(self, rng: random.Random, chars: int = 0) -> float:
+        """지연 시간 샘플 (초)"""
+        if self.median_ms <= 0:
+            base = 0.0
+        else:
+            base = rng.lognormvariate(math.log(self.median_ms), self.sigma)
+        return (base + chars * self.per_char_ms) / 1000
+
+
+class FakeServiceConfig:
+    """대역 서버 설정
+
+    Args:
+        llm_latency: LLM 응답 지연 모델
+        tts_latency: TTS 응답 지연 모델
+        llm_error_rate: LLM 요청 실패 확률 (0~1)
+        tts_error_rate: TTS 요청 실패 확률 (0~1)
+        chars_per_second: 합성 음성의 발화 속도 (문자/초, 오디오 길이 결정)
+        line_chars: 가짜 스크립트의 대사당 문자 수
+        script_shortfall: 첫 스크립트 응답에서 빠뜨릴 턴 비율 (0~1, 잘린 응답/복구 요청 실험용)
+        seed: 난수 시드 (재현성)
+    """
+
+    def __init__(
+        self,
+        llm_latency: Optional[LatencyModel] = None,
+        tts_latency: Optional[LatencyModel] = None,
+        llm_error_rate: float = 0.0,
+        tts_error_rate: float = 0.0,
+        chars_per_second: float = 12.0,
+        line_chars: int = 60,
+        script_shortfall: float = 0.0,
+        seed: int = 0
+    ):
+        self.llm_latency = llm_latency or LatencyModel(800, 3000)
+        self.tts_latency = tts_latency or LatencyModel(300, 1200, per_char_ms=2)
+        self.llm_error_rate = llm_error_rate
+        self.tts_error_rate = tts_error_rate
+        self.chars_per_second = chars_per_second
+        self.line_chars = line_chars
+        self.script_shortfall = script_shortfall
+        self.seed = seed
+
+
+TURNS_PATTERN = re.compile(r"(?:총 대화 턴 수|Total Dialogue Turns):\s*(\d+)")
+THREE_SPEAKERS_PATTERN = re.compile(r'"B",? (?:또는|or) "C"')
+CONTINUATION_PATTERN = re.compile(r"나머지 대사 (\d+)개|remaining (\d+) lines")
+FILLER_KO = "오늘 이야기는 정말 흥미로운데요, 조금 더 자세히 들여다보면 재미있는 사실이 많아요."
+FILLER_EN = "That is a really interesting point, and there is a lot more to unpack if we look closer."
+
+
+class FakeServices:
+    """대역 서버 상태 (요청/오류 통계, 인코딩된 오디오 캐시)"""
+
+    def __init__(self, config: FakeServiceConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.stats: Dict[str, int] = {
+            "llm_requests": 0, "llm_errors": 0,
+            "tts_requests": 0, "tts_errors": 0, "tts_characters": 0
+        }
+        self._audio_cache: Dict[int, bytes] = {}
+        self._audio_lock = threading.Lock()
+
+    def _fake_line(self, index: int, language: str) -> str:
+        filler = FILLER_KO if language == "ko" else FILLER_EN
+        repeated = (filler + " ") * (self.config.line_chars // len(filler) + 1)
+        return f"{index + 1}번째 이야기예요. " + repeated[:self.config.line_chars].strip()
+
+    def chat_content(self, body: dict) -> str:
+        """요청 프롬프트를 보고 호출 종류(스크립트/제목/핵심 내용)에 맞는 응답 생성"""
+        messages = body.get("messages", [])
+        system = "\n".join(str(m.get("content", "")) for m in messages if m.get("role") == "system")
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+
+        if "제목" in system:
+            return "가짜 팟캐스트 제목: 벤치마크 에피소드"
+        if "추출" in system:
+            return "핵심 내용 요약\n" + "\n".join(f"- 핵심 항목 {i + 1}" for i in range(10))
+
+        match = TURNS_PATTERN.search(prompt)
+        turns = int(match.group(1)) if match else 8
+        # 화자 수는 구조화 출력 스키마의 speaker enum에서, 없으면 지시문에서
+        schema = body.get("response_format", {}).get("json_schema", {}).get("schema", {})
+        speakers = schema.get("properties", {}).get("dialogues", {}).get("items", {}).get("properties", {}).get("speaker", {})
+        num_speakers = len(speakers.get("enum", [])) or (3 if THREE_SPEAKERS_PATTERN.search(prompt) else 2)
+        language = "en" if "Total Dialogue Turns" in prompt else "ko"
+
+        # 복구 요청: 앞 대본(assistant 메시지)에 이어 요청한 개수만큼
+        start = 0
+        continuation = CONTINUATION_PATTERN.search(str(messages[-1].get("content", ""))) if messages else None
+        if continuation:
+            start = sum(str(m.get("content", "")).count('"speaker"') for m in messages if m.get("role") == "assistant")
+            count = int(continuation.group(1) or continuation.group(2))
+        else:
+            count = turns - int(turns * self.config.script_shortfall)
+
+        dialogues = [("ABC"[i % num_speakers], self._fake_line(i, language)) for i in range(start, start + count)]
+        if body.get("response_format", {}).get("type") == "json_schema":
+            return json.dumps(
+                {"dialogues": [{"speaker": letter, "text": text} for letter, text in dialogues]},
+                ensure_ascii=False
+            )
+        prefix = "화자" if language == "ko" else "Speaker "
+        return "\n".join(f"{prefix}{letter}: {text}" for letter, text in dialogues)
+
+    def audio_for(self, text: str) -> bytes:
+        """텍스트 길이에 맞는 음성 유사 MP3 (250ms 단위로 캐시)"""
+        duration_ms = max(250, int(len(text) / self.config.chars_per_second * 1000))
+        bucket = (duration_ms // 250) * 250
+
+        with self._audio_lock:
+            cached = self._audio_cache.get(bucket)
+        if cached is not None:
+            return cached
+
+        buffer = io.BytesIO()
+        speech_like_segment(bucket, seed=bucket).export(buffer, format="mp3", bitrate="128k")
+        data = buffer.getvalue()
+        with self._audio_lock:
+            self._audio_cache[bucket] = data
+        return data
+
+
+def create_fake_app(config: Optional[FakeServiceConfig] = None) -> FastAPI:
+    """OpenAI /v1/chat/completions와 ElevenLabs /v1/text-to-speech/{voice_id}를 흉내 내는 앱 생성"""
+    services = FakeServices(config or FakeServiceConfig())
+    app = FastAPI(title="Fake OpenAI / ElevenLabs")
+    app.state.services = services
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        services.stats["llm_requests"] += 1
+        await asyncio.sleep(services.config.llm_latency.sample(services.rng))
+
+        if services.rng.random() < services.config.llm_error_rate:
+            services.stats["llm_errors"] += 1
+            status = services.rng.choice([429, 500])
+            return JSONResponse(status_code=status, content={"error": {"message": "fake error", "type": "server_error"}})
+
+        content = services.chat_content(body)
+        prompt_chars = sum(len(str(m.get("content", ""))) for m in body.get("messages", []))
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_chars // 2,
+                "completion_tokens": len(content) // 2,
+                "total_tokens": (prompt_chars + len(content)) // 2,
+                "prompt_tokens_details": {"cached_tokens": 0}
+            }
+        }
+
+    @app.post("/v1/text-to-speech/{voice_id}")
+    async def text_to_speech(voice_id: str, request: Request):
+        body = await request.json()
+        text = body.get("text", "")
+        services.stats["tts_requests"] += 1
+        await asyncio.sleep(services.config.tts_latency.sample(services.rng, chars=len(text)))
+
+        if services.rng.random() < services.config.tts_error_rate:
+            services.stats["tts_errors"] += 1
+            status = services.rng.choice([429, 500])
+            return JSONResponse(status_code=status, content={"detail": {"status": "fake_error", "message": "fake error"}})
+
+        services.stats["tts_characters"] += len(text)
+        audio = await asyncio.to_thread(services.audio_for, text)
+        return Response(content=audio, media_type="audio/mpeg")
+
+    @app.get("/stats")
+    async def stats():
+        return services.stats
+
+    return app
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """대역 서버 설정용 CLI 인자 추가 (다른 벤치마크 스크립트에서 재사용)"""
+    parser.add_argument("--llm-median-ms", type=float, default=800)
+    parser.add_argument("--llm-p99-ms", type=float, default=3000)
+    parser.add_argument("--tts-median-ms", type=float, default=300)
+    parser.add_argument("--tts-p99-ms", type=float, default=1200)
+    parser.add_argument("--tts-per-char-ms", type=float, default=2.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--tts-error-rate", type=float, default=0.0)
+    parser.add_argument("--chars-per-second", type=float, default=12.0)
+    parser.add_argument("--line-chars", type=int, default=60)
+    parser.add_argument("--script-shortfall", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeServiceConfig:
+    return FakeServiceConfig(
+        llm_latency=LatencyModel(args.llm_median_ms, args.llm_p99_ms),
+        tts_latency=LatencyModel(args.tts_median_ms, args.tts_p99_ms, per_char_ms=args.tts_per_char_ms),
+        llm_error_rate=args.llm_error_rate,
+        tts_error_rate=args.tts_error_rate,
+        chars_per_second=args.chars_per_second,
+        line_chars=args.line_chars,
+        script_shortfall=args.script_shortfall,
+        seed=args.seed
+    )
+
+
+class UvicornThread:
+    """ASGI 앱을 별도 스레드의 uvicorn으로 실행 (벤치마크 프로세스 안에서 대역 서버/API 서버로 사용)"""
+
+    def __init__(self, app, host: str = "127.0.0.1", port: int = 0):
+        import uvicorn
+
+        self.app = app
+        self.server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.host = host
+
+    @property
+    def port(self) -> int:
+        return self.server.servers[0].sockets[0].getsockname()[1]
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "UvicornThread":
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise RuntimeError("uvicorn 서버 시작 실패")
+            time.sleep(0.01)
+        return self
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenAI / ElevenLabs 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    print(f"OPENAI_BASE_URL=http://{args.host}:{args.port}/v1")
+    print(f"ELEVENLABS_BASE_URL=http://{args.host}:{args.port}")
+    uvicorn.run(create_fake_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+벤치마크용 합성 음성 유사 오디오 생성 모듈
+
+실제 TTS 출력과 비슷한 특성(음절 단위 진폭 포락선, 기본 주파수 + 포먼트 성분, 문장 사이 쉼)을 가진
+신호를 NumPy로 만들어 pydub AudioSegment로 반환합니다. 같은 seed는 항상 같은 신호를 만듭니다.
+"""
+import numpy as np
+from pydub import AudioSegment
+
+
+def speech_like_samples(
+    duration_ms: int,
+    seed: int = 0,
+    frame_rate: int = 44100,
+    base_pitch: float = 180.0
+) -> np.ndarray:
+    """음성과 비슷한 int16 모노 샘플 배열 생성
+
+    Args:
+        duration_ms: 길이 (밀리초)
+        seed: 난수 시드
+        frame_rate: 샘플링 레이트
+        base_pitch: 기본 주파수 (Hz, 화자 구분용)
+    """
+    rng = np.random.default_rng(seed)
+    n = int(frame_rate * duration_ms / 1000)
+    t = np.arange(n, dtype=np.float32) / frame_rate
+
+    # 약간 흔들리는 기본 주파수와 두 개의 포먼트 대역
+    pitch = base_pitch * (1 + 0.05 * np.sin(2 * np.pi * 0.7 * t + rng.uniform(0, np.pi)))
+    phase = 2 * np.pi * np.cumsum(pitch) / frame_rate
+    voiced = np.sin(phase) + 0.5 * np.sin(2 * phase) + 0.25 * np.sin(3 * phase)
+    formants = 0.3 * np.sin(2 * np.pi * 700 * t) + 0.2 * np.sin(2 * np.pi * 1200 * t)
+    noise = rng.standard_normal(n).astype(np.float32) * 0.05
+
+    # 초당 약 4~6 음절의 진폭 포락선과 가끔 들어가는 쉼
+    syllable_rate = rng.uniform(4, 6)
+    envelope = np.clip(np.sin(np.pi * syllable_rate * t) ** 2, 0, 1)
+    pauses = (np.sin(2 * np.pi * 0.25 * t + rng.uniform(0, np.pi)) > -0.85).astype(np.float32)
+
+    signal = (voiced * (1 + formants) + noise) * envelope * pauses
+    peak = np.max(np.abs(signal)) or 1.0
+    level = rng.uniform(0.3, 0.7)  # 대사마다 다른 음량
+    return (signal / peak * level * 32767).astype(np.int16)
+
+
+def speech_like_segment(
+    duration_ms: int,
+    seed: int = 0,
+    frame_rate: int = 44100,
+    base_pitch: float = 180.0
+) -> AudioSegment:
+    """음성과 비슷한 AudioSegment 생성 (16bit 모노)"""
+    samples = speech_like_samples(duration_ms, seed, frame_rate, base_pitch)
+    return AudioSegment(
+        samples.tobytes(),
+        frame_rate=frame_rate,
+        sample_width=2,
+        channels=1
+    )
@@ -1,20 +1,63 @@
+import time
+
+# 모듈 임포트(FastAPI, pydub, openai, elevenlabs 등)에 걸린 시간 측정 시작
+IMPORT_STARTED = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
 import sys
+from loguru import logger
 
-from src.routes import podcast_router, voices_router
-from src.utils.config import Settings
+from src.routes import podcast_router, voices_router, metrics_router, music_router
+from src.container import AppContainer
+from src.utils.config import get_settings
+from src.utils.metrics import STARTUP_SECONDS, monitor_event_loop_lag
 
 # Windows에서 ProactorEventLoop 관련 오류 방지
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED
+STARTUP_SECONDS.labels(phase="import").set(IMPORT_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    # 설정, LLM/TTS 클라이언트, 생성기를 한 번만 만들어 라우트가 의존성으로 공유 (src/routes/dependencies.py)
+    container = AppContainer()
+    app.state.container = container
+    # ffmpeg 확인, LLM/TTS 연결과 오디오 워커 프로세스 준비 (첫 요청 전에)
+    await container.warmup()
+    generator = container.generator
+
+    # 재시작 전에 중단된 작업을 마지막 체크포인트부터 재개
+    await generator.resume_interrupted_jobs()
+    lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+    # 공유 상태 백엔드에서는 다른 워커/노드가 남긴 작업도 임대 만료 후 회수
+    reclaimer = asyncio.create_task(generator.reclaim_interrupted_jobs())
+    # 보존 기간/용량 한도를 넘은 출력 디렉토리 정리 (설정하지 않으면 바로 종료)
+    garbage_collector = asyncio.create_task(generator.garbage_collector())
+    logger.info(
+        f"서버 시작 준비 완료: 임포트 {IMPORT_SECONDS:.2f}초, "
+        f"초기화+워밍업 {time.perf_counter() - started:.2f}초"
+    )
+    yield
+    lag_monitor.cancel()
+    reclaimer.cancel()
+    garbage_collector.cancel()
+    await container.shutdown()
+
+
 app = FastAPI(
     title="AI Podcast Generator",
     description="LLM과 TTS를 활용한 AI 팟캐스트 자동 생성 시스템",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -27,14 +70,18 @@ app.add_middleware(
     max_age=3600,  # CORS preflight 캐싱 시간
 )
 
-settings = Settings()
-
 # 라우터 등록
 app.include_router(podcast_router)
 app.include_router(voices_router)
+app.include_router(metrics_router)
+app.include_router(music_router)
+
+# 정적 파일 서빙 설정 (오디오 파일 다운로드용, 컨테이너와 같은 get_settings() 설정을 사용)
+# lifespan이 여러 번 실행되어도(테스트 등) 마운트가 중복되지 않도록 모듈 수준에서 한 번만 등록
+OUTPUT_DIRECTORY = get_settings().output_directory
+Path(OUTPUT_DIRECTORY).mkdir(parents=True, exist_ok=True)
+app.mount("/output", StaticFiles(directory=OUTPUT_DIRECTORY), name="output")
 
-# 정적 파일 서빙 설정 (오디오 파일 다운로드용)
-app.mount("/output", StaticFiles(directory="output"), name="output")
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,68 @@
+"""
+애플리케이션 수명 동안 공유하는 객체 (설정, LLM/TTS 클라이언트, 생성기)
+
+요청마다 Settings()/TTSEngine()을 만들면 설정을 다시 읽고 음성 목록과 HTTP 클라이언트(연결 풀)를 새로 만듭니다.
+서버 lifespan에서 AppContainer를 한 번 만들어 app.state.container에 두고, 라우트는 src/routes/dependencies.py의
+의존성으로 받습니다. 시작할 때 warmup()으로 ffmpeg를 확인하고 LLM/TTS 연결과 오디오 워커 프로세스를 미리 열어
+첫 요청이 연결/프로세스 시작 시간을 떠안지 않게 합니다.
+"""
+import asyncio
+import time
+from typing import Dict, Optional
+
+from loguru import logger
+
+from src.llm.openai_client import OpenAIClient
+from src.podcast.generator import PodcastGenerator
+from src.tts.engine import TTSEngine
+from src.utils.config import Settings, get_settings
+from src.utils.metrics import STARTUP_SECONDS
+
+
+class AppContainer:
+    """서버 하나(uvicorn 워커 하나)가 공유하는 객체 모음
+
+    Args:
+        settings: 설정 (None이면 get_settings())
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        started = time.perf_counter()
+        self.settings = settings or get_settings()
+        self.llm_client = OpenAIClient(self.settings)
+        self.tts_engine = TTSEngine(self.settings)
+        self.generator = PodcastGenerator(self.settings, self.llm_client, self.tts_engine)
+        # 단계별 시작 시간 (초)
+        self.startup_timings: Dict[str, float] = {"init": time.perf_counter() - started}
+        STARTUP_SECONDS.labels(phase="init").set(self.startup_timings["init"])
+
+    async def warmup(self) -> dict:
+        """ffmpeg 확인과 연결/워커 준비 (STARTUP_WARMUP=false면 ffmpeg 확인만)
+
+        Returns:
+            {"ffmpeg", "audio_workers", "elevenlabs", "llm_endpoints"}
+
+        Raises:
+            RuntimeError: ffmpeg를 사용할 수 없음
+        """
+        started = time.perf_counter()
+        connect = self.settings.startup_warmup
+        tts, llm_endpoints = await asyncio.gather(
+            self.tts_engine.warmup(connect=connect),
+            self.llm_client.warmup() if connect else asyncio.sleep(0, result=0)
+        )
+        self.startup_timings["warmup"] = time.perf_counter() - started
+        STARTUP_SECONDS.labels(phase="warmup").set(self.startup_timings["warmup"])
+
+        result = dict(tts, llm_endpoints=llm_endpoints)
+        logger.info(
+            f"워밍업 완료 ({self.startup_timings['warmup']:.2f}초): {result['ffmpeg']}, "
+            f"오디오 워커 {result['audio_workers']}개, ElevenLabs 연결 {'됨' if result['elevenlabs'] else '안 됨'}, "
+            f"LLM 엔드포인트 {llm_endpoints}개"
+        )
+        return result
+
+    async def shutdown(self):
+        # 아직 기록되지 않은 작업 상태를 상태 백엔드에 반영
+        await self.generator.status_store.flush()
+        self.tts_engine.audio_pool.shutdown()
@@ -1,201 +1,416 @@
-from openai import AsyncOpenAI
-from src.utils.config import Settings
-
-class OpenAIClient:
-    def __init__(self):
-        self.settings = Settings()
-        self.client = AsyncOpenAI(
-            api_key=self.settings.openai_api_key
-        )
-
-    async def generate_podcast_script(
-        self,
-        topic: str,
-        language: str = "ko",
-        num_speakers: int = 2,
-        turns: int = 8,
-        style: str = "casual"
-    ) -> str:
-
-        # 언어별, 스타일별 가이드라인
-        if language == "ko":
-            style_guidelines = {
-                "casual": """
+import asyncio
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from openai import APIStatusError, AsyncOpenAI
+from src.llm.routing import Endpoint, ModelRouter, api_key_for
+from src.llm.script_format import (
+    ScriptItem,
+    check_script,
+    continuation_request,
+    items_json,
+    missing_speakers,
+    parse_script_items,
+    render_script,
+    script_response_format,
+    strip_echo,
+    take_continuation,
+)
+from src.utils.cassette import Cassette
+from src.utils.config import Settings, get_settings
+from src.utils.metrics import (
+    LLM_CALL_ERRORS,
+    LLM_CALL_SECONDS,
+    LLM_FAILOVERS,
+    LLM_ROUTED_CALLS,
+    LLM_TOKENS,
+    SCRIPT_REPAIRS,
+)
+from src.utils.tracing import span
+
+# 프롬프트 배치: 호출마다 바뀌지 않는 지시문은 system 메시지(앞부분)에, 주제/턴 수/원문처럼 바뀌는 값은
+# 마지막 user 메시지에 둡니다. OpenAI는 요청 앞부분이 이전 요청과 바이트 단위로 같으면 그 구간을
+# 캐시에서 처리하므로(1024 토큰 이상), 변하는 값이 앞에 있으면 캐시를 전혀 쓸 수 없습니다.
+
+# 언어별, 스타일별 가이드라인
+STYLE_GUIDELINES = {
+    "ko": {
+        "casual": """
 스타일: 친근하고 편안한 대화
 - 친구들끼리 이야기하듯 자연스럽고 가벼운 톤
 - 농담, 감탄사, 공감 표현을 자주 사용
 - "진짜?", "대박!", "그렇구나!" 같은 자연스러운 반응
 - 전문 용어보다는 쉬운 표현 사용""",
-                "professional": """
+        "professional": """
 스타일: 전문적이고 신뢰감 있는 대화
 - 정중하고 체계적인 어조
 - 정확한 정보 전달에 초점
 - 전문 용어 사용 시 간단한 설명 추가
 - 논리적인 흐름으로 주제를 깊이 있게 다룸""",
-                "educational": """
+        "educational": """
 스타일: 교육적이고 설명 중심의 대화
 - 복잡한 개념을 쉽게 풀어서 설명
 - 예시와 비유를 적극 활용
 - 청취자가 배울 수 있도록 단계적으로 설명
 - "예를 들면...", "쉽게 말하면..." 같은 표현 사용
 - 배경 지식이 없어도 이해할 수 있도록 친절하게 설명""",
-                "storytelling": """
+        "storytelling": """
 스타일: 이야기를 들려주듯 흥미진진한 대화
 - 극적이고 생동감 있는 표현
 - 장면 묘사와 감정 표현이 풍부
 - 호기심을 유발하는 질문과 반전
 - 이야기의 기승전결 구조 활용"""
-            }
-        else:  # English
-            style_guidelines = {
-                "casual": """
+    },
+    "en": {
+        "casual": """
 Style: Friendly and relaxed conversation
 - Natural and light tone, like talking with friends
 - Use humor, exclamations, and empathetic expressions
 - Natural reactions like "Really?", "Wow!", "I see!"
 - Use simple expressions over technical jargon""",
-                "professional": """
+        "professional": """
 Style: Professional and credible conversation
 - Polite and systematic tone
 - Focus on accurate information delivery
 - Brief explanations when using technical terms
 - Deep dive into topics with logical flow""",
-                "educational": """
+        "educational": """
 Style: Educational and explanatory conversation
 - Break down complex concepts into simple terms
 - Use examples and analogies actively
 - Explain step-by-step for listener understanding
 - Use phrases like "For example...", "In simple terms..."
 - Explain kindly so anyone can understand without background knowledge""",
-                "storytelling": """
+        "storytelling": """
 Style: Engaging and narrative conversation
 - Dramatic and vivid expressions
 - Rich in scene descriptions and emotional expressions
 - Questions and twists that spark curiosity
 - Use narrative structure with introduction, development, climax, and conclusion"""
-            }
+    }
+}
 
-        style_guide = style_guidelines.get(style, style_guidelines["casual"])
+KEY_CONTENT_INSTRUCTIONS = """당신은 웹 콘텐츠에서 핵심 정보를 추출하는 전문가입니다.
+사용자가 보내는 웹페이지 내용을 읽고 핵심 내용을 추출해주세요.
 
-        # 화자 수에 따른 프롬프트 조정
-        turns_per_speaker = turns // num_speakers
+요구사항:
+1. 주요 주제와 핵심 메시지를 파악하세요
+2. 중요한 사실, 데이터, 인용구를 포함하세요
+3. 불필요한 광고나 부가 정보는 제외하세요
+4. 구조화된 형태로 정리하세요
+5. 한국어로 작성하세요"""
 
-        if language == "ko":
-            if num_speakers == 2:
-                speaker_info = f"""
+TITLE_INSTRUCTIONS = """
+주어진 팟캐스트 스크립트를 바탕으로 매력적인 제목을 생성해주세요.
+제목은 간결하면서도 호기심을 유발해야 합니다.
+"""
+
+
+@lru_cache(maxsize=None)
+def script_instructions(language: str, num_speakers: int, style: str) -> str:
+    """스크립트 생성 system 프롬프트 (언어, 화자 수, 스타일 조합마다 항상 같은 문자열)
+
+    주제와 턴 수는 넣지 않으므로 같은 조합의 요청은 이 부분을 프롬프트 캐시에서 재사용합니다.
+    """
+    guidelines = STYLE_GUIDELINES["ko" if language == "ko" else "en"]
+    style_guide = guidelines.get(style, guidelines["casual"])
+
+    if language == "ko":
+        if num_speakers == 2:
+            speaker_info = f"""
 조건:
 1. 2명의 진행자가 등장하며, 서로 농담도 하고, 질문/답변을 오가면서 실제 녹음 상황처럼 대화할 것
-2. 각 화자는 "화자A:", "화자B:" 형식으로 구분 (화자C는 사용하지 않음)
-3. **중요**: 정확히 총 {turns}개의 대사로 구성해야 함 (화자A와 화자B가 각각 약 {turns_per_speaker}번씩 발언)
+2. 응답은 JSON의 dialogues 배열로 작성하며, 항목 하나가 대사 한 턴임. speaker는 화자를 나타내는 "A" 또는 "B"(화자C는 사용하지 않음), text는 화자 표시 없이 대사 내용만
+3. **중요**: 요청에 적힌 총 대화 턴 수와 정확히 같은 수의 대사로 구성해야 함 (화자A와 화자B가 고르게 나누어 발언)
 4. 각 대사는 2-3문장으로 짧고 자연스럽게 작성하되, 주제와 관련된 흥미로운 정보와 개인적인 반응이 섞여 있어야 함
 5. 문어체가 아닌 구어체 한국어로 작성
 6. 대화의 흐름이 청취자가 집중할 수 있도록 오프닝 → 주제 심화 → 정리/마무리로 이어질 것
 
 {style_guide}
-
-예시 형식:
-화자A: 안녕하세요, 오늘 팟캐스트 시작해 볼게요.
-화자B: 네, 오늘은 제가 기다리던 주제예요. 너무 흥미로워요.
 """
-            else:  # 3명
-                speaker_info = f"""
+        else:  # 3명
+            speaker_info = f"""
 조건:
 1. 3명의 진행자가 등장하며, 서로 농담도 하고, 질문/답변을 오가면서 실제 녹음 상황처럼 대화할 것
-2. 각 화자는 "화자A:", "화자B:", "화자C:" 형식으로 구분
-3. **중요**: 정확히 총 {turns}개의 대사로 구성해야 함 (화자A, B, C가 각각 약 {turns_per_speaker}번씩 발언)
+2. 응답은 JSON의 dialogues 배열로 작성하며, 항목 하나가 대사 한 턴임. speaker는 화자를 나타내는 "A", "B" 또는 "C", text는 화자 표시 없이 대사 내용만
+3. **중요**: 요청에 적힌 총 대화 턴 수와 정확히 같은 수의 대사로 구성해야 함 (화자A, B, C가 고르게 나누어 발언)
 4. 각 대사는 2-3문장으로 짧고 자연스럽게 작성하되, 주제와 관련된 흥미로운 정보와 개인적인 반응이 섞여 있어야 함
 5. 문어체가 아닌 구어체 한국어로 작성
 6. 대화의 흐름이 청취자가 집중할 수 있도록 오프닝 → 주제 심화 → 정리/마무리로 이어질 것
 
 {style_guide}
-
-예시 형식:
-화자A: 안녕하세요, 오늘 팟캐스트 시작해 볼게요.
-화자B: 네, 오늘은 제가 기다리던 주제예요. 너무 흥미로워요.
-화자C: 맞아요, 저도 준비하면서 새롭게 알게 된 게 많더라고요.
 """
 
-            prompt = f"""
+        return f"""
 당신은 팟캐스트 대본 작가입니다.
-아래 조건을 충족하는 **실제 사람들이 나누는 것처럼 자연스러운 대화 대본**을 작성하세요.
-
-주제 설명: {topic}
-총 대화 턴 수: {turns}
+사용자가 보내는 주제 설명과 총 대화 턴 수로, 아래 조건을 충족하는 **실제 사람들이 나누는 것처럼 자연스러운 대화 대본**을 작성하세요.
+{speaker_info}"""
 
-{speaker_info}
-"""
-        else:  # English
-            if num_speakers == 2:
-                speaker_info = f"""
+    if num_speakers == 2:
+        speaker_info = f"""
 Requirements:
 1. 2 hosts having a conversation, joking with each other, asking/answering questions like a real recording situation
-2. Each speaker is identified as "Speaker A:", "Speaker B:" format (do NOT use Speaker C)
-3. **IMPORTANT**: Must consist of exactly {turns} dialogue turns total (Speaker A and Speaker B each speaking approximately {turns_per_speaker} times)
+2. Respond with a JSON "dialogues" array where each item is one turn: "speaker" is "A" or "B" (do NOT use C), "text" is only the spoken line without a speaker label
+3. **IMPORTANT**: Must consist of exactly the total number of dialogue turns given in the request (Speaker A and Speaker B speaking about equally often)
 4. Each dialogue should be 2-3 sentences, short and natural, mixing interesting information about the topic with personal reactions
 5. Write in conversational spoken English, not formal written language
 6. The conversation flow should keep listeners engaged: Opening → Topic Deep Dive → Summary/Closing
 
 {style_guide}
-
-Example format:
-Speaker A: Hello everyone, let's start today's podcast.
-Speaker B: Yes, I've been looking forward to this topic. It's so interesting.
 """
-            else:  # 3명
-                speaker_info = f"""
+    else:  # 3명
+        speaker_info = f"""
 Requirements:
 1. 3 hosts having a conversation, joking with each other, asking/answering questions like a real recording situation
-2. Each speaker is identified as "Speaker A:", "Speaker B:", "Speaker C:" format
-3. **IMPORTANT**: Must consist of exactly {turns} dialogue turns total (Speaker A, B, and C each speaking approximately {turns_per_speaker} times)
+2. Respond with a JSON "dialogues" array where each item is one turn: "speaker" is "A", "B", or "C", "text" is only the spoken line without a speaker label
+3. **IMPORTANT**: Must consist of exactly the total number of dialogue turns given in the request (Speaker A, B, and C speaking about equally often)
 4. Each dialogue should be 2-3 sentences, short and natural, mixing interesting information about the topic with personal reactions
 5. Write in conversational spoken English, not formal written language
 6. The conversation flow should keep listeners engaged: Opening → Topic Deep Dive → Summary/Closing
 
 {style_guide}
-
-Example format:
-Speaker A: Hello everyone, let's start today's podcast.
-Speaker B: Yes, I've been looking forward to this topic. It's so interesting.
-Speaker C: Right, I learned a lot while preparing for this.
 """
 
-            prompt = f"""
+    return f"""
 You are a podcast script writer.
-Write a **natural conversational script like real people talking** that meets the following requirements.
+Using the topic description and total dialogue turns sent by the user, write a **natural conversational script like real people talking** that meets the following requirements.
+{speaker_info}"""
 
-Topic Description: {topic}
-Total Dialogue Turns: {turns}
 
-{speaker_info}
-"""
+def usage_tokens(response) -> dict:
+    """응답 usage의 토큰 수 ({"prompt", "cached", "completion"}, usage가 없으면 모두 0)"""
+    usage = getattr(response, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "prompt": getattr(usage, "prompt_tokens", None) or 0,
+        "cached": getattr(details, "cached_tokens", None) or 0,
+        "completion": getattr(usage, "completion_tokens", None) or 0
+    }
+
+
+class OpenAIClient:
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
+        self.client = AsyncOpenAI(
+            api_key=self.settings.openai_api_key,
+            base_url=self.settings.openai_base_url
+        )
+        self.cassette = Cassette.from_settings(self.settings)
+        self.router = ModelRouter.from_settings(self.settings)
+        # 엔드포인트별 클라이언트 ((base_url, API 키) → AsyncOpenAI), 기본 엔드포인트는 self.client
+        self._clients: Dict[Tuple[str, str], AsyncOpenAI] = {}
+
+    def _client_for(self, endpoint: Endpoint) -> AsyncOpenAI:
+        api_key = api_key_for(endpoint, self.settings.openai_api_key)
+        if endpoint.base_url is None and api_key == self.settings.openai_api_key:
+            return self.client
+        base_url = endpoint.base_url or self.settings.openai_base_url
+        client = self._clients.get((base_url, api_key))
+        if client is None:
+            client = self._clients.setdefault((base_url, api_key), AsyncOpenAI(api_key=api_key, base_url=base_url))
+        return client
+
+    async def warmup(self, timeout: float = 5.0) -> int:
+        """라우팅 후보 엔드포인트마다 연결을 미리 열어 둠 (첫 LLM 호출의 TCP/TLS 연결 시간 제거)
+
+        토큰을 쓰지 않는 모델 목록 조회를 보내며, 오류 응답(404 등)이어도 연결은 풀에 남으므로 성공으로 봅니다.
+        연결하지 못한 엔드포인트는 경고만 남깁니다 (호출 때 장애 조치로 처리).
+
+        Returns:
+            연결한 엔드포인트 수
+        """
+        if self.cassette is not None and self.cassette.mode == "replay":
+            return 0
+
+        clients = {}
+        for endpoints in self.router.routes.values():
+            for endpoint in endpoints:
+                client = self._client_for(endpoint)
+                clients.setdefault(id(client), (endpoint, client))
+
+        async def connect(endpoint: Endpoint, client: AsyncOpenAI) -> bool:
+            try:
+                await client.with_options(max_retries=0, timeout=timeout).models.list()
+            except APIStatusError:
+                pass
+            except Exception as e:
+                logger.warning(f"LLM 엔드포인트 연결 실패 (워밍업): {endpoint.key} - {str(e)}")
+                return False
+            return True
+
+        results = await asyncio.gather(*(connect(endpoint, client) for endpoint, client in clients.values()))
+        return sum(results)
+
+    async def _send(self, call: str, endpoint: Endpoint, request: dict, last: bool = True):
+        """엔드포인트 하나로 chat.completions.create 호출 (지연 시간/오류/토큰 메트릭 기록)
+
+        토큰 수(프롬프트, 그중 캐시 적중, 완성)는 작업 트레이스의 LLM 스팬에도 기록되어
+        /podcasts/{id}/trace에서 작업별 합계로 볼 수 있습니다.
+
+        Args:
+            last: 마지막 후보 여부 (다음 후보가 있으면 SDK 재시도 없이 바로 실패시켜 넘김)
+        """
+        client = self._client_for(endpoint)
+        if not last:
+            client = client.with_options(max_retries=0)
+        started = time.perf_counter()
+        ok = False
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
+            with span(f"llm.{call}", kind="llm", model=endpoint.model, endpoint=endpoint.base_url or "default") as llm_span:
+                if self.cassette is not None:
+                    response = await self.cassette.chat_completion(
+                        request, lambda: client.chat.completions.create(**request)
+                    )
+                else:
+                    response = await client.chat.completions.create(**request)
+
+                tokens = usage_tokens(response)
+                for token_type, count in tokens.items():
+                    LLM_TOKENS.labels(call=call, type=token_type).inc(count)
+                    if llm_span:
+                        llm_span.set_attribute(f"{token_type}_tokens", count)
+            ok = True
+            LLM_ROUTED_CALLS.labels(call=call, model=endpoint.model).inc()
+            return response
+        except Exception:
+            LLM_CALL_ERRORS.labels(call=call).inc()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            LLM_CALL_SECONDS.labels(call=call).observe(elapsed)
+            self.router.record(endpoint, elapsed, ok)
+
+    async def _chat_completion(self, call: str, **kwargs):
+        """호출 종류의 라우팅 규칙에 따라 모델을 골라 chat.completions.create 호출
+
+        입력 크기와 엔드포인트 상태(최근 p95 지연, 오류율)로 후보 순서를 정하고,
+        실패하면 다음 후보 엔드포인트로 같은 요청을 다시 보냅니다.
+
+        Args:
+            call: 호출 종류 (generate_podcast_script, generate_title, extract_key_content)
+            **kwargs: model을 제외한 chat.completions.create 인자
+        """
+        input_chars = sum(len(message["content"]) for message in kwargs["messages"])
+        candidates = self.router.candidates(call, input_chars)
+
+        for attempt, endpoint in enumerate(candidates):
+            last = attempt == len(candidates) - 1
+            try:
+                return await self._send(call, endpoint, dict(kwargs, model=endpoint.model), last)
+            except Exception as e:
+                if last:
+                    raise
+                LLM_FAILOVERS.labels(call=call).inc()
+                logger.warning(f"LLM 호출 실패, 다음 후보로 전환: {call} {endpoint.key} → {candidates[attempt + 1].key} - {str(e)}")
+
+    async def generate_podcast_script(
+        self,
+        topic: str,
+        language: str = "ko",
+        num_speakers: int = 2,
+        turns: int = 8,
+        style: str = "casual"
+    ) -> str:
+
+        # 화자 수에 따른 턴 배분 (지시문은 캐시되도록 고정하고 요청마다 바뀌는 값만 user 메시지에)
+        turns_per_speaker = turns // num_speakers
+
+        if language == "ko":
+            request = f"""총 대화 턴 수: {turns} (화자별 약 {turns_per_speaker}번씩 발언)
+
+주제 설명: {topic}"""
+        else:  # English
+            request = f"""Total Dialogue Turns: {turns} (each speaker about {turns_per_speaker} times)
+
+Topic Description: {topic}"""
+
+        messages = [
+            {"role": "system", "content": script_instructions(language, num_speakers, style)},
+            {"role": "user", "content": request}
+        ]
+        response_format = script_response_format(num_speakers)
+
+        try:
+            response = await self._chat_completion(
+                "generate_podcast_script",
+                messages=messages,
+                response_format=response_format,
                 max_tokens=2000,
                 temperature=0.8
             )
-
-            script = response.choices[0].message.content or ""
-
-            return script
+            items = parse_script_items(response.choices[0].message.content or "", num_speakers)
+            items = await self._repair_script(items, messages, response_format, turns, num_speakers, language)
 
         except Exception as e:
             raise Exception(f"OpenAI API 호출 중 오류가 발생했습니다: {str(e)}")
 
-    async def generate_title(self, script: str) -> str:
-        system_prompt = """
-주어진 팟캐스트 스크립트를 바탕으로 매력적인 제목을 생성해주세요.
-제목은 간결하면서도 호기심을 유발해야 합니다.
-"""
+        if not items:
+            raise ValueError("LLM 응답에서 대사를 찾을 수 없습니다.")
+        return render_script(items, language)
 
+    async def _repair_script(
+        self,
+        items: List[ScriptItem],
+        messages: List[dict],
+        response_format: dict,
+        turns: int,
+        num_speakers: int,
+        language: str
+    ) -> List[ScriptItem]:
+        """턴 수나 화자 구성이 모자라면 지금까지의 대본을 assistant 메시지로 두고 나머지 대사만 요청
+
+        대본 전체를 다시 생성하지 않으므로 잘린 응답이나 짧은 응답도 모자란 만큼의 토큰만 더 씁니다.
+        system/user 메시지는 첫 요청과 같아 복구 요청도 프롬프트 캐시를 그대로 씁니다.
+        SCRIPT_REPAIR_ATTEMPTS번 뒤에도 모자라면 경고만 남기고 있는 대사로 진행합니다.
+        """
+        for attempt in range(self.settings.script_repair_attempts + 1):
+            check = check_script(items, turns, num_speakers)
+            if check["ok"]:
+                return items
+            if attempt == self.settings.script_repair_attempts:
+                logger.warning(
+                    f"스크립트 복구 횟수 초과, 있는 대사로 진행: {len(items)}/{turns}턴, "
+                    f"발언하지 않은 화자 {check['missing_speakers']}"
+                )
+                return items
+
+            missing_turns = check["missing_turns"]
+            absent = check["missing_speakers"]
+            SCRIPT_REPAIRS.labels(reason="turns" if missing_turns else "speakers").inc()
+            if missing_turns < len(absent):
+                # 발언하지 않은 화자의 자리가 모자라면 마지막 대사를 비워 그 자리를 만듦 (턴 수는 요청과 같게 유지)
+                items = items[:max(0, turns - len(absent))]
+                absent = missing_speakers(items, num_speakers)
+            count = turns - len(items)
+            logger.info(f"스크립트 복구 요청: {len(items)}/{turns}턴, 나머지 {count}개 (발언하지 않은 화자 {absent})")
+
+            # 대사가 하나도 없으면(빈 응답, 형식 오류) 첫 요청을 그대로 다시 보냄
+            repair_messages = messages + [
+                {"role": "assistant", "content": items_json(items)},
+                {"role": "user", "content": continuation_request(items, count, absent, language)}
+            ] if items else messages
+            response = await self._chat_completion(
+                "generate_podcast_script",
+                messages=repair_messages,
+                response_format=response_format,
+                max_tokens=2000,
+                temperature=0.8
+            )
+            continuation = parse_script_items(response.choices[0].message.content or "", num_speakers)
+            new_items = strip_echo(items, continuation)
+            if len(new_items) < len(continuation):
+                logger.debug(f"스크립트 복구 응답에서 되풀이한 앞 대사 {len(continuation) - len(new_items)}개 제외")
+            items = items + take_continuation(new_items, count, absent)
+        return items
+
+    async def generate_title(self, script: str) -> str:
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4.1-nano",
+            response = await self._chat_completion(
+                "generate_title",
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": TITLE_INSTRUCTIONS},
                     {"role": "user", "content": script[:1000]}
                 ],
                 max_tokens=200,
@@ -223,26 +438,12 @@ Total Dialogue Turns: {turns}
         if len(text) > 64000:
             text = text[:64000]
 
-        prompt = f"""다음 웹페이지 내용을 읽고 핵심 내용을 추출해주세요.
-
-요구사항:
-1. 주요 주제와 핵심 메시지를 파악하세요
-2. 중요한 사실, 데이터, 인용구를 포함하세요
-3. 불필요한 광고나 부가 정보는 제외하세요
-4. 구조화된 형태로 정리하세요
-5. 한국어로 작성하세요
-
-웹페이지 내용:
-{text}
-
-핵심 내용:"""
-
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4.1-nano",
+            response = await self._chat_completion(
+                "extract_key_content",
                 messages=[
-                    {"role": "system", "content": "당신은 웹 콘텐츠에서 핵심 정보를 추출하는 전문가입니다."},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": KEY_CONTENT_INSTRUCTIONS},
+                    {"role": "user", "content": f"웹페이지 내용:\n{text}\n\n핵심 내용:"}
                 ],
                 max_tokens=max_tokens,
                 temperature=0.3
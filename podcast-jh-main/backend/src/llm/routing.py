@@ -0,0 +1,220 @@
+"""
+LLM 호출 종류(단계)별 모델 라우팅과 지연/오류 기반 장애 조치
+
+호출 종류마다 후보 엔드포인트(모델 + OpenAI 호환 base_url) 목록을 선호 순서대로 둡니다.
+
+- 입력 크기: max_input_chars가 있는 후보는 입력이 그 이하일 때만 사용 (짧은 입력은 빠르고 싼 모델로)
+- 상태: 엔드포인트별 최근 window초의 호출에서 p95 지연이나 오류율이 기준을 넘으면 뒤 순서로 미룸
+- 실패: 호출이 실패하면 같은 요청을 다음 후보로 다시 보냄
+
+기준을 넘은 엔드포인트도 기록이 window 밖으로 밀려나면 다시 선호 순서대로 시도되므로, 회복된 모델로
+트래픽이 자연스럽게 돌아옵니다.
+
+설정 (LLM_ROUTES, JSON):
+    {"generate_podcast_script": [{"model": "gpt-4o-mini"},
+                                 {"model": "gpt-4.1-mini", "base_url": "http://127.0.0.1:9100/v1"}],
+     "extract_key_content": [{"model": "gpt-4.1-nano", "max_input_chars": 20000}, {"model": "gpt-4o-mini"}]}
+지정하지 않은 호출 종류는 DEFAULT_ROUTES를 씁니다. api_key_env로 엔드포인트별 API 키 환경변수를 지정할 수 있습니다.
+"""
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+# 호출 종류별 기본 모델 (LLM_ROUTES로 덮어씀)
+DEFAULT_ROUTES = {
+    "generate_podcast_script": [{"model": "gpt-4o-mini"}],
+    "generate_title": [{"model": "gpt-4.1-nano"}],
+    "extract_key_content": [{"model": "gpt-4.1-nano"}],
+}
+# 엔드포인트별로 보관하는 최근 호출 수 상한
+MAX_SAMPLES = 200
+
+
+class Endpoint:
+    """후보 엔드포인트 하나 (모델과 OpenAI 호환 API 주소)
+
+    Args:
+        model: 모델 이름
+        base_url: API 주소 (None이면 OPENAI_BASE_URL 또는 공식 엔드포인트)
+        max_input_chars: 입력 문자 수가 이 값 이하일 때만 사용 (None이면 제한 없음)
+        api_key_env: API 키 환경변수 이름 (None이면 OPENAI_API_KEY)
+    """
+
+    def __init__(
+        self,
+        model: str,
+        base_url: Optional[str] = None,
+        max_input_chars: Optional[int] = None,
+        api_key_env: Optional[str] = None
+    ):
+        self.model = model
+        self.base_url = base_url
+        self.max_input_chars = max_input_chars
+        self.api_key_env = api_key_env
+
+    @property
+    def key(self) -> str:
+        return f"{self.model}@{self.base_url or 'default'}"
+
+    def accepts(self, input_chars: int) -> bool:
+        return self.max_input_chars is None or input_chars <= self.max_input_chars
+
+
+class EndpointHealth:
+    """엔드포인트의 최근 호출 기록 (지연 시간, 성공 여부)"""
+
+    def __init__(self, window: float):
+        self.window = window
+        self._samples: Deque[Tuple[float, float, bool]] = deque(maxlen=MAX_SAMPLES)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool):
+        with self._lock:
+            self._samples.append((time.monotonic(), latency, ok))
+
+    def snapshot(self) -> Tuple[int, float, float]:
+        """window 안의 (호출 수, p95 지연, 오류율)"""
+        cutoff = time.monotonic() - self.window
+        with self._lock:
+            while self._samples and self._samples[0][0] < cutoff:
+                self._samples.popleft()
+            samples = list(self._samples)
+        if not samples:
+            return 0, 0.0, 0.0
+        latencies = sorted(latency for _, latency, _ in samples)
+        p95 = latencies[min(len(latencies) - 1, math.ceil(len(latencies) * 0.95) - 1)]
+        errors = sum(1 for _, _, ok in samples if not ok)
+        return len(samples), p95, errors / len(samples)
+
+
+class ModelRouter:
+    """호출 종류별 후보 엔드포인트 선택
+
+    Args:
+        routes: 호출 종류 → 선호 순서의 후보 목록
+        p95_threshold: 이 지연(초)을 넘는 p95의 엔드포인트는 뒤로 미룸 (0이면 지연은 보지 않음)
+        error_rate_threshold: 이 오류율(0~1)을 넘는 엔드포인트는 뒤로 미룸
+        window: 상태 판단에 쓰는 최근 기록 기간 (초)
+        min_samples: 기록이 이보다 적으면 건강한 것으로 봄
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, List[Endpoint]],
+        p95_threshold: float = 30.0,
+        error_rate_threshold: float = 0.5,
+        window: float = 300.0,
+        min_samples: int = 5
+    ):
+        self.routes = routes
+        self.p95_threshold = p95_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.window = window
+        self.min_samples = min_samples
+        self._health: Dict[str, EndpointHealth] = {}
+
+    @classmethod
+    def from_settings(cls, settings) -> "ModelRouter":
+        return cls(
+            parse_routes(settings.llm_routes),
+            p95_threshold=settings.llm_p95_threshold,
+            error_rate_threshold=settings.llm_error_rate_threshold,
+            window=settings.llm_health_window,
+            min_samples=settings.llm_health_min_samples
+        )
+
+    def health(self, endpoint: Endpoint) -> EndpointHealth:
+        health = self._health.get(endpoint.key)
+        if health is None:
+            health = self._health.setdefault(endpoint.key, EndpointHealth(self.window))
+        return health
+
+    def healthy(self, endpoint: Endpoint) -> bool:
+        count, p95, error_rate = self.health(endpoint).snapshot()
+        if count < self.min_samples:
+            return True
+        if error_rate > self.error_rate_threshold:
+            return False
+        return not (self.p95_threshold > 0 and p95 > self.p95_threshold)
+
+    def candidates(self, call: str, input_chars: int) -> List[Endpoint]:
+        """이번 호출에 시도할 엔드포인트 순서 (입력 크기로 거른 뒤 건강한 후보 먼저)
+
+        입력 크기 조건을 만족하는 후보가 없으면 제한 없는 후보처럼 모든 후보를 씁니다.
+        """
+        endpoints = self.routes[call]
+        eligible = [endpoint for endpoint in endpoints if endpoint.accepts(input_chars)] or list(endpoints)
+        healthy = [endpoint for endpoint in eligible if self.healthy(endpoint)]
+        degraded = [endpoint for endpoint in eligible if endpoint not in healthy]
+        if degraded and healthy:
+            logger.debug(f"{call}: 상태 기준을 넘은 엔드포인트를 뒤로 미룸 - {[endpoint.key for endpoint in degraded]}")
+        return healthy + degraded
+
+    def record(self, endpoint: Endpoint, latency: float, ok: bool):
+        self.health(endpoint).record(latency, ok)
+
+    def status(self) -> Dict[str, dict]:
+        """호출 종류별 후보의 현재 상태 (로그/디버깅용)"""
+        result = {}
+        for call, endpoints in self.routes.items():
+            result[call] = []
+            for endpoint in endpoints:
+                count, p95, error_rate = self.health(endpoint).snapshot()
+                result[call].append({
+                    "endpoint": endpoint.key,
+                    "max_input_chars": endpoint.max_input_chars,
+                    "calls": count,
+                    "p95_seconds": round(p95, 3),
+                    "error_rate": round(error_rate, 3),
+                    "healthy": self.healthy(endpoint)
+                })
+        return result
+
+
+def parse_routes(text: Optional[str]) -> Dict[str, List[Endpoint]]:
+    """LLM_ROUTES(JSON) → 호출 종류별 후보 목록 (지정하지 않은 호출 종류는 기본값)
+
+    Raises:
+        ValueError: JSON 형식이나 후보 설정이 잘못됨
+    """
+    routes = dict(DEFAULT_ROUTES)
+    if text:
+        try:
+            configured = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"LLM_ROUTES가 올바른 JSON이 아닙니다: {str(e)}")
+        unknown = [call for call in configured if call not in DEFAULT_ROUTES]
+        if unknown:
+            raise ValueError(f"알 수 없는 LLM 호출 종류: {', '.join(unknown)} (사용 가능: {', '.join(DEFAULT_ROUTES)})")
+        routes.update(configured)
+
+    parsed: Dict[str, List[Endpoint]] = {}
+    for call, candidates in routes.items():
+        if not candidates:
+            raise ValueError(f"LLM_ROUTES의 {call}에 후보 모델이 없습니다.")
+        endpoints = []
+        for candidate in candidates:
+            if not isinstance(candidate, dict) or not candidate.get("model"):
+                raise ValueError(f"LLM_ROUTES의 {call} 후보에는 model이 필요합니다: {candidate}")
+            endpoints.append(Endpoint(
+                model=candidate["model"],
+                base_url=candidate.get("base_url"),
+                max_input_chars=candidate.get("max_input_chars"),
+                api_key_env=candidate.get("api_key_env")
+            ))
+        parsed[call] = endpoints
+    return parsed
+
+
+def api_key_for(endpoint: Endpoint, default: str) -> str:
+    """엔드포인트의 API 키 (api_key_env가 없거나 비어 있으면 기본 키)"""
+    if endpoint.api_key_env:
+        return os.getenv(endpoint.api_key_env) or default
+    return default
@@ -0,0 +1,188 @@
+"""
+스크립트 생성의 구조화 출력 (JSON 스키마, 검증, 부분 복구)
+
+자유 텍스트를 정규식으로 파싱하면 모델이 "화자A:" 형식을 벗어나거나 응답이 잘렸을 때 LLM 비용을 이미
+지불한 뒤에 작업이 실패합니다. 스크립트는 {"dialogues": [{"speaker": "A", "text": "..."}]} 형식의
+JSON 스키마로 받고, 턴 수와 화자 구성을 검사해 모자란 부분만 이어서 요청합니다.
+
+- 잘린 응답: 끝까지 닫힌 대사 객체만 살려서 사용 (나머지는 복구 요청으로 채움)
+- 구조화 출력을 지원하지 않는 OpenAI 호환 서버: "화자A: 대사" 텍스트 응답도 같은 형태로 읽음
+
+검증을 통과한 대사는 기존과 같은 "화자A: 대사" 줄 형식의 텍스트로 저장하므로 script.txt 체크포인트,
+제목 생성, 대사 파싱, 재렌더링은 그대로 동작합니다.
+"""
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+SPEAKER_LETTERS = "ABC"
+# 텍스트 응답 파싱 패턴 (generator._parse_dialogue_script와 같은 규칙)
+LINE_PATTERN = re.compile(r'(?:화자|Speaker\s+)([A-C]):\s*(.+?)(?=\n(?:화자|Speaker\s+)[A-C]:|$)', re.DOTALL | re.IGNORECASE)
+
+ScriptItem = Tuple[str, str]
+
+
+def script_response_format(num_speakers: int) -> dict:
+    """화자 수에 맞는 구조화 출력 스키마 (response_format 인자)
+
+    화자 수마다 항상 같은 값이므로 지시문과 함께 프롬프트 캐시 구간에 들어갑니다.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "podcast_script",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "dialogues": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "speaker": {"type": "string", "enum": list(SPEAKER_LETTERS[:num_speakers])},
+                                "text": {"type": "string"}
+                            },
+                            "required": ["speaker", "text"],
+                            "additionalProperties": False
+                        }
+                    }
+                },
+                "required": ["dialogues"],
+                "additionalProperties": False
+            }
+        }
+    }
+
+
+def _item(value, letters: str) -> Optional[ScriptItem]:
+    if not isinstance(value, dict):
+        return None
+    speaker = str(value.get("speaker", "")).strip().upper()
+    # "화자A", "Speaker A"처럼 레이블째로 보낸 경우도 허용
+    speaker = speaker[-1:] if speaker else ""
+    text = " ".join(str(value.get("text", "")).split())
+    if not speaker or speaker not in letters or not text:
+        return None
+    return speaker, text
+
+
+def _salvage(content: str, letters: str) -> List[ScriptItem]:
+    """잘린 JSON에서 끝까지 닫힌 대사 객체만 꺼냄"""
+    start = content.find("[")
+    if start < 0:
+        return []
+    decoder = json.JSONDecoder()
+    items: List[ScriptItem] = []
+    index = start + 1
+    while index < len(content):
+        while index < len(content) and content[index] in " \t\r\n,":
+            index += 1
+        if index >= len(content) or content[index] != "{":
+            break
+        try:
+            value, index = decoder.raw_decode(content, index)
+        except json.JSONDecodeError:
+            break
+        item = _item(value, letters)
+        if item:
+            items.append(item)
+    return items
+
+
+def parse_script_items(content: str, num_speakers: int = len(SPEAKER_LETTERS)) -> List[ScriptItem]:
+    """LLM 응답 → [(화자 문자, 대사), ...]
+
+    JSON이면 dialogues 배열을, 잘린 JSON이면 닫힌 객체까지를, JSON이 아니면 "화자A: 대사" 줄을 읽습니다.
+    요청한 화자 수를 넘는 화자(2명 모드의 화자C 등)의 대사는 음성을 매핑할 수 없으므로 버리며,
+    버린 만큼은 모자란 턴으로 남아 복구 요청으로 채워집니다.
+    """
+    letters = SPEAKER_LETTERS[:num_speakers]
+    content = content.strip()
+    if content.startswith("{"):
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            return _salvage(content, letters)
+        dialogues = data.get("dialogues") if isinstance(data, dict) else None
+        return [item for item in (_item(value, letters) for value in dialogues or []) if item]
+
+    return [
+        (letter.upper(), " ".join(text.split()))
+        for letter, text in LINE_PATTERN.findall(content)
+        if text.strip() and letter.upper() in letters
+    ]
+
+
+def missing_speakers(items: List[ScriptItem], num_speakers: int) -> List[str]:
+    """한 번도 발언하지 않은 화자 문자"""
+    spoken = {speaker for speaker, _ in items}
+    return [letter for letter in SPEAKER_LETTERS[:num_speakers] if letter not in spoken]
+
+
+def check_script(items: List[ScriptItem], turns: int, num_speakers: int) -> Dict[str, object]:
+    """턴 수와 화자 구성 검사
+
+    Returns:
+        {"missing_turns": 모자란 턴 수, "missing_speakers": 발언하지 않은 화자, "ok": 복구가 필요 없는지}
+        (화자 수를 넘는 화자는 parse_script_items에서 이미 버려지고, 요청보다 많은 턴은 그대로 둠)
+    """
+    missing_turns = max(0, turns - len(items))
+    absent = missing_speakers(items, num_speakers)
+    return {"missing_turns": missing_turns, "missing_speakers": absent, "ok": not missing_turns and not absent}
+
+
+def continuation_request(items: List[ScriptItem], count: int, absent: List[str], language: str) -> str:
+    """지금까지의 대본에 이어 모자란 대사만 요청하는 user 메시지"""
+    if language == "ko":
+        request = f"대본이 {len(items)}번째 대사에서 끊겼습니다. 앞 대화에 자연스럽게 이어지는 나머지 대사 {count}개만 같은 형식으로 작성하세요."
+        if absent:
+            request += f" 아직 발언하지 않은 화자({', '.join('화자' + letter for letter in absent)})가 반드시 포함되어야 합니다."
+        return request + " 이미 작성된 대사는 다시 쓰지 마세요."
+
+    request = f"The script stopped after line {len(items)}. Write only the remaining {count} lines in the same format, continuing the conversation naturally."
+    if absent:
+        request += f" It must include the speakers who have not spoken yet ({', '.join('Speaker ' + letter for letter in absent)})."
+    return request + " Do not repeat lines that were already written."
+
+
+def strip_echo(items: List[ScriptItem], continuation: List[ScriptItem]) -> List[ScriptItem]:
+    """이어 쓴 응답이 앞 대사를 되풀이했으면 겹치는 앞부분을 버림
+
+    응답의 앞부분이 지금까지 대본의 끝부분(대본 전체 포함)과 화자/대사까지 같으면 가장 긴 겹침을 제거합니다.
+    """
+    for size in range(min(len(items), len(continuation)), 0, -1):
+        if continuation[:size] == items[-size:]:
+            return continuation[size:]
+    return continuation
+
+
+def take_continuation(continuation: List[ScriptItem], count: int, absent: List[str]) -> List[ScriptItem]:
+    """복구 응답에서 이어 붙일 대사를 최대 count개 고름
+
+    남은 자리가 아직 발언하지 않은 화자 수와 같아지면 그 화자들의 대사만 받으므로,
+    응답에 해당 화자의 대사가 있으면 턴 수를 넘기지 않고 모든 화자가 발언하게 됩니다.
+    """
+    taken: List[ScriptItem] = []
+    pending = set(absent)
+    for speaker, text in continuation:
+        if len(taken) == count:
+            break
+        if speaker in pending or count - len(taken) > len(pending):
+            taken.append((speaker, text))
+            pending.discard(speaker)
+    return taken
+
+
+def items_json(items: List[ScriptItem]) -> str:
+    """대사 목록을 응답과 같은 JSON으로 (복구 요청의 assistant 메시지)"""
+    return json.dumps(
+        {"dialogues": [{"speaker": speaker, "text": text} for speaker, text in items]},
+        ensure_ascii=False
+    )
+
+
+def render_script(items: List[ScriptItem], language: str) -> str:
+    """대사 목록 → "화자A: 대사" 줄 형식의 스크립트 (script.txt 체크포인트 형식)"""
+    prefix = "화자" if language == "ko" else "Speaker "
+    return "\n".join(f"{prefix}{speaker}: {text}" for speaker, text in items)
@@ -1,3 +1,15 @@
-from .podcast import PodcastRequest, PodcastResponse
+from .podcast import (
+    PodcastRequest,
+    PodcastResponse,
+    DialogueLine,
+    DialogueUpdateRequest,
+    DialogueUpdateResponse,
+)
 
-__all__ = ["PodcastRequest", "PodcastResponse"]
+__all__ = [
+    "PodcastRequest",
+    "PodcastResponse",
+    "DialogueLine",
+    "DialogueUpdateRequest",
+    "DialogueUpdateResponse",
+]
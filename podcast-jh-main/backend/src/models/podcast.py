@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Literal
 
 
@@ -13,6 +13,8 @@ class PodcastRequest(BaseModel):
     num_speakers: Optional[int] = 2  # 화자 수 (2 또는 3)
     custom_voices: Optional[Dict[str, str]] = None  # 사용자 정의 화자 매핑 (예: {"화자A": "rachel", "화자B": "adam"})
     style: Optional[Literal["casual", "professional", "educational", "storytelling"]] = "casual"  # 팟캐스트 스타일
+    background_music: Optional[str] = None  # 배경음악 트랙 이름 (GET /music 목록의 name, 없으면 음성만)
+    music_volume: Optional[float] = Field(0.1, ge=0.0, le=1.0)  # 배경음악 크기 (0~1, 0.1은 약 -18dB)
 
 
 class PodcastResponse(BaseModel):
@@ -25,3 +27,27 @@ class PodcastResponse(BaseModel):
     title: Optional[str] = None
     dialogue_count: Optional[int] = None
     speakers_used: Optional[List[str]] = None
+
+
+class DialogueLine(BaseModel):
+    """대사 한 줄 (speaker는 음성 이름, 예: 'rachel')"""
+    speaker: str
+    text: str
+
+
+class DialogueUpdateRequest(BaseModel):
+    """수정된 대사 목록으로 기존 팟캐스트를 다시 렌더링하는 요청 모델"""
+    dialogues: List[DialogueLine]
+
+
+class DialogueUpdateResponse(BaseModel):
+    """대사 수정 렌더링 응답 모델"""
+    podcast_id: str
+    status: str
+    message: str
+    unchanged: int  # 변경 없이 유지된 대사 수
+    changed: int  # 수정되거나 새로 추가된 대사 수
+    removed: int  # 삭제된 대사 수
+    synthesized: int  # 실제로 TTS를 호출한 대사 수
+    dialogue_count: int
+    total_duration: float
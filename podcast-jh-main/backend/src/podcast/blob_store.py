@@ -0,0 +1,315 @@
+"""
+콘텐츠 주소 기반 산출물 저장소 (중복 제거, 참조 카운트)
+
+같은 오디오가 여러 작업에 반복해서 생깁니다 (같은 요청의 재실행, 여러 에피소드에 쓰인 같은 대사 오디오 등).
+완성된 산출물(podcast.mp3, 렌디션, 대사별 오디오, 파형/대사 인덱스)은 SHA-256 해시를 키로 한 블롭으로 한 번만
+저장하고, 작업 디렉토리에는 이름 → 해시를 기록한 manifest.json을 둡니다. 블롭마다 몇 개의 매니페스트 항목이
+참조하는지 세어 두었다가 마지막 참조가 사라지면 블롭을 지웁니다.
+
+- BlobBackend: 블롭 저장 위치 인터페이스 (오브젝트 스토리지 등은 이 클래스를 구현)
+- LocalBlobBackend: 로컬/공유 파일시스템 (<BLOB_DIRECTORY>/ab/cd/<해시>)
+- BlobIndex: 블롭별 참조 수 (SQLite, 여러 워커/노드가 공유)
+
+로컬 백엔드에서는 작업 디렉토리의 파일을 블롭에 대한 하드링크로 바꾸므로 디스크에는 한 벌만 남고, 작업
+디렉토리의 파일을 읽는 기존 경로(다시 렌더링, 정적 파일 HLS 등)도 그대로 동작합니다. 하드링크는 같은 inode를
+공유하므로 산출물은 제자리에서 고쳐 쓰지 않고 항상 새 파일을 만든 뒤 os.replace로 교체해야 합니다.
+"""
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from src.utils.files import atomic_write_json
+
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+BLOB_BACKENDS = ("local", "off")
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """파일 내용의 SHA-256 (16진수)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobBackend:
+    """블롭 저장 위치 인터페이스
+
+    오브젝트 스토리지 백엔드는 exists/put/open/delete를 구현하면 됩니다. local_path는 블롭이 로컬 파일로
+    있을 때만 경로를 돌려주며, 이 경우 작업 디렉토리의 파일을 하드링크로 바꾸고 다운로드도 파일로 바로 보냅니다.
+    """
+
+    def exists(self, digest: str) -> bool:
+        raise NotImplementedError
+
+    def put(self, digest: str, source: Path) -> None:
+        """source 파일을 digest 블롭으로 저장 (이미 있으면 덮어써도 내용이 같음)"""
+        raise NotImplementedError
+
+    def open(self, digest: str) -> BinaryIO:
+        """블롭 읽기 스트림 (seek 가능해야 대사 구간 재생에 쓸 수 있음)"""
+        raise NotImplementedError
+
+    def delete(self, digest: str) -> None:
+        """블롭 삭제 (없으면 무시)"""
+        raise NotImplementedError
+
+    def local_path(self, digest: str) -> Optional[Path]:
+        return None
+
+
+class LocalBlobBackend(BlobBackend):
+    """파일시스템 블롭 저장소 (해시 앞 4자리로 두 단계 디렉토리를 나눔)
+
+    작업 디렉토리와 같은 파일시스템에 있어야 하드링크로 중복을 없앨 수 있습니다 (다르면 복사본이 남음).
+
+    Args:
+        root: 블롭 디렉토리
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+    def put(self, digest: str, source: Path) -> None:
+        target = self._path(digest)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            # 같은 파일시스템이면 복사하지 않고 원본 inode를 블롭으로 사용
+            os.link(source, temp_path)
+        except OSError:
+            shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+
+    def open(self, digest: str) -> BinaryIO:
+        return open(self._path(digest), 'rb')
+
+    def delete(self, digest: str) -> None:
+        self._path(digest).unlink(missing_ok=True)
+
+    def local_path(self, digest: str) -> Optional[Path]:
+        return self._path(digest)
+
+
+class BlobIndex:
+    """블롭별 참조 수 (SQLite WAL, 연결은 스레드별로 하나)
+
+    참조를 늘리는 쪽은 트랜잭션 후에 블롭을 저장하고, 줄이는 쪽은 참조가 0이 된 블롭을 같은 트랜잭션 안에서
+    지웁니다. 그래서 다른 워커가 막 참조를 늘린 블롭이 지워지는 일이 없습니다.
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            "digest TEXT PRIMARY KEY, size INTEGER NOT NULL, refs INTEGER NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, counts: Dict[str, int], sizes: Dict[str, int]) -> None:
+        """블롭별 참조 수 증가 (처음 보는 블롭은 추가)"""
+        if not counts:
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO blobs (digest, size, refs) VALUES (?, ?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET refs = blobs.refs + excluded.refs",
+                [(digest, sizes[digest], count) for digest, count in counts.items()]
+            )
+
+    def release(self, counts: Dict[str, int], delete: Callable[[str], None]) -> int:
+        """블롭별 참조 수 감소, 참조가 없어진 블롭은 delete로 삭제
+
+        Returns:
+            삭제한 블롭 크기 합계
+        """
+        if not counts:
+            return 0
+        freed = 0
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for digest, count in counts.items():
+                conn.execute("UPDATE blobs SET refs = refs - ? WHERE digest = ?", (count, digest))
+                row = conn.execute("SELECT size, refs FROM blobs WHERE digest = ?", (digest,)).fetchone()
+                if row is None or row[1] > 0:
+                    continue
+                conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                delete(digest)
+                freed += row[0]
+        return freed
+
+
+class BlobStore:
+    """작업 디렉토리 매니페스트와 블롭 저장소
+
+    Args:
+        backend: 블롭 저장 위치
+        index: 블롭별 참조 수
+    """
+
+    def __init__(self, backend: BlobBackend, index: BlobIndex):
+        self.backend = backend
+        self.index = index
+
+    def read_manifest(self, output_dir: Path) -> Dict[str, dict]:
+        """작업 디렉토리의 매니페스트 ({이름: {"digest", "size"}}, 없으면 빈 딕셔너리)"""
+        try:
+            with open(output_dir / MANIFEST_FILENAME, 'r', encoding='utf-8') as f:
+                return json.load(f)["files"]
+        except FileNotFoundError:
+            return {}
+
+    def _is_blob(self, path: Path, digest: str) -> bool:
+        """작업 디렉토리의 파일이 이미 블롭의 하드링크인지 (다시 해시하지 않아도 되는지)"""
+        blob_path = self.backend.local_path(digest)
+        try:
+            return blob_path is not None and os.path.samefile(path, blob_path)
+        except FileNotFoundError:
+            return False
+
+    def _link(self, path: Path, digest: str):
+        """작업 디렉토리의 파일을 블롭에 대한 하드링크로 교체 (로컬 백엔드에서만)"""
+        blob_path = self.backend.local_path(digest)
+        if blob_path is None or self._is_blob(path, digest):
+            return
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.link")
+        try:
+            os.link(blob_path, temp_path)
+            os.replace(temp_path, path)
+        except OSError as e:
+            # 다른 파일시스템 등: 복사본을 그대로 둠
+            temp_path.unlink(missing_ok=True)
+            logger.debug(f"블롭 하드링크 실패, 복사본 유지: {path} - {str(e)}")
+
+    def commit(self, output_dir: Path, names: List[str]) -> Dict[str, int]:
+        """작업 디렉토리의 산출물을 블롭으로 저장하고 매니페스트 교체
+
+        이전 매니페스트와 같은 블롭을 가리키는 파일은 다시 해시하지 않으며, 새 매니페스트에서 빠진 블롭의
+        참조는 매니페스트를 교체한 뒤에 줄입니다 (중간에 중단되면 참조가 남을 뿐 쓰이는 블롭이 지워지지는 않음).
+
+        Args:
+            output_dir: 작업 디렉토리
+            names: 매니페스트에 넣을 작업 디렉토리 기준 상대 경로
+
+        Returns:
+            {"stored": 새로 저장한 바이트, "deduplicated": 이미 있던 블롭을 참조한 바이트, "freed": 삭제한 블롭 바이트}
+        """
+        previous = self.read_manifest(output_dir)
+        files: Dict[str, dict] = {}
+        for name in names:
+            path = output_dir / name
+            entry = previous.get(name)
+            if entry is None or not self._is_blob(path, entry["digest"]):
+                entry = {"digest": file_digest(path), "size": path.stat().st_size}
+            files[name] = entry
+
+        new_counts = Counter(entry["digest"] for entry in files.values())
+        old_counts = Counter(entry["digest"] for entry in previous.values())
+        added = new_counts - old_counts
+        self.index.acquire(added, {entry["digest"]: entry["size"] for entry in files.values()})
+
+        stored = deduplicated = 0
+        try:
+            for name, entry in files.items():
+                digest = entry["digest"]
+                if not self.backend.exists(digest):
+                    self.backend.put(digest, output_dir / name)
+                    stored += entry["size"]
+                elif previous.get(name, {}).get("digest") != digest:
+                    deduplicated += entry["size"]
+                self._link(output_dir / name, digest)
+            atomic_write_json(output_dir / MANIFEST_FILENAME, {"version": MANIFEST_VERSION, "files": files})
+        except Exception:
+            self.index.release(added, self.backend.delete)
+            raise
+
+        freed = self.index.release(old_counts - new_counts, self.backend.delete)
+        return {"stored": stored, "deduplicated": deduplicated, "freed": freed}
+
+    def release(self, output_dir: Path) -> int:
+        """작업 디렉토리를 지우기 전에 매니페스트의 참조 해제
+
+        Returns:
+            삭제한 블롭 크기 합계 (다른 작업이 참조하는 블롭은 남음)
+        """
+        manifest = self.read_manifest(output_dir)
+        freed = self.index.release(Counter(entry["digest"] for entry in manifest.values()), self.backend.delete)
+        (output_dir / MANIFEST_FILENAME).unlink(missing_ok=True)
+        return freed
+
+    def lookup(self, output_dir: Path, name: str) -> Optional[dict]:
+        """다운로드할 산출물의 매니페스트 항목
+
+        매니페스트를 갱신하기 전에 중단된 다시 렌더링처럼 작업 디렉토리의 파일이 매니페스트 이후 바뀌었으면
+        None을 돌려주어 작업 디렉토리의 파일을 쓰게 합니다.
+        """
+        entry = self.read_manifest(output_dir).get(name)
+        if entry is None:
+            return None
+        path = output_dir / name
+        if self.backend.local_path(entry["digest"]) is not None:
+            return entry if self._is_blob(path, entry["digest"]) else None
+        try:
+            return entry if path.stat().st_size == entry["size"] else None
+        except FileNotFoundError:
+            return entry
+
+    def iter_blob(self, digest: str) -> Iterator[bytes]:
+        """블롭을 CHUNK_SIZE 단위로 읽음 (StreamingResponse용)"""
+        with self.backend.open(digest) as f:
+            while chunk := f.read(CHUNK_SIZE):
+                yield chunk
+
+    def read_range(self, digest: str, start: int, end: int) -> bytes:
+        """블롭의 [start, end) 바이트"""
+        with self.backend.open(digest) as f:
+            f.seek(start)
+            return f.read(end - start)
+
+
+def create_blob_store(settings) -> Optional[BlobStore]:
+    """설정(BLOB_BACKEND)에 맞는 블롭 저장소 생성 (off면 None)"""
+    if settings.blob_backend == "off":
+        return None
+    if settings.blob_backend != "local":
+        raise ValueError(f"지원하지 않는 BLOB_BACKEND: {settings.blob_backend} (사용 가능: {', '.join(BLOB_BACKENDS)})")
+
+    root = Path(settings.blob_directory or Path(settings.output_directory) / ".blobs")
+    logger.info(f"블롭 저장소 사용: {root}")
+    return BlobStore(LocalBlobBackend(root), BlobIndex(root / "index.db"))
@@ -1,18 +1,130 @@
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
+import asyncio
+import difflib
+import json
+import os
 import re
+import shutil
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager
 from loguru import logger
 
 from src.llm.openai_client import OpenAIClient
+from src.tts import audio_ops
 from src.tts.engine import TTSEngine
-from src.utils.config import Settings
+from src.utils.config import Settings, get_settings
 from src.utils.url_parser import parse_url_to_text
+from src.utils.files import atomic_write_json, atomic_write_text
+from src.utils.metrics import (
+    BLOB_DEDUPLICATED_BYTES, BLOB_STORED_BYTES, GC_DELETED, GC_RECLAIMED_BYTES, JOBS_IN_FLIGHT, JOBS_TOTAL,
+    OUTPUT_BYTES, STAGE_SECONDS
+)
+from src.utils.tracing import span, start_trace, token_totals
+from src.podcast.pipeline import MISSING, Checkpoint, Pipeline, Stage, TextCheckpoint
+from src.podcast import retention
+from src.podcast.blob_store import create_blob_store
+from src.podcast.state_backend import create_state_backend
+from src.podcast.status_store import JobStatusStore
+
+JOB_FILENAME = "job.json"
+LINES_DIRNAME = "lines"
+RAW_AUDIO_FILENAME = "podcast_raw.mp3"
+# 대사별 podcast.mp3 바이트 구간 인덱스 (/podcasts/{id}/lines/{index}/audio)
+LINE_INDEX_FILENAME = "line_index.json"
+
+
+class LeaseConflict(RuntimeError):
+    """다른 워커가 같은 임대를 가지고 있음 (라우트에서는 다른 RuntimeError처럼 409로 응답)"""
+
+
+def _content_filename(content_type: str) -> str:
+    return f"{content_type}_content.txt"
+
+
+def _content_marker(content_type: str) -> str:
+    return f"=== 추출된 {content_type.upper()} 내용 ===\n\n"
+
+
+class KeyContentCheckpoint(TextCheckpoint):
+    """핵심 내용 추출 결과 체크포인트 (주제 기반 작업은 LLM 호출이 없으므로 저장하지 않음)"""
 
-class PodcastGenerator:
     def __init__(self):
-        self.settings = Settings()
-        self.llm_client = OpenAIClient()
-        self.tts_engine = TTSEngine()
+        super().__init__("key_content.txt")
+
+    def load(self, context: dict):
+        if context.get("content") is None and not context.get("url"):
+            return MISSING
+        return super().load(context)
+
+    def save(self, context: dict, value: str):
+        if context.get("content") is None and not context.get("url"):
+            return
+        super().save(context, value)
+
+
+class DialogueMetadataCheckpoint(Checkpoint):
+    """TTS 단계 체크포인트: 병합된 오디오와 dialogue_metadata.json
+
+    병합 원본(podcast_raw.mp3) 또는 후처리가 끝난 podcast.mp3 중 하나라도 있어야 복원합니다.
+    """
+
+    def load(self, context: dict):
+        output_dir: Path = context["output_dir"]
+        metadata_path = output_dir / "dialogue_metadata.json"
+        raw_audio_path = output_dir / RAW_AUDIO_FILENAME
+
+        if not metadata_path.exists():
+            return MISSING
+        if not raw_audio_path.exists() and not (output_dir / "podcast.mp3").exists():
+            return MISSING
+
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            return raw_audio_path, json.load(f)["dialogues"]
+
+    def save(self, context: dict, value):
+        _, dialogue_metadata = value
+        metadata = {"podcast_id": context["podcast_id"], "content_type": context["content_type"]}
+        if context.get("original_filename"):
+            metadata["original_filename"] = context["original_filename"]
+        metadata.update({
+            "total_duration": dialogue_metadata[-1]["end_time"] if dialogue_metadata else 0,
+            "dialogue_count": len(dialogue_metadata),
+            "dialogues": dialogue_metadata
+        })
+        atomic_write_json(context["output_dir"] / "dialogue_metadata.json", metadata)
+
+
+class FinalAudioCheckpoint(Checkpoint):
+    """후처리 단계 체크포인트: 완성된 podcast.mp3"""
+
+    def load(self, context: dict):
+        audio_path = context["output_dir"] / "podcast.mp3"
+        return audio_path if audio_path.exists() else MISSING
+
+
+class PodcastGenerator:
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        llm_client: Optional[OpenAIClient] = None,
+        tts_engine: Optional[TTSEngine] = None
+    ):
+        self.settings = settings or get_settings()
+        self.output_root = Path(self.settings.output_directory)
+        self.status_store = JobStatusStore(create_state_backend(self.settings))
+        # 임대(lease) 소유자 식별자 (같은 호스트의 여러 워커도 구분)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._active_jobs: set = set()
+        self.llm_client = llm_client or OpenAIClient(self.settings)
+        self.tts_engine = tts_engine or TTSEngine(self.settings)
+        self.pipeline = self._build_pipeline()
+        self._background_tasks: set = set()
+        self._rerender_locks: Dict[str, asyncio.Lock] = {}
+        self.access_tracker = retention.AccessTracker(self.output_root)
+        self.blob_store = create_blob_store(self.settings)
 
     def _parse_dialogue_script(
         self,
@@ -74,6 +186,429 @@ class PodcastGenerator:
 
         return dialogue_list
 
+    def _build_pipeline(self) -> Pipeline:
+        """URL/주제/PDF 경로가 공유하는 생성 단계 그래프
+
+        source → script ─┬→ title
+                         └→ dialogues → tts → enhance
+
+        LLM/TTS 결과가 남는 단계는 output/<id>에 체크포인트를 남기므로,
+        중단된 작업을 재개할 때 이미 비용을 지불한 호출은 반복되지 않습니다.
+        """
+        return Pipeline([
+            Stage("source", self._stage_source, checkpoint=KeyContentCheckpoint()),
+            Stage("script", self._stage_script, depends_on=["source"],
+                  message="대화 스크립트 생성 중...", progress=25,
+                  checkpoint=TextCheckpoint("script.txt")),
+            Stage("title", self._stage_title, depends_on=["script"],
+                  message="제목 생성 중...", progress=40,
+                  checkpoint=TextCheckpoint("title.txt")),
+            Stage("dialogues", self._stage_dialogues, depends_on=["script"],
+                  message="대화 스크립트 파싱 중...", progress=50),
+            Stage("tts", self._stage_tts, depends_on=["dialogues"], progress=60,
+                  checkpoint=DialogueMetadataCheckpoint()),
+            Stage("enhance", self._stage_enhance, depends_on=["tts"],
+                  message="오디오 후처리 중...", progress=90,
+                  checkpoint=FinalAudioCheckpoint()),
+        ])
+
+    async def _stage_source(self, ctx: dict) -> str:
+        """스크립트 생성에 사용할 콘텐츠 준비 (PDF/URL은 핵심 내용 추출)"""
+        podcast_id = ctx["podcast_id"]
+        output_dir: Path = ctx["output_dir"]
+
+        if ctx.get("content") is not None:
+            content = ctx["content"]
+            logger.info(f"콘텐츠 기반 팟캐스트 생성 시작: {podcast_id} - 타입: {ctx['content_type']}, 길이: {len(content)} 문자")
+
+            # OpenAI로 핵심 내용 추출
+            self._update_status(podcast_id, "핵심 내용 추출 중...", 10)
+            key_content = await self.llm_client.extract_key_content(content)
+            logger.info(f"핵심 내용 추출 완료: {len(key_content)} 문자")
+
+        elif ctx.get("url"):
+            url = ctx["url"]
+            self._update_status(podcast_id, "URL 콘텐츠 파싱 중...", 5)
+            logger.info(f"URL 기반 팟캐스트 생성 - URL: {url}")
+
+            try:
+                # 1. HTML에서 텍스트 추출 (requests는 블로킹이므로 스레드에서 실행)
+                with span("source.parse_url", kind="parse", url=url) as parse_span:
+                    raw_text = await asyncio.to_thread(parse_url_to_text, url)
+                    if parse_span:
+                        parse_span.set_attribute("chars", len(raw_text))
+                logger.info(f"URL 텍스트 추출 완료: {len(raw_text)} 문자")
+
+                # 2. OpenAI로 핵심 내용 추출
+                self._update_status(podcast_id, "핵심 내용 추출 중...", 10)
+                key_content = await self.llm_client.extract_key_content(raw_text)
+                logger.info(f"핵심 내용 추출 완료: {len(key_content)} 문자")
+
+                # 추출된 내용을 파일로 저장
+                atomic_write_text(
+                    output_dir / "url_content.txt",
+                    f"URL: {url}\n\n=== 추출된 핵심 내용 ===\n\n{key_content}"
+                )
+
+            except Exception as e:
+                logger.error(f"URL 파싱 실패: {str(e)}")
+                raise ValueError(f"URL에서 내용을 추출할 수 없습니다: {str(e)}")
+
+        elif ctx.get("topic"):
+            logger.info(f"주제 기반 팟캐스트 생성 - 주제: {ctx['topic']}")
+            return ctx["topic"]
+
+        else:
+            raise ValueError("topic 또는 url 중 하나는 필수입니다.")
+
+        return key_content
+
+    async def _stage_script(self, ctx: dict) -> str:
+        """LLM이 대화형 스크립트 생성 (화자A, 화자B, 화자C 형식)"""
+        content_for_script = ctx["source"]
+        logger.info(f"팟캐스트 스크립트 생성: {ctx['podcast_id']} - 컨텐츠: {content_for_script[:100]}..., 화자 수: {ctx['num_speakers']}, 턴 수: {ctx['turns']}")
+
+        return await self.llm_client.generate_podcast_script(
+            topic=content_for_script,
+            language=ctx["language"],
+            num_speakers=ctx["num_speakers"],
+            turns=ctx["turns"],
+            style=ctx["style"]
+        )
+
+    async def _stage_title(self, ctx: dict) -> str:
+        return await self.llm_client.generate_title(ctx["script"])
+
+    async def _stage_dialogues(self, ctx: dict) -> List[Dict[str, str]]:
+        """스크립트 파싱: "화자A: 대사" → [{"speaker": "rachel", "text": "대사"}]"""
+        dialogue_list = self._parse_dialogue_script(ctx["script"], ctx["num_speakers"], ctx["custom_voices"])
+        logger.info(f"총 {len(dialogue_list)}개의 대사로 구성된 대화형 팟캐스트 생성")
+        return dialogue_list
+
+    async def _stage_tts(self, ctx: dict) -> Tuple[Path, List[dict]]:
+        """다중 화자 대화형 오디오 생성 (대사별 오디오는 lines/에 체크포인트로 보관)"""
+        dialogue_list = ctx["dialogues"]
+        self._update_status(ctx["podcast_id"], f"다중 화자 오디오 생성 중... (대사 {len(dialogue_list)}개)", 60)
+        raw_audio_path = ctx["output_dir"] / RAW_AUDIO_FILENAME
+
+        _, dialogue_metadata = await self.tts_engine.generate_dialogue_podcast(
+            dialogue_script=dialogue_list,
+            language=ctx["language"],
+            tts_engine=ctx["tts_engine"],
+            output_path=str(raw_audio_path),
+            lines_dir=str(ctx["output_dir"] / LINES_DIRNAME)
+        )
+        return raw_audio_path, dialogue_metadata
+
+    async def _stage_enhance(self, ctx: dict) -> Path:
+        """후처리 (배경음악을 선택했으면 같은 인코딩에서 합성, 렌디션도 같은 PCM에서 함께 인코딩)"""
+        raw_audio_path, dialogue_metadata = ctx["tts"]
+        output_dir: Path = ctx["output_dir"]
+        audio_path = output_dir / "podcast.mp3"
+        enhanced_path = output_dir / "podcast_enhanced.mp3"
+        peaks_path = output_dir / "peaks.json"
+        enhanced_peaks_path = output_dir / "peaks_enhanced.json"
+        index_path = output_dir / LINE_INDEX_FILENAME
+        enhanced_index_path = output_dir / "line_index_enhanced.json"
+
+        # 렌디션은 임시 이름으로 만든 뒤 podcast.mp3보다 먼저 교체 (podcast.mp3가 있으면 렌디션도 완성된 것)
+        renditions = {}
+        for name in self.settings.audio_renditions:
+            target = Path(audio_ops.RENDITIONS[name])
+            staging = output_dir / f"{target.stem}_enhanced{target.suffix}"
+            if staging.is_dir():
+                shutil.rmtree(staging)
+            renditions[name] = (staging, output_dir / target)
+
+        options = {"peaks_path": str(enhanced_peaks_path)}
+        if renditions:
+            options["renditions"] = {name: str(staging) for name, (staging, _) in renditions.items()}
+        if ctx.get("background_music"):
+            options["music_path"] = self.tts_engine.resolve_music(ctx["background_music"])
+            options["music_volume"] = ctx.get("music_volume", 0.1)
+
+        if dialogue_metadata and all("gain_db" in entry for entry in dialogue_metadata):
+            # 병합 때 화자별 게인으로 목표 라우드니스를 맞췄으므로 페이드만 적용
+            options["gain_db"] = 0.0
+        else:
+            # 병합 때 기록한 대사별 최대 레벨로 정규화 게인 계산 (이전 작업처럼 없으면 후처리에서 분석)
+            peaks = [entry.get("peak_dbfs") for entry in dialogue_metadata]
+            options["peak_dbfs"] = max(peaks) if peaks and None not in peaks else None
+        await self.tts_engine.enhance_audio(str(raw_audio_path), str(enhanced_path), **options)
+        await self.tts_engine.index_line_audio(str(enhanced_path), dialogue_metadata, str(enhanced_index_path))
+
+        # 여기부터 게시된 산출물을 교체하므로 실패하면 렌디션/파형/인덱스와 podcast.mp3가 어긋날 수 있음
+        ctx["artifacts_replaced"] = True
+        for staging, target in renditions.values():
+            if staging.is_dir():
+                # 디렉토리는 원자적으로 덮어쓸 수 없으므로 이전 HLS를 지운 뒤 이름 변경
+                shutil.rmtree(target, ignore_errors=True)
+            os.replace(staging, target)
+        # 파형 피크와 대사 인덱스도 podcast.mp3보다 먼저 교체 (새 오디오에 이전 파형/바이트 구간이 쓰이지 않도록)
+        os.replace(enhanced_peaks_path, peaks_path)
+        os.replace(enhanced_index_path, index_path)
+        # 설정에서 빠진 렌디션이 이전 렌더링에 남아 있으면 수정 전 오디오가 제공되지 않도록 삭제
+        for name, target in audio_ops.RENDITIONS.items():
+            stale = output_dir / target
+            if name in renditions:
+                continue
+            if stale.is_dir():
+                shutil.rmtree(stale)
+            elif stale.exists():
+                stale.unlink()
+
+        # podcast.mp3는 항상 완성된 파일만 가리키도록 교체 후 원본 삭제
+        os.replace(enhanced_path, audio_path)
+        raw_audio_path.unlink(missing_ok=True)
+        await self._publish_artifacts(output_dir)
+        return audio_path
+
+    def _artifact_names(self, output_dir: Path) -> List[str]:
+        """블롭 저장소에 넣을 완성된 산출물 (작업 디렉토리 기준 상대 경로)"""
+        names = ["podcast.mp3", "peaks.json", LINE_INDEX_FILENAME]
+        for target in audio_ops.RENDITIONS.values():
+            path = output_dir / target
+            if path.is_dir():
+                names.extend(f"{target}/{child.name}" for child in sorted(path.iterdir()))
+            else:
+                names.append(target)
+        names.extend(
+            f"{LINES_DIRNAME}/{path.name}" for path in sorted((output_dir / LINES_DIRNAME).glob("*.mp3"))
+            if not path.name.endswith(".part.mp3")
+        )
+        return [name for name in names if (output_dir / name).is_file()]
+
+    async def _publish_artifacts(self, output_dir: Path):
+        """완성된 산출물을 블롭 저장소에 넣고 manifest.json 갱신 (같은 내용은 한 벌만 저장)"""
+        if self.blob_store is None:
+            return
+        with span("blobs.commit", kind="storage") as commit_span:
+            names = self._artifact_names(output_dir)
+            result = await asyncio.to_thread(self.blob_store.commit, output_dir, names)
+            if commit_span:
+                commit_span.set_attribute("files", len(names))
+                commit_span.set_attribute("stored_bytes", result["stored"])
+                commit_span.set_attribute("deduplicated_bytes", result["deduplicated"])
+        BLOB_STORED_BYTES.inc(result["stored"])
+        BLOB_DEDUPLICATED_BYTES.inc(result["deduplicated"])
+        logger.debug(
+            f"산출물 블롭 저장: {output_dir.name} - 파일 {len(names)}개, 새로 저장 {result['stored'] / 1024 ** 2:.1f}MB, "
+            f"중복 {result['deduplicated'] / 1024 ** 2:.1f}MB, 해제 {result['freed'] / 1024 ** 2:.1f}MB"
+        )
+
+    def _save_job(self, output_dir: Path, job: dict):
+        """재개에 필요한 작업 파라미터와 원본 콘텐츠 저장"""
+        content = job.get("content")
+        if content is not None:
+            content_path = output_dir / _content_filename(job["content_type"])
+            if not content_path.exists():
+                lines = []
+                if job.get("original_filename"):
+                    lines.append(f"원본 파일명: {job['original_filename']}\n\n")
+                lines.append(_content_marker(job["content_type"]))
+                lines.append(content)
+                atomic_write_text(content_path, "".join(lines))
+
+        atomic_write_json(
+            output_dir / JOB_FILENAME,
+            {key: value for key, value in job.items() if key != "content"}
+        )
+
+    def _load_job(self, output_dir: Path) -> dict:
+        """저장된 작업 파라미터와 원본 콘텐츠 복원"""
+        with open(output_dir / JOB_FILENAME, 'r', encoding='utf-8') as f:
+            job = json.load(f)
+
+        if job.get("content_type") not in ("url", "topic"):
+            with open(output_dir / _content_filename(job["content_type"]), 'r', encoding='utf-8') as f:
+                stored = f.read()
+            job["content"] = stored.split(_content_marker(job["content_type"]), 1)[-1]
+
+        return job
+
+    @asynccontextmanager
+    async def _lease(self, name: str):
+        """작업 임대 보유 (다른 워커/노드가 같은 작업을 동시에 처리하지 않도록)
+
+        보유하는 동안 TTL의 1/3 간격으로 연장하며, 이 워커가 죽으면 TTL 후 다른 워커가 가져갈 수 있습니다.
+
+        Raises:
+            LeaseConflict: 다른 워커가 임대를 가지고 있음
+        """
+        backend = self.status_store.backend
+        ttl = self.settings.job_lease_ttl
+
+        if not await asyncio.to_thread(backend.acquire_lease, name, self.worker_id, ttl):
+            raise LeaseConflict("다른 워커에서 처리 중인 작업입니다.")
+
+        async def heartbeat():
+            while True:
+                await asyncio.sleep(ttl / 3)
+                if not await asyncio.to_thread(backend.renew_lease, name, self.worker_id, ttl):
+                    logger.warning(f"작업 임대를 잃었습니다: {name}")
+
+        renewer = asyncio.create_task(heartbeat())
+        try:
+            yield
+        finally:
+            renewer.cancel()
+            await asyncio.to_thread(backend.release_lease, name, self.worker_id)
+
+    async def _run_pipeline(self, podcast_id: str, status_message: str = "팟캐스트 생성 시작...", **job) -> dict:
+        """작업 임대를 잡고 공유 파이프라인 실행
+
+        첫 상태는 set_async로 기록해 두므로, 이후 단계 콜백의 동기 상태 갱신은 공유 백엔드를 읽지 않습니다.
+        """
+        self._active_jobs.add(podcast_id)
+        try:
+            async with self._lease(f"job:{podcast_id}"):
+                await self._update_status_async(podcast_id, status_message)
+                return await self._execute_pipeline(podcast_id, **job)
+        finally:
+            self._active_jobs.discard(podcast_id)
+
+    async def _execute_pipeline(self, podcast_id: str, **job) -> dict:
+        """공유 파이프라인으로 팟캐스트 생성 후 결과 딕셔너리 반환"""
+        output_dir = self.output_root / podcast_id
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self._save_job(output_dir, job)
+
+        ctx = dict(job, podcast_id=podcast_id, output_dir=output_dir)
+        last_progress = {"value": 0}
+
+        def on_stage_start(stage: Stage):
+            # 동시에 실행되는 단계가 진행률을 되돌리지 않도록 증가할 때만 갱신
+            if stage.message and stage.progress >= last_progress["value"]:
+                last_progress["value"] = stage.progress
+                self._update_status(podcast_id, stage.message, stage.progress)
+            # script 단계의 체크포인트(script.txt)는 후속 단계가 시작되기 전에 저장됨
+            if "script" in stage.depends_on:
+                self.status_store.mark_files(podcast_id, script=True)
+
+        JOBS_IN_FLIGHT.inc()
+        try:
+            with start_trace(podcast_id, "podcast.generate", output_dir,
+                             content_type=job.get("content_type"), turns=job.get("turns"),
+                             num_speakers=job.get("num_speakers"), language=job.get("language")) as trace:
+                timings = await self.pipeline.run(ctx, on_stage_start=on_stage_start)
+        except Exception as e:
+            JOBS_TOTAL.labels(outcome="failed").inc()
+            await self._update_status_async(podcast_id, f"오류: {str(e)}")
+            await self.status_store.flush()
+            logger.error(f"팟캐스트 생성 실패: {podcast_id} - {str(e)}")
+            raise
+        finally:
+            JOBS_IN_FLIGHT.dec()
+
+        JOBS_TOTAL.labels(outcome="completed").inc()
+        for name, seconds in timings.items():
+            STAGE_SECONDS.labels(stage=name).observe(seconds)
+        await self.status_store.mark_files_async(podcast_id, script=True, audio=True)
+        await self._update_status_async(podcast_id, "완료", 100)
+        # 최종 상태는 응답 전에 파일까지 반영 (재시작 시 재개 대상에서 제외되도록)
+        await self.status_store.flush()
+
+        timing_summary = ", ".join(f"{name}={seconds:.2f}s" for name, seconds in timings.items())
+        # 이번 실행의 LLM 토큰 수 (재개한 작업은 체크포인트로 건너뛴 호출 제외)
+        llm_tokens = token_totals([item.to_dict() for item in trace.spans])
+        logger.info(
+            f"팟캐스트 생성 완료: {podcast_id} ({timing_summary}) - LLM 토큰 프롬프트 {llm_tokens['prompt']}"
+            f"(캐시 {llm_tokens['cached']}), 완성 {llm_tokens['completion']}"
+        )
+
+        dialogue_list = ctx["dialogues"]
+        return {
+            "podcast_id": podcast_id,
+            "status": "completed",
+            "script_path": str(output_dir / "script.txt"),
+            "audio_path": str(ctx["enhance"]),
+            "title": ctx["title"],
+            "dialogue_count": len(dialogue_list),
+            "speakers_used": list(set(d["speaker"] for d in dialogue_list)),
+            "stage_timings": timings,
+            "llm_tokens": llm_tokens
+        }
+
+    async def resume_podcast(self, podcast_id: str) -> dict:
+        """중단된 작업을 마지막으로 완료된 단계부터 재개"""
+        output_dir = self.output_root / podcast_id
+        job = self._load_job(output_dir)
+
+        logger.info(f"중단된 팟캐스트 생성 재개: {podcast_id}")
+        return await self._run_pipeline(podcast_id, "중단된 작업 재개 중...", **job)
+
+    async def resume_interrupted_jobs(self) -> List[str]:
+        """서버 재시작 시 "processing" 상태로 남은 작업을 찾아 백그라운드에서 재개
+
+        작업 파라미터(job.json)가 없는 이전 버전의 작업은 재개할 수 없으므로 실패로 표시합니다.
+        다른 워커가 임대를 가진(처리 중인) 작업은 건너뜁니다.
+
+        Returns:
+            재개를 시작한 팟캐스트 ID 목록
+        """
+        output_dir = self.output_root
+        backend = self.status_store.backend
+        resumed: List[str] = []
+
+        if not output_dir.exists():
+            return resumed
+
+        # 공유 백엔드의 상태 조회와 임대는 스레드에서 실행 (주기적으로 도는 회수가 상태 조회 응답을 막지 않도록)
+        for podcast_id, record in await self.status_store.items_async():
+            if record.get("status") != "processing" or podcast_id in self._active_jobs:
+                continue
+
+            # 재개 태스크가 시작될 때 같은 소유자로 다시 획득(연장)됨
+            lease = f"job:{podcast_id}"
+            if not await asyncio.to_thread(backend.acquire_lease, lease, self.worker_id, self.settings.job_lease_ttl):
+                continue
+            if podcast_id in self._active_jobs:
+                # 기다리는 동안 이 워커에서 시작된 작업 (같은 소유자의 임대이므로 해제하지 않음)
+                continue
+
+            if not await asyncio.to_thread((output_dir / podcast_id / JOB_FILENAME).exists):
+                await asyncio.to_thread(backend.release_lease, lease, self.worker_id)
+                await self._update_status_async(podcast_id, "오류: 서버 재시작으로 작업이 중단되었습니다.")
+                continue
+
+            self._active_jobs.add(podcast_id)
+            task = asyncio.create_task(self._resume_in_background(podcast_id))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            resumed.append(podcast_id)
+
+        if resumed:
+            logger.info(f"중단된 작업 {len(resumed)}개 재개: {resumed}")
+        return resumed
+
+    async def _resume_in_background(self, podcast_id: str):
+        try:
+            await self.resume_podcast(podcast_id)
+        except Exception as e:
+            # _run_pipeline에서 이미 실패 상태로 기록됨
+            logger.error(f"작업 재개 실패: {podcast_id} - {str(e)}")
+        finally:
+            # job.json 읽기 실패 등으로 _run_pipeline에 도달하지 못한 경우에도 정리
+            self._active_jobs.discard(podcast_id)
+            await asyncio.to_thread(self.status_store.backend.release_lease, f"job:{podcast_id}", self.worker_id)
+
+    async def reclaim_interrupted_jobs(self):
+        """공유 상태 백엔드에서 주기적으로 중단된 작업 회수
+
+        다른 워커/노드가 죽어 임대가 만료된 "processing" 작업을 이 워커가 이어서 처리합니다.
+        단일 워커(file 백엔드)에서는 시작 시 resume_interrupted_jobs 한 번으로 충분하므로 바로 종료합니다.
+        """
+        if not self.status_store.backend.shared:
+            return
+
+        while True:
+            await asyncio.sleep(self.settings.job_lease_ttl)
+            try:
+                await self.status_store.flush()
+                await self.resume_interrupted_jobs()
+            except Exception as e:
+                logger.error(f"중단된 작업 회수 실패: {str(e)}")
+
     async def generate_podcast_from_content(
         self,
         podcast_id: str,
@@ -85,7 +620,9 @@ class PodcastGenerator:
         num_speakers: int = 2,
         custom_voices: Optional[Dict[str, str]] = None,
         turns: int = 8,
-        style: str = "casual"
+        style: str = "casual",
+        background_music: Optional[str] = None,
+        music_volume: float = 0.1
     ) -> dict:
         """콘텐츠(PDF 텍스트 등)에서 팟캐스트 생성
 
@@ -99,112 +636,23 @@ class PodcastGenerator:
             num_speakers: 화자 수 (2 또는 3)
             custom_voices: 사용자 정의 화자 매핑
             turns: 대화 턴 수
+            background_music: 배경음악 트랙 이름 (MUSIC_DIRECTORY 안의 파일, 없으면 음성만)
+            music_volume: 배경음악 크기 (0~1)
         """
-        try:
-            output_dir = Path(f"output/{podcast_id}")
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            logger.info(f"콘텐츠 기반 팟캐스트 생성 시작: {podcast_id} - 타입: {content_type}, 길이: {len(content)} 문자")
-
-            # 원본 콘텐츠 저장
-            if content_type == "pdf":
-                self._update_status(podcast_id, "PDF 내용 처리 중...", 5)
-                content_path = output_dir / "pdf_content.txt"
-                with open(content_path, 'w', encoding='utf-8') as f:
-                    if original_filename:
-                        f.write(f"원본 파일명: {original_filename}\n\n")
-                    f.write("=== 추출된 PDF 내용 ===\n\n")
-                    f.write(content)
-
-            # OpenAI로 핵심 내용 추출
-            self._update_status(podcast_id, "핵심 내용 추출 중...", 10)
-            key_content = await self.llm_client.extract_key_content(content)
-            logger.info(f"핵심 내용 추출 완료: {len(key_content)} 문자")
-
-            # 추출된 핵심 내용 저장
-            key_content_path = output_dir / "key_content.txt"
-            with open(key_content_path, 'w', encoding='utf-8') as f:
-                f.write(key_content)
-
-            # 대화 스크립트 생성
-            self._update_status(podcast_id, "대화 스크립트 생성 중...", 25)
-            logger.info(f"팟캐스트 스크립트 생성 - 화자 수: {num_speakers}, 턴 수: {turns}")
-
-            script = await self.llm_client.generate_podcast_script(
-                topic=key_content,
-                language=language,
-                num_speakers=num_speakers,
-                turns=turns,
-                style=style
-            )
-
-            script_path = output_dir / "script.txt"
-            with open(script_path, 'w', encoding='utf-8') as f:
-                f.write(script)
-
-            self._update_status(podcast_id, "제목 생성 중...", 40)
-            title = await self.llm_client.generate_title(script)
-
-            title_path = output_dir / "title.txt"
-            with open(title_path, 'w', encoding='utf-8') as f:
-                f.write(title)
-
-            # 스크립트 파싱
-            self._update_status(podcast_id, "대화 스크립트 파싱 중...", 50)
-            dialogue_list = self._parse_dialogue_script(script, num_speakers, custom_voices)
-
-            logger.info(f"총 {len(dialogue_list)}개의 대사로 구성된 대화형 팟캐스트 생성")
-
-            # 다중 화자 대화형 오디오 생성
-            self._update_status(podcast_id, f"다중 화자 오디오 생성 중... (대사 {len(dialogue_list)}개)", 60)
-            audio_path = output_dir / "podcast.mp3"
-
-            audio_file, dialogue_metadata = await self.tts_engine.generate_dialogue_podcast(
-                dialogue_script=dialogue_list,
-                language=language,
-                tts_engine=tts_engine,
-                output_path=str(audio_path)
-            )
-
-            # 타임스탬프 메타데이터 저장
-            metadata_path = output_dir / "dialogue_metadata.json"
-            import json
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "podcast_id": podcast_id,
-                    "content_type": content_type,
-                    "original_filename": original_filename,
-                    "total_duration": dialogue_metadata[-1]["end_time"] if dialogue_metadata else 0,
-                    "dialogue_count": len(dialogue_metadata),
-                    "dialogues": dialogue_metadata
-                }, f, ensure_ascii=False, indent=2)
-
-            self._update_status(podcast_id, "오디오 후처리 중...", 90)
-            enhanced_path = output_dir / "podcast_enhanced.mp3"
-            self.tts_engine.enhance_audio(str(audio_path), str(enhanced_path))
-
-            if enhanced_path.exists():
-                audio_path.unlink()
-                enhanced_path.rename(audio_path)
-
-            self._update_status(podcast_id, "완료", 100)
-
-            logger.info(f"콘텐츠 기반 팟캐스트 생성 완료: {podcast_id}")
-
-            return {
-                "podcast_id": podcast_id,
-                "status": "completed",
-                "script_path": str(script_path),
-                "audio_path": str(audio_path),
-                "title": title,
-                "dialogue_count": len(dialogue_list),
-                "speakers_used": list(set(d["speaker"] for d in dialogue_list))
-            }
-
-        except Exception as e:
-            self._update_status(podcast_id, f"오류: {str(e)}")
-            logger.error(f"콘텐츠 기반 팟캐스트 생성 실패: {podcast_id} - {str(e)}")
-            raise
+        return await self._run_pipeline(
+            podcast_id,
+            content=content,
+            content_type=content_type,
+            original_filename=original_filename,
+            language=language,
+            tts_engine=tts_engine,
+            num_speakers=num_speakers,
+            custom_voices=custom_voices,
+            turns=turns,
+            style=style,
+            background_music=background_music,
+            music_volume=music_volume
+        )
 
     async def generate_podcast(
         self,
@@ -216,7 +664,9 @@ class PodcastGenerator:
         num_speakers: int = 2,
         custom_voices: Optional[Dict[str, str]] = None,
         turns: int = 8,
-        style: str = "casual"
+        style: str = "casual",
+        background_music: Optional[str] = None,
+        music_volume: float = 0.1
     ) -> dict:
         """다중 화자 대화형 팟캐스트 자동 생성
 
@@ -232,161 +682,178 @@ class PodcastGenerator:
             num_speakers: 화자 수 (2 또는 3, 기본값: 2)
             custom_voices: 사용자 정의 화자 매핑 (예: {"화자A": "rachel", "화자B": "adam"})
             turns: 대화 턴 수 (기본값: 8, 약 1분)
+            background_music: 배경음악 트랙 이름 (MUSIC_DIRECTORY 안의 파일, 없으면 음성만)
+            music_volume: 배경음악 크기 (0~1)
         """
-        try:
-            output_dir = Path(f"output/{podcast_id}")
-            output_dir.mkdir(parents=True, exist_ok=True)
+        return await self._run_pipeline(
+            podcast_id,
+            topic=topic,
+            url=url,
+            content_type="url" if url else "topic",
+            language=language,
+            tts_engine=tts_engine,
+            num_speakers=num_speakers,
+            custom_voices=custom_voices,
+            turns=turns,
+            style=style,
+            background_music=background_music,
+            music_volume=music_volume
+        )
+
+    async def rerender_dialogues(self, podcast_id: str, dialogues: List[Dict[str, str]]) -> dict:
+        """수정된 대사 목록으로 기존 팟캐스트를 다시 렌더링
+
+        dialogue_metadata.json의 대사 목록과 비교하여 바뀐 대사만 TTS로 다시 합성하고,
+        나머지 대사는 lines/의 기존 오디오를 그대로 사용해 에피소드를 다시 조립합니다.
+        TTS 호출 수는 수정된 대사 수에만 비례합니다.
 
-            # 팟캐스트 생성을 위한 컨텐츠 준비
-            content_for_script = ""
-
-            # URL 기반 팟캐스트 생성
-            if url:
-                self._update_status(podcast_id, "URL 콘텐츠 파싱 중...", 5)
-                logger.info(f"URL 기반 팟캐스트 생성 - URL: {url}")
-
-                try:
-                    # 1. HTML에서 텍스트 추출
-                    raw_text = parse_url_to_text(url)
-                    logger.info(f"URL 텍스트 추출 완료: {len(raw_text)} 문자")
+        Args:
+            podcast_id: 팟캐스트 ID
+            dialogues: [{"speaker": "rachel", "text": "대사"}, ...] 형식의 전체 대사 목록
 
-                    # 2. OpenAI로 핵심 내용 추출
-                    self._update_status(podcast_id, "핵심 내용 추출 중...", 7)
-                    key_content = await self.llm_client.extract_key_content(raw_text)
-                    logger.info(f"핵심 내용 추출 완료: {len(key_content)} 문자")
+        Returns:
+            변경 요약과 새 메타데이터 정보
+        """
+        output_dir = self.output_root / podcast_id
+        metadata_path = output_dir / "dialogue_metadata.json"
+        audio_path = output_dir / "podcast.mp3"
 
-                    # 추출된 내용을 파일로 저장
-                    content_path = output_dir / "url_content.txt"
-                    with open(content_path, 'w', encoding='utf-8') as f:
-                        f.write(f"URL: {url}\n\n")
-                        f.write("=== 추출된 핵심 내용 ===\n\n")
-                        f.write(key_content)
+        if not metadata_path.exists() or not audio_path.exists():
+            raise FileNotFoundError("완료된 팟캐스트를 찾을 수 없습니다.")
 
-                    # URL 내용을 스크립트 생성에 사용
-                    content_for_script = key_content
+        lock = self._rerender_locks.setdefault(podcast_id, asyncio.Lock())
+        if lock.locked():
+            raise RuntimeError("이미 다시 렌더링 중인 팟캐스트입니다.")
+        if podcast_id in self._active_jobs:
+            raise RuntimeError("생성 중인 팟캐스트입니다.")
 
+        # 처리 중(processing) 상태가 되므로 job 임대도 잡아 다른 워커의 중단 작업 회수가 같은 디렉토리에서
+        # 파이프라인을 재개하지 않게 함 (delete_podcast와 같은 순서)
+        self._active_jobs.add(podcast_id)
+        try:
+            async with lock, self._lease(f"job:{podcast_id}"), self._lease(f"rerender:{podcast_id}"):
+                with open(metadata_path, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+                job = self._load_job(output_dir) if (output_dir / JOB_FILENAME).exists() else {}
+                language = job.get("language", "ko")
+
+                allowed_speakers = set((job.get("custom_voices") or {}).values()) or set(self.tts_engine.podcast_voices)
+                for dialogue in dialogues:
+                    if dialogue["speaker"] not in allowed_speakers:
+                        raise ValueError(f"알 수 없는 화자입니다: {dialogue['speaker']} (사용 가능: {', '.join(sorted(allowed_speakers))})")
+                    if not dialogue["text"].strip():
+                        raise ValueError("빈 대사는 허용되지 않습니다. 삭제하려면 목록에서 제거하세요.")
+
+                # 기존 대사와 비교
+                old_dialogues = metadata.get("dialogues", [])
+                old_lines = [(d["speaker"], d["text"]) for d in old_dialogues]
+                new_lines = [(d["speaker"], d["text"]) for d in dialogues]
+                matcher = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+
+                unchanged = sum(size for _, _, size in matcher.get_matching_blocks())
+                changed = len(new_lines) - unchanged
+                removed = len(old_lines) - unchanged
+
+                lines_dir = output_dir / LINES_DIRNAME
+                lines_dir.mkdir(parents=True, exist_ok=True)
+
+                # 대사별 오디오가 없는 이전 작업은 유지되는 대사 구간을 기존 에피소드에서 잘라 캐시로 사용
+                for old_start, _, size in matcher.get_matching_blocks():
+                    for old_index in range(old_start, old_start + size):
+                        old = old_dialogues[old_index]
+                        line_path = lines_dir / f"{self.tts_engine.line_key(old['speaker'], old['text'], language)}.mp3"
+                        if not line_path.exists():
+                            await self.tts_engine.extract_line_audio(
+                                str(audio_path), old["start_time"], old["end_time"], str(line_path)
+                            )
+
+                synthesized = sum(
+                    1 for speaker, text in new_lines
+                    if not (lines_dir / f"{self.tts_engine.line_key(speaker, text, language)}.mp3").exists()
+                )
+                logger.info(f"대사 수정 렌더링: {podcast_id} - 유지 {unchanged}, 변경 {changed}, 삭제 {removed}, 합성 {synthesized}")
+
+                ctx = {
+                    "podcast_id": podcast_id,
+                    "output_dir": output_dir,
+                    "content_type": metadata.get("content_type", job.get("content_type")),
+                    "original_filename": metadata.get("original_filename"),
+                    "language": language,
+                    "tts_engine": job.get("tts_engine", "elevenlabs"),
+                    "background_music": job.get("background_music"),
+                    "music_volume": job.get("music_volume", 0.1),
+                    "dialogues": dialogues,
+                }
+
+                previous = await self.status_store.get_async(podcast_id)
+                # 렌더링 단계의 동기 상태 갱신이 공유 백엔드를 읽지 않도록 상태를 먼저 이 워커의 메모리에 올림
+                await self._update_status_async(podcast_id, "대사 수정 렌더링 중...", 0)
+                try:
+                    with start_trace(podcast_id, "podcast.rerender", output_dir,
+                                     changed=changed, removed=removed, synthesized=synthesized):
+                        with span("stage.tts", kind="stage"):
+                            ctx["tts"] = await self._stage_tts(ctx)
+                        await self._update_status_async(podcast_id, "오디오 후처리 중...", 90)
+                        with span("stage.enhance", kind="stage"):
+                            await self._stage_enhance(ctx)
+                    DialogueMetadataCheckpoint().save(ctx, ctx["tts"])
                 except Exception as e:
-                    logger.error(f"URL 파싱 실패: {str(e)}")
-                    raise ValueError(f"URL에서 내용을 추출할 수 없습니다: {str(e)}")
-
-            # 주제 기반 팟캐스트 생성
-            elif topic:
-                logger.info(f"주제 기반 팟캐스트 생성 - 주제: {topic}")
-                content_for_script = topic
-
-            else:
-                raise ValueError("topic 또는 url 중 하나는 필수입니다.")
-
-            self._update_status(podcast_id, "대화 스크립트 생성 중...", 10)
-            logger.info(f"팟캐스트 생성 시작: {podcast_id} - 컨텐츠: {content_for_script[:100]}..., 화자 수: {num_speakers}, 턴 수: {turns}")
-
-            # LLM이 대화형 스크립트 생성 (화자A, 화자B, 화자C 형식)
-            script = await self.llm_client.generate_podcast_script(
-                topic=content_for_script,
-                language=language,
-                num_speakers=num_speakers,
-                turns=turns,
-                style=style
-            )
-
-            script_path = output_dir / "script.txt"
-            with open(script_path, 'w', encoding='utf-8') as f:
-                f.write(script)
-
-            self._update_status(podcast_id, "제목 생성 중...", 25)
-            title = await self.llm_client.generate_title(script)
-
-            title_path = output_dir / "title.txt"
-            with open(title_path, 'w', encoding='utf-8') as f:
-                f.write(title)
-
-            # 스크립트 파싱: "화자A: 대사" → [{"speaker": "rachel", "text": "대사"}]
-            self._update_status(podcast_id, "대화 스크립트 파싱 중...", 35)
-            dialogue_list = self._parse_dialogue_script(script, num_speakers, custom_voices)
-
-            logger.info(f"총 {len(dialogue_list)}개의 대사로 구성된 대화형 팟캐스트 생성")
-
-            # 다중 화자 대화형 오디오 생성
-            self._update_status(podcast_id, f"다중 화자 오디오 생성 중... (대사 {len(dialogue_list)}개)", 45)
-            audio_path = output_dir / "podcast.mp3"
-
-            audio_file, dialogue_metadata = await self.tts_engine.generate_dialogue_podcast(
-                dialogue_script=dialogue_list,
-                language=language,
-                tts_engine=tts_engine,
-                output_path=str(audio_path)
-            )
-
-            # 타임스탬프 메타데이터 저장
-            metadata_path = output_dir / "dialogue_metadata.json"
-            import json
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump({
+                    logger.error(f"대사 수정 렌더링 실패: {podcast_id} - {str(e)}")
+                    if ctx.get("artifacts_replaced"):
+                        # 산출물 일부만 새 렌더링으로 바뀌었으므로 완료로 표시하지 않음 (다시 수정 요청하면 복구됨)
+                        await self._update_status_async(podcast_id, f"오류: 대사 수정 렌더링 실패 - {str(e)}")
+                    else:
+                        # 게시된 산출물은 그대로이므로 렌더링 전 상태로 되돌림
+                        previous = previous or {"message": "완료", "progress": 100}
+                        await self._update_status_async(podcast_id, previous["message"], previous["progress"])
+                    await self.status_store.flush()
+                    raise
+
+                await self._update_status_async(podcast_id, "완료", 100)
+                await self.status_store.flush()
+
+                # 스크립트도 수정된 대사로 갱신 (음성 → 화자 레이블)
+                labels = {voice: label for label, voice in (job.get("custom_voices") or {}).items()}
+                script = "\n".join(f"{labels.get(d['speaker'], d['speaker'])}: {d['text']}" for d in dialogues)
+                atomic_write_text(output_dir / "script.txt", script)
+
+                _, dialogue_metadata = ctx["tts"]
+                return {
                     "podcast_id": podcast_id,
-                    "total_duration": dialogue_metadata[-1]["end_time"] if dialogue_metadata else 0,
+                    "unchanged": unchanged,
+                    "changed": changed,
+                    "removed": removed,
+                    "synthesized": synthesized,
                     "dialogue_count": len(dialogue_metadata),
-                    "dialogues": dialogue_metadata
-                }, f, ensure_ascii=False, indent=2)
-
-            self._update_status(podcast_id, "오디오 후처리 중...", 85)
-            enhanced_path = output_dir / "podcast_enhanced.mp3"
-            self.tts_engine.enhance_audio(str(audio_path), str(enhanced_path))
-
-            if enhanced_path.exists():
-                audio_path.unlink()
-                enhanced_path.rename(audio_path)
-
-            self._update_status(podcast_id, "완료", 100)
-
-            logger.info(f"다중 화자 팟캐스트 생성 완료: {podcast_id}")
-
-            return {
-                "podcast_id": podcast_id,
-                "status": "completed",
-                "script_path": str(script_path),
-                "audio_path": str(audio_path),
-                "title": title,
-                "dialogue_count": len(dialogue_list),
-                "speakers_used": list(set(d["speaker"] for d in dialogue_list))
-            }
-
-        except Exception as e:
-            self._update_status(podcast_id, f"오류: {str(e)}")
-            logger.error(f"팟캐스트 생성 실패: {podcast_id} - {str(e)}")
-            raise
+                    "total_duration": dialogue_metadata[-1]["end_time"] if dialogue_metadata else 0
+                }
+        finally:
+            self._active_jobs.discard(podcast_id)
 
     def _update_status(self, podcast_id: str, status: str, progress: int = 0):
-        import json
-        import time
-
-        status_path = Path(f"output/{podcast_id}/status.txt")
-        status_path.parent.mkdir(parents=True, exist_ok=True)
-
-        status_data = {
-            "status": "processing" if status != "완료" and not status.startswith("오류") else ("completed" if status == "완료" else "failed"),
-            "message": status,
-            "progress": progress,
-            "updated_at": time.time()
-        }
+        """작업 상태 갱신 (메모리에 즉시 반영, status.txt는 지연 기록)"""
+        self.status_store.set(podcast_id, status, progress)
 
-        with open(status_path, 'w', encoding='utf-8') as f:
-            json.dump(status_data, f, ensure_ascii=False, indent=2)
+    async def _update_status_async(self, podcast_id: str, status: str, progress: int = 0):
+        """_update_status와 같음 (이 워커의 메모리에 없는 작업의 공유 백엔드 상태를 스레드에서 읽음)"""
+        await self.status_store.set_async(podcast_id, status, progress)
 
     def get_podcast_info(self, podcast_id: str) -> dict:
-        output_dir = Path(f"output/{podcast_id}")
+        output_dir = self.output_root / podcast_id
 
         if not output_dir.exists():
             return {"error": "팟캐스트를 찾을 수 없습니다."}
 
         info = {
             "podcast_id": podcast_id,
-            "files": {}
+            "files": {},
+            "pinned": (output_dir / retention.PIN_FILENAME).exists()
         }
 
-        status_path = output_dir / "status.txt"
-        if status_path.exists():
-            with open(status_path, 'r', encoding='utf-8') as f:
-                info["status"] = f.read().strip()
+        record = self.status_store.get(podcast_id)
+        if record is not None:
+            info["status"] = record["status"]
+            info["message"] = record["message"]
 
         script_path = output_dir / "script.txt"
         if script_path.exists():
@@ -405,14 +872,15 @@ class PodcastGenerator:
         return info
 
     def list_podcasts(self) -> list:
-        output_dir = Path("output")
+        output_dir = self.output_root
         podcasts = []
 
         if not output_dir.exists():
             return podcasts
 
         for podcast_dir in output_dir.iterdir():
-            if podcast_dir.is_dir():
+            # .blobs 등 작업이 아닌 숨김 디렉토리는 제외
+            if podcast_dir.is_dir() and not podcast_dir.name.startswith("."):
                 podcast_info = self.get_podcast_info(podcast_dir.name)
                 if "error" not in podcast_info:
                     podcast_info["created_at"] = podcast_dir.stat().st_ctime
@@ -420,17 +888,119 @@ class PodcastGenerator:
 
         return sorted(podcasts, key=lambda x: x.get("created_at", 0), reverse=True)
 
-    def delete_podcast(self, podcast_id: str) -> bool:
-        import shutil
+    def _job_dir(self, podcast_id: str) -> Path:
+        """작업 디렉토리 (출력 디렉토리 밖을 가리키는 ID는 거부)
 
-        output_dir = Path(f"output/{podcast_id}")
+        Raises:
+            FileNotFoundError: 없는 작업
+        """
+        output_dir = self.output_root / podcast_id
+        if (
+            podcast_id.startswith(".")
+            or output_dir.resolve().parent != self.output_root.resolve()
+            or not output_dir.is_dir()
+        ):
+            raise FileNotFoundError("팟캐스트를 찾을 수 없습니다.")
+        return output_dir
+
+    def record_access(self, podcast_id: str):
+        """다운로드/재생 요청 시 마지막 접근 시각 갱신 (보존 정책의 LRU 기준)"""
+        self.access_tracker.touch(podcast_id)
+
+    def set_pinned(self, podcast_id: str, pinned: bool) -> bool:
+        """작업 고정 여부 설정 (고정한 작업은 보존 정책으로 삭제하지 않음)"""
+        pin_path = self._job_dir(podcast_id) / retention.PIN_FILENAME
+        if pinned:
+            pin_path.touch()
+        else:
+            pin_path.unlink(missing_ok=True)
+        return pinned
+
+    async def delete_podcast(self, podcast_id: str, reason: str = "manual") -> int:
+        """작업 디렉토리와 상태 삭제
+
+        생성/재개 중이거나 다시 렌더링 중인 작업은 임대를 잡을 수 없으므로 삭제하지 않습니다.
+        블롭 저장소의 산출물은 참조를 해제하며, 다른 작업도 참조하는 블롭은 남습니다.
 
-        if not output_dir.exists():
-            return False
+        Returns:
+            회수한 바이트 수 (작업에만 있던 파일과 참조가 없어져 삭제된 블롭)
 
-        try:
-            shutil.rmtree(output_dir)
-            return True
-        except Exception as e:
-            logger.error(f"팟캐스트 삭제 실패: {podcast_id} - {str(e)}")
-            return False
+        Raises:
+            FileNotFoundError: 없는 작업
+            RuntimeError: 처리 중인 작업
+        """
+        output_dir = self._job_dir(podcast_id)
+        rerender_lock = self._rerender_locks.get(podcast_id)
+        if podcast_id in self._active_jobs or (rerender_lock is not None and rerender_lock.locked()):
+            raise RuntimeError("처리 중인 팟캐스트는 삭제할 수 없습니다.")
+
+        async with self._lease(f"job:{podcast_id}"), self._lease(f"rerender:{podcast_id}"):
+            # 블롭과 공유하는 파일은 참조 해제로 실제 삭제된 블롭만 회수한 크기로 셈
+            size_bytes = await asyncio.to_thread(retention.directory_size, output_dir, False)
+            if self.blob_store is not None:
+                size_bytes += await asyncio.to_thread(self.blob_store.release, output_dir)
+            await asyncio.to_thread(shutil.rmtree, output_dir, ignore_errors=True)
+            await self.status_store.remove_async(podcast_id)
+            self.access_tracker.forget(podcast_id)
+            self._rerender_locks.pop(podcast_id, None)
+
+        GC_DELETED.labels(reason=reason).inc()
+        GC_RECLAIMED_BYTES.labels(reason=reason).inc(size_bytes)
+        logger.info(f"팟캐스트 삭제 ({reason}): {podcast_id} - {size_bytes / 1024 ** 2:.1f}MB")
+        return size_bytes
+
+    async def collect_garbage(self) -> dict:
+        """보존 정책(OUTPUT_TTL_DAYS, OUTPUT_QUOTA_MB)에 따라 오래된 작업 삭제
+
+        고정한 작업, 이 워커에서 처리 중인 작업, 상태가 processing인 작업(다른 워커가 처리 중이거나 재개 대기)은
+        건너뜁니다. 여러 워커 중 한 곳에서만 실행되도록 정리 임대를 잡습니다.
+
+        Returns:
+            {"deleted": 삭제한 작업 수, "reclaimed_bytes": 회수한 바이트, "output_bytes": 정리 후 전체 크기}
+        """
+        async with self._lease("gc"):
+            entries = await asyncio.to_thread(retention.scan_output, self.output_root)
+            records = await self.status_store.items_async()
+            protected = frozenset(self._active_jobs) | frozenset(
+                podcast_id for podcast_id, record in records if record.get("status") == "processing"
+            )
+            plan = retention.plan_eviction(
+                entries,
+                time.time(),
+                ttl_seconds=self.settings.output_ttl_days * 86400,
+                quota_bytes=int(self.settings.output_quota_mb * 1024 ** 2),
+                protected=protected
+            )
+
+            deleted, reclaimed = 0, 0
+            for entry, reason in plan:
+                try:
+                    reclaimed += await self.delete_podcast(entry.podcast_id, reason)
+                    deleted += 1
+                except (FileNotFoundError, RuntimeError) as e:
+                    # 스캔 후 다른 요청이 삭제했거나 처리를 시작한 작업
+                    logger.debug(f"정리 건너뜀: {entry.podcast_id} - {str(e)}")
+
+        output_bytes = sum(entry.size_bytes for entry in entries) - reclaimed
+        OUTPUT_BYTES.set(output_bytes)
+        return {"deleted": deleted, "reclaimed_bytes": reclaimed, "output_bytes": output_bytes}
+
+    async def garbage_collector(self):
+        """GC_INTERVAL마다 보존 정책 적용 (TTL과 용량 한도가 모두 0이면 바로 종료)"""
+        if self.settings.output_ttl_days <= 0 and self.settings.output_quota_mb <= 0:
+            return
+
+        while True:
+            try:
+                result = await self.collect_garbage()
+                if result["deleted"]:
+                    logger.info(
+                        f"출력 디렉토리 정리: {result['deleted']}개 삭제, {result['reclaimed_bytes'] / 1024 ** 2:.1f}MB 회수 "
+                        f"(남은 크기 {result['output_bytes'] / 1024 ** 2:.1f}MB)"
+                    )
+            except LeaseConflict:
+                # 다른 워커가 정리 중
+                pass
+            except Exception as e:
+                logger.error(f"출력 디렉토리 정리 실패: {str(e)}")
+            await asyncio.sleep(self.settings.gc_interval)
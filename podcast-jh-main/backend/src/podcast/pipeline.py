@@ -0,0 +1,202 @@
+"""
+팟캐스트 생성 단계를 의존성 그래프(DAG)로 정의하고 실행하는 모듈
+
+각 단계는 자신이 의존하는 단계가 모두 끝나는 즉시 시작되므로,
+서로 의존하지 않는 단계(예: 제목 생성과 TTS)는 동시에 실행됩니다.
+체크포인트가 지정된 단계는 결과를 output/<id>에 저장하며, 재실행 시
+저장된 결과가 있으면 단계를 실행하지 않고 복원합니다.
+"""
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from src.utils.files import atomic_write_text
+from src.utils.tracing import span
+
+
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+# 체크포인트가 없음을 나타내는 값 (None도 유효한 단계 결과일 수 있으므로 별도 객체 사용)
+MISSING = object()
+
+
+class Checkpoint:
+    """단계 결과 저장/복원 인터페이스
+
+    context["output_dir"] 아래에 결과를 저장하고, load()는 저장된 결과가 없으면 MISSING을 반환합니다.
+    """
+
+    def load(self, context: Dict[str, Any]) -> Any:
+        return MISSING
+
+    def save(self, context: Dict[str, Any], value: Any) -> None:
+        pass
+
+
+class TextCheckpoint(Checkpoint):
+    """문자열 결과를 텍스트 파일 하나로 저장하는 체크포인트"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def path(self, context: Dict[str, Any]) -> Path:
+        return Path(context["output_dir"]) / self.filename
+
+    def load(self, context: Dict[str, Any]) -> Any:
+        path = self.path(context)
+        if not path.exists():
+            return MISSING
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def save(self, context: Dict[str, Any], value: Any) -> None:
+        atomic_write_text(self.path(context), value)
+
+
+class Stage:
+    """파이프라인의 단일 단계
+
+    Args:
+        name: 단계 이름 (결과는 context[name]에 저장됨)
+        func: context를 받아 결과를 반환하는 비동기 함수
+        depends_on: 먼저 완료되어야 하는 단계 이름 목록
+        message: 단계 시작 시 표시할 상태 메시지
+        progress: 단계 시작 시 표시할 진행률 (0~100)
+        checkpoint: 결과 저장/복원 방식 (None이면 항상 실행)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: StageFunc,
+        depends_on: Sequence[str] = (),
+        message: Optional[str] = None,
+        progress: int = 0,
+        checkpoint: Optional[Checkpoint] = None
+    ):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.message = message
+        self.progress = progress
+        self.checkpoint = checkpoint
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r}, depends_on={list(self.depends_on)})"
+
+
+class Pipeline:
+    """단계 의존성 그래프 실행기
+
+    생성 시점에 그래프를 검증(중복 이름, 존재하지 않는 의존성, 순환)하고,
+    run()에서는 준비된 단계를 모두 동시에 실행합니다.
+    한 단계라도 실패하면 실행 중인 나머지 단계를 취소하고 예외를 다시 발생시킵니다.
+    """
+
+    def __init__(self, stages: Sequence[Stage]):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"중복된 단계 이름: {stage.name}")
+            self.stages[stage.name] = stage
+
+        for stage in self.stages.values():
+            for dependency in stage.depends_on:
+                if dependency not in self.stages:
+                    raise ValueError(f"단계 '{stage.name}'의 의존성 '{dependency}'이(가) 정의되지 않았습니다.")
+
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        """정의 순서를 최대한 유지하는 위상 정렬 (순환 검출 포함)"""
+        order: List[str] = []
+        visiting: set = set()
+        done: set = set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"단계 의존성에 순환이 있습니다: {name}")
+            visiting.add(name)
+            for dependency in self.stages[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+
+        return order
+
+    async def run(
+        self,
+        context: Dict[str, Any],
+        on_stage_start: Optional[Callable[[Stage], None]] = None
+    ) -> Dict[str, float]:
+        """모든 단계를 실행하고 단계별 소요 시간(초)을 반환
+
+        Args:
+            context: 단계 간 공유되는 딕셔너리. 각 단계의 결과가 context[단계 이름]에 저장됨
+            on_stage_start: 단계가 시작될 때 호출되는 콜백 (상태 업데이트용)
+
+        Returns:
+            {단계 이름: 소요 시간(초)} 딕셔너리 (완료 순서, 체크포인트에서 복원된 단계는 제외)
+        """
+        timings: Dict[str, float] = {}
+        completed: set = set()
+        running: Dict[asyncio.Task, str] = {}
+
+        async def execute(stage: Stage):
+            started = time.perf_counter()
+            try:
+                with span(f"stage.{stage.name}", kind="stage"):
+                    result = await stage.func(context)
+                    if stage.checkpoint:
+                        stage.checkpoint.save(context, result)
+                return result
+            finally:
+                timings[stage.name] = time.perf_counter() - started
+
+        try:
+            while len(completed) < len(self.order):
+                # 의존성이 모두 충족된 단계를 시작 (체크포인트가 있으면 복원)
+                scheduled = set(running.values())
+                for name in self.order:
+                    if name in completed or name in scheduled:
+                        continue
+                    stage = self.stages[name]
+                    if all(dependency in completed for dependency in stage.depends_on):
+                        restored = stage.checkpoint.load(context) if stage.checkpoint else MISSING
+                        if restored is not MISSING:
+                            with span(f"stage.{name}", kind="stage", restored=True):
+                                context[name] = restored
+                            completed.add(name)
+                            logger.info(f"체크포인트에서 단계 복원: {name}")
+                            continue
+                        if on_stage_start:
+                            on_stage_start(stage)
+                        logger.debug(f"단계 시작: {name}")
+                        running[asyncio.create_task(execute(stage), name=f"stage:{name}")] = name
+
+                if not running:
+                    # 이번 라운드에서 모두 복원됨 → 다음 라운드에서 후속 단계 스케줄
+                    continue
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    context[name] = task.result()  # 실패한 단계는 여기서 예외 발생
+                    completed.add(name)
+                    logger.debug(f"단계 완료: {name} ({timings[name]:.2f}초)")
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+
+        return timings
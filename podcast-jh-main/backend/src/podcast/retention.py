@@ -0,0 +1,165 @@
+"""
+출력 디렉토리 보존 정책 (TTL, 전체 용량 한도, 마지막 접근 기준 LRU)
+
+작업마다 OUTPUT_DIRECTORY/<id> 아래에 오디오, 대사 파일, 스크립트, 상태 등이 남으므로 주기적으로
+오래된 작업을 지웁니다. 판단 기준인 "마지막 접근"은 작업 디렉토리의 접근 표식 파일 수정 시각이며,
+다운로드/대사 재생 요청마다 갱신합니다 (같은 작업은 ACCESS_TOUCH_INTERVAL에 한 번만 기록).
+고정(pin)한 작업과 처리 중인 작업은 삭제하지 않습니다.
+
+파일 기반 표식이므로 여러 워커/노드가 같은 출력 디렉토리를 공유해도 그대로 동작합니다.
+"""
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+ACCESS_FILENAME = ".last_access"
+PIN_FILENAME = ".pinned"
+# 같은 작업의 접근 표식을 다시 기록하기까지의 최소 간격 (초)
+ACCESS_TOUCH_INTERVAL = 60.0
+
+
+class OutputEntry:
+    """작업 디렉토리 하나의 보존 판단 정보"""
+
+    def __init__(self, podcast_id: str, path: Path, size_bytes: int, last_access: float, pinned: bool):
+        self.podcast_id = podcast_id
+        self.path = path
+        self.size_bytes = size_bytes
+        self.last_access = last_access
+        self.pinned = pinned
+
+
+def directory_size(path: Path, linked: bool = True) -> int:
+    """디렉토리 아래 파일 크기 합계 (scandir로 stat 호출 최소화)
+
+    블롭 저장소와 하드링크로 공유하는 파일은 블롭 자신을 뺀 링크 수로 나눈 몫만 세므로, 작업 디렉토리 크기의
+    합이 실제 디스크 사용량과 같아집니다. linked가 False면 공유 파일은 세지 않습니다 (작업만 지워서는 회수되지 않음).
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        if stat.st_nlink <= 1:
+                            total += stat.st_size
+                        elif linked:
+                            total += stat.st_size // (stat.st_nlink - 1)
+        except FileNotFoundError:
+            # 스캔 중에 삭제된 디렉토리
+            continue
+    return total
+
+
+def _mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def scan_output(output_root: Path) -> List[OutputEntry]:
+    """출력 디렉토리의 작업 목록 (크기, 마지막 접근 시각, 고정 여부)
+
+    접근 표식이 없는 작업(이전 버전이나 아직 다운로드되지 않은 작업)은 디렉토리 수정 시각을 씁니다.
+    """
+    entries: List[OutputEntry] = []
+    if not output_root.exists():
+        return entries
+
+    for path in output_root.iterdir():
+        # .blobs 등 작업이 아닌 숨김 디렉토리는 제외
+        if not path.is_dir() or path.name.startswith("."):
+            continue
+        last_access = _mtime(path / ACCESS_FILENAME) or _mtime(path)
+        if last_access is None:
+            continue
+        entries.append(OutputEntry(
+            podcast_id=path.name,
+            path=path,
+            size_bytes=directory_size(path),
+            last_access=last_access,
+            pinned=(path / PIN_FILENAME).exists()
+        ))
+    return entries
+
+
+def plan_eviction(
+    entries: List[OutputEntry],
+    now: float,
+    ttl_seconds: float = 0,
+    quota_bytes: int = 0,
+    protected: frozenset = frozenset()
+) -> List[Tuple[OutputEntry, str]]:
+    """삭제할 작업과 이유("ttl" 또는 "quota")
+
+    Args:
+        entries: scan_output() 결과
+        now: 현재 시각
+        ttl_seconds: 마지막 접근 후 이 시간이 지나면 삭제 (0이면 사용 안 함)
+        quota_bytes: 전체 크기가 이 값을 넘으면 가장 오래 접근하지 않은 작업부터 삭제 (0이면 사용 안 함)
+        protected: 처리 중이라 삭제하면 안 되는 작업 ID
+
+    Returns:
+        [(작업, 이유), ...] (TTL 만료 작업 다음에 용량 초과분을 LRU 순서로)
+    """
+    evictable = sorted(
+        (entry for entry in entries if not entry.pinned and entry.podcast_id not in protected),
+        key=lambda entry: entry.last_access
+    )
+
+    plan: List[Tuple[OutputEntry, str]] = []
+    if ttl_seconds > 0:
+        plan.extend((entry, "ttl") for entry in evictable if now - entry.last_access > ttl_seconds)
+
+    if quota_bytes > 0:
+        planned = {entry.podcast_id for entry, _ in plan}
+        remaining = sum(entry.size_bytes for entry in entries if entry.podcast_id not in planned)
+        for entry in evictable:
+            if remaining <= quota_bytes:
+                break
+            if entry.podcast_id in planned:
+                continue
+            plan.append((entry, "quota"))
+            remaining -= entry.size_bytes
+        if remaining > quota_bytes:
+            logger.warning(
+                f"출력 디렉토리가 용량 한도를 넘었지만 고정되었거나 처리 중인 작업만 남았습니다: "
+                f"{remaining / 1024 ** 2:.1f}MB > {quota_bytes / 1024 ** 2:.1f}MB"
+            )
+
+    return plan
+
+
+class AccessTracker:
+    """작업별 마지막 접근 표식 기록 (간격 안의 반복 접근은 메모리에서 걸러냄)"""
+
+    def __init__(self, output_root: Path, interval: float = ACCESS_TOUCH_INTERVAL):
+        self.output_root = output_root
+        self.interval = interval
+        self._touched: Dict[str, float] = {}
+
+    def touch(self, podcast_id: str):
+        now = time.time()
+        if now - self._touched.get(podcast_id, 0.0) < self.interval:
+            return
+        output_dir = self.output_root / podcast_id
+        if not output_dir.is_dir():
+            return
+        self._touched[podcast_id] = now
+        marker = output_dir / ACCESS_FILENAME
+        try:
+            marker.touch()
+        except OSError as e:
+            logger.warning(f"접근 시각 기록 실패: {podcast_id} - {str(e)}")
+
+    def forget(self, podcast_id: str):
+        self._touched.pop(podcast_id, None)
@@ -0,0 +1,252 @@
+"""
+작업 상태/임대(lease) 저장 백엔드
+
+JobStatusStore가 작업 상태를 영구 저장하는 곳과, 여러 워커가 같은 작업을 동시에 처리하지 않도록
+잡는 임대(lease)를 추상화합니다.
+
+- FileStateBackend: output/<id>/status.txt + 프로세스 내 임대 (단일 워커, 기본값)
+- SQLiteStateBackend: 공유 디렉토리의 SQLite(WAL) 데이터베이스 (여러 워커/노드가 같은 출력 디렉토리를 공유)
+
+산출물(스크립트, 오디오 등)은 두 경우 모두 OUTPUT_DIRECTORY 아래에 저장되므로,
+여러 노드에서 실행할 때는 이 디렉토리를 공유 스토리지로 마운트해야 합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from src.utils.files import atomic_write_json
+
+
+STATUS_FILENAME = "status.txt"
+STATE_BACKENDS = ("file", "sqlite")
+
+
+def status_for_message(message: str) -> str:
+    """상태 메시지로 작업 상태(processing/completed/failed) 결정"""
+    if message == "완료":
+        return "completed"
+    if message.startswith("오류"):
+        return "failed"
+    return "processing"
+
+
+class StateBackend:
+    """작업 상태/임대 저장소 인터페이스
+
+    shared가 True인 백엔드는 다른 워커도 같은 상태를 보므로, JobStatusStore는
+    자신이 갱신하지 않은 작업을 조회할 때 백엔드에서 직접 읽습니다.
+    """
+
+    shared = False
+
+    def load_all(self) -> Dict[str, dict]:
+        raise NotImplementedError
+
+    def get(self, podcast_id: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    def put_many(self, records: Dict[str, dict]) -> None:
+        raise NotImplementedError
+
+    def delete(self, podcast_id: str) -> None:
+        raise NotImplementedError
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """임대 획득 (비어 있거나 만료되었거나 이미 owner가 가진 경우 성공)"""
+        raise NotImplementedError
+
+    def renew_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """owner가 가진 임대 연장 (다른 워커에게 넘어갔으면 False)"""
+        raise NotImplementedError
+
+    def release_lease(self, name: str, owner: str) -> None:
+        raise NotImplementedError
+
+
+class FileStateBackend(StateBackend):
+    """output/<id>/status.txt 기반 백엔드 (단일 워커용)
+
+    Args:
+        output_dir: 팟캐스트 출력 디렉토리
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir = Path(output_dir)
+        self._leases: Dict[str, tuple] = {}
+        self._lease_lock = threading.Lock()
+
+    def load_all(self) -> Dict[str, dict]:
+        """output/*/status.txt를 모두 읽음 (이전 평문 형식 포함)"""
+        records: Dict[str, dict] = {}
+        if not self.output_dir.exists():
+            return records
+
+        for podcast_dir in self.output_dir.iterdir():
+            status_path = podcast_dir / STATUS_FILENAME
+            if not podcast_dir.is_dir() or not status_path.exists():
+                continue
+
+            try:
+                content = status_path.read_text(encoding='utf-8')
+                record = json.loads(content)
+            except json.JSONDecodeError:
+                # 이전 버전의 평문 상태 파일
+                message = content.strip()
+                record = {"status": status_for_message(message), "message": message, "progress": 0}
+            except OSError as e:
+                logger.warning(f"상태 파일 읽기 실패: {status_path} - {str(e)}")
+                continue
+
+            record.setdefault("updated_at", status_path.stat().st_mtime)
+            record.setdefault("created_at", podcast_dir.stat().st_ctime)
+            if "files" not in record:
+                record["files"] = {
+                    "script": (podcast_dir / "script.txt").exists(),
+                    "audio": (podcast_dir / "podcast.mp3").exists()
+                }
+            records[podcast_dir.name] = record
+
+        return records
+
+    def get(self, podcast_id: str) -> Optional[dict]:
+        # 단일 워커에서는 모든 상태가 JobStatusStore 메모리에 있으므로 조회하지 않음
+        return None
+
+    def put_many(self, records: Dict[str, dict]) -> None:
+        for podcast_id, record in records.items():
+            try:
+                atomic_write_json(self.output_dir / podcast_id / STATUS_FILENAME, record)
+            except OSError as e:
+                logger.error(f"상태 파일 기록 실패: {podcast_id} - {str(e)}")
+
+    def delete(self, podcast_id: str) -> None:
+        # 상태 파일은 작업 디렉토리와 함께 삭제됨
+        pass
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lease_lock:
+            current = self._leases.get(name)
+            if current and current[0] != owner and current[1] > now:
+                return False
+            self._leases[name] = (owner, now + ttl)
+            return True
+
+    def renew_lease(self, name: str, owner: str, ttl: float) -> bool:
+        with self._lease_lock:
+            current = self._leases.get(name)
+            if not current or current[0] != owner:
+                return False
+            self._leases[name] = (owner, time.time() + ttl)
+            return True
+
+    def release_lease(self, name: str, owner: str) -> None:
+        with self._lease_lock:
+            if self._leases.get(name, (None,))[0] == owner:
+                del self._leases[name]
+
+
+class SQLiteStateBackend(StateBackend):
+    """공유 디렉토리의 SQLite 기반 백엔드 (여러 워커/노드용)
+
+    WAL 모드로 읽기와 쓰기가 서로 막지 않으며, 연결은 스레드별로 하나씩 엽니다.
+    테이블이 비어 있으면 기존 status.txt를 한 번 가져옵니다.
+
+    Args:
+        db_path: 데이터베이스 파일 경로 (모든 워커가 접근 가능한 위치)
+        output_dir: 기존 status.txt를 가져올 출력 디렉토리
+    """
+
+    shared = True
+
+    def __init__(self, db_path: str, output_dir: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "podcast_id TEXT PRIMARY KEY, record TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS leases ("
+                "name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            empty = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
+
+        if empty:
+            legacy = FileStateBackend(output_dir).load_all()
+            if legacy:
+                self.put_many(legacy)
+                logger.info(f"기존 status.txt {len(legacy)}개를 SQLite 상태 저장소로 가져옴")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    def load_all(self) -> Dict[str, dict]:
+        rows = self._connect().execute("SELECT podcast_id, record FROM jobs").fetchall()
+        return {podcast_id: json.loads(record) for podcast_id, record in rows}
+
+    def get(self, podcast_id: str) -> Optional[dict]:
+        row = self._connect().execute("SELECT record FROM jobs WHERE podcast_id = ?", (podcast_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_many(self, records: Dict[str, dict]) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO jobs (podcast_id, record, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(podcast_id) DO UPDATE SET record = excluded.record, updated_at = excluded.updated_at",
+                [
+                    (podcast_id, json.dumps(record, ensure_ascii=False), record.get("updated_at", time.time()))
+                    for podcast_id, record in records.items()
+                ]
+            )
+
+    def delete(self, podcast_id: str) -> None:
+        self._connect().execute("DELETE FROM jobs WHERE podcast_id = ?", (podcast_id,))
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        cursor = self._connect().execute(
+            "INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+            "WHERE leases.expires_at < ? OR leases.owner = excluded.owner",
+            (name, owner, now + ttl, now)
+        )
+        return cursor.rowcount == 1
+
+    def renew_lease(self, name: str, owner: str, ttl: float) -> bool:
+        cursor = self._connect().execute(
+            "UPDATE leases SET expires_at = ? WHERE name = ? AND owner = ?",
+            (time.time() + ttl, name, owner)
+        )
+        return cursor.rowcount == 1
+
+    def release_lease(self, name: str, owner: str) -> None:
+        self._connect().execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+
+
+def create_state_backend(settings) -> StateBackend:
+    """설정(STATE_BACKEND)에 맞는 상태 백엔드 생성"""
+    if settings.state_backend == "sqlite":
+        db_path = settings.state_db_path or str(Path(settings.output_directory) / "state.db")
+        logger.info(f"SQLite 상태 저장소 사용: {db_path}")
+        return SQLiteStateBackend(db_path, settings.output_directory)
+    if settings.state_backend != "file":
+        raise ValueError(f"지원하지 않는 STATE_BACKEND: {settings.state_backend} (사용 가능: {', '.join(STATE_BACKENDS)})")
+    return FileStateBackend(settings.output_directory)
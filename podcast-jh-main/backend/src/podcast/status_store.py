@@ -0,0 +1,168 @@
+"""
+작업 상태 저장소
+
+이 워커가 갱신한 작업 상태는 프로세스 메모리에 두고 상태 조회는 메모리에서 바로 응답합니다.
+영구 저장은 상태 백엔드(state_backend.py)가 맡으며, 변경된 상태를 잠시 모았다가(coalescing)
+스레드에서 한 번에 기록합니다(write-behind). 같은 작업의 상태가 짧은 시간에 여러 번 바뀌어도
+기록은 마지막 상태 한 번입니다.
+
+공유 백엔드(SQLite)를 쓰는 여러 워커 환경에서는 다른 워커가 처리 중인 작업의 상태를
+백엔드에서 읽으며, 최대 flush_delay만큼 늦게 보일 수 있습니다. 이벤트 루프에서는 백엔드를 스레드에서 읽고 쓰는
+*_async 메서드를 사용합니다 (SQLite 조회가 다른 요청을 막지 않도록).
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from src.podcast.state_backend import FileStateBackend, StateBackend, status_for_message
+
+
+class JobStatusStore:
+    """메모리 작업 상태 저장소 (백엔드에 지연 기록)
+
+    Args:
+        backend: 상태 백엔드 (기본: output/<id>/status.txt)
+        flush_delay: 변경 후 백엔드에 기록하기까지 모으는 시간 (초)
+    """
+
+    def __init__(self, backend: Optional[StateBackend] = None, flush_delay: float = 0.5):
+        self.backend = backend or FileStateBackend("output")
+        self.flush_delay = flush_delay
+        self._dirty: set = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        # 이전 묶음이 나중에 기록되어 새 상태를 덮어쓰지 않도록 기록을 직렬화
+        self._flush_lock = asyncio.Lock()
+        # 단일 워커 백엔드는 모든 상태를 메모리에 올리고, 공유 백엔드는 이 워커가 갱신한 작업만 보관
+        self._records: Dict[str, dict] = {} if self.backend.shared else self.backend.load_all()
+
+    def get(self, podcast_id: str) -> Optional[dict]:
+        record = self._records.get(podcast_id)
+        if record is None and self.backend.shared:
+            return self.backend.get(podcast_id)
+        return dict(record) if record is not None else None
+
+    def items(self) -> List[tuple]:
+        """(팟캐스트 ID, 상태) 목록"""
+        return self._merge(self.backend.load_all() if self.backend.shared else {})
+
+    async def get_async(self, podcast_id: str) -> Optional[dict]:
+        """get과 같음 (공유 백엔드는 스레드에서 읽어 이벤트 루프를 막지 않음, 라우트/백그라운드 태스크용)"""
+        record = self._records.get(podcast_id)
+        if record is None and self.backend.shared:
+            return await asyncio.to_thread(self.backend.get, podcast_id)
+        return dict(record) if record is not None else None
+
+    async def items_async(self) -> List[tuple]:
+        """items와 같음 (공유 백엔드는 스레드에서 읽음)"""
+        return self._merge(await asyncio.to_thread(self.backend.load_all) if self.backend.shared else {})
+
+    def _merge(self, records: Dict[str, dict]) -> List[tuple]:
+        # 아직 기록되지 않은 이 워커의 상태가 더 최신
+        records.update((podcast_id, dict(record)) for podcast_id, record in self._records.items())
+        return list(records.items())
+
+    def _cache(self, podcast_id: str, stored: Optional[dict]) -> Optional[dict]:
+        # 백엔드에서 읽는 동안 이 워커가 만든 상태가 있으면 그쪽이 더 최신
+        if stored is not None:
+            self._records.setdefault(podcast_id, stored)
+        return self._records.get(podcast_id)
+
+    def _local_record(self, podcast_id: str) -> Optional[dict]:
+        record = self._records.get(podcast_id)
+        if record is None and self.backend.shared:
+            record = self._cache(podcast_id, self.backend.get(podcast_id))
+        return record
+
+    async def _local_record_async(self, podcast_id: str) -> Optional[dict]:
+        record = self._records.get(podcast_id)
+        if record is None and self.backend.shared:
+            record = self._cache(podcast_id, await asyncio.to_thread(self.backend.get, podcast_id))
+        return record
+
+    def set(self, podcast_id: str, message: str, progress: int = 0) -> dict:
+        """작업 상태 갱신 (백엔드 기록은 지연)
+
+        공유 백엔드에서 이 워커의 메모리에 없는 작업이면 백엔드를 바로 읽으므로,
+        이벤트 루프에서는 작업을 시작할 때 set_async로 한 번 올려 둡니다.
+        """
+        return self._apply(podcast_id, self._local_record(podcast_id), message, progress)
+
+    async def set_async(self, podcast_id: str, message: str, progress: int = 0) -> dict:
+        """set과 같음 (메모리에 없는 작업은 공유 백엔드를 스레드에서 읽음)"""
+        return self._apply(podcast_id, await self._local_record_async(podcast_id), message, progress)
+
+    def _apply(self, podcast_id: str, record: Optional[dict], message: str, progress: int) -> dict:
+        now = time.time()
+        if record is None:
+            record = {"created_at": now, "files": {"script": False, "audio": False}}
+            self._records[podcast_id] = record
+
+        record.update(status=status_for_message(message), message=message, progress=progress, updated_at=now)
+        self._mark_dirty(podcast_id)
+        return dict(record)
+
+    def mark_files(self, podcast_id: str, **files: bool):
+        """산출물(script, audio) 생성 여부 기록 (상태 조회에서 파일 존재 확인을 대신함)"""
+        self._apply_files(podcast_id, self._local_record(podcast_id), files)
+
+    async def mark_files_async(self, podcast_id: str, **files: bool):
+        """mark_files와 같음 (메모리에 없는 작업은 공유 백엔드를 스레드에서 읽음)"""
+        self._apply_files(podcast_id, await self._local_record_async(podcast_id), files)
+
+    def _apply_files(self, podcast_id: str, record: Optional[dict], files: Dict[str, bool]):
+        if record is None:
+            return
+        record["files"] = {**record.get("files", {}), **files}
+        self._mark_dirty(podcast_id)
+
+    def remove(self, podcast_id: str):
+        self._records.pop(podcast_id, None)
+        self._dirty.discard(podcast_id)
+        self.backend.delete(podcast_id)
+
+    async def remove_async(self, podcast_id: str):
+        """remove와 같음 (백엔드 삭제는 스레드에서 실행)"""
+        self._records.pop(podcast_id, None)
+        self._dirty.discard(podcast_id)
+        await asyncio.to_thread(self.backend.delete, podcast_id)
+
+    def _mark_dirty(self, podcast_id: str):
+        self._dirty.add(podcast_id)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖(스크립트 등)에서는 바로 기록
+            self._write(self._take_dirty())
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+
+    def _take_dirty(self) -> Dict[str, dict]:
+        batch = {podcast_id: dict(self._records[podcast_id]) for podcast_id in self._dirty if podcast_id in self._records}
+        self._dirty.clear()
+        return batch
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_delay)
+        await self.flush()
+
+    async def flush(self):
+        """모인 변경 사항을 백엔드에 기록 (종료 시에도 호출)"""
+        async with self._flush_lock:
+            while self._dirty:
+                batch = self._take_dirty()
+                await asyncio.to_thread(self._write, batch)
+                self._evict_finished(batch)
+
+    def _write(self, batch: Dict[str, dict]):
+        if batch:
+            self.backend.put_many(batch)
+
+    def _evict_finished(self, batch: Dict[str, dict]):
+        """공유 백엔드에서는 끝난 작업의 로컬 사본을 버림 (다른 워커가 다시 렌더링할 수 있으므로 백엔드에서 읽음)"""
+        if not self.backend.shared:
+            return
+        for podcast_id, record in batch.items():
+            if record["status"] != "processing" and podcast_id not in self._dirty:
+                self._records.pop(podcast_id, None)
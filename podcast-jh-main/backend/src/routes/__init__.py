@@ -1,4 +1,6 @@
 from .podcast import router as podcast_router
 from .voices import router as voices_router
+from .metrics import router as metrics_router
+from .music import router as music_router
 
-__all__ = ["podcast_router", "voices_router"]
+__all__ = ["podcast_router", "voices_router", "metrics_router", "music_router"]
@@ -0,0 +1,28 @@
+"""
+라우트 의존성: lifespan에서 만든 AppContainer(app.state.container)의 공유 객체를 꺼냄
+
+    @router.get("")
+    async def handler(generator: PodcastGenerator = Depends(get_generator)): ...
+"""
+from fastapi import Request
+
+from src.container import AppContainer
+from src.podcast.generator import PodcastGenerator
+from src.tts.engine import TTSEngine
+from src.utils.config import Settings
+
+
+def get_container(request: Request) -> AppContainer:
+    return request.app.state.container
+
+
+def get_settings(request: Request) -> Settings:
+    return get_container(request).settings
+
+
+def get_generator(request: Request) -> PodcastGenerator:
+    return get_container(request).generator
+
+
+def get_tts_engine(request: Request) -> TTSEngine:
+    return get_container(request).tts_engine
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Response
+
+from src.utils.metrics import render_metrics
+
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """Prometheus 메트릭 조회 (LLM/TTS/오디오 처리 지연 시간, 진행 중인 작업 수 등)"""
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+
+from src.routes.dependencies import get_tts_engine
+from src.tts.engine import TTSEngine
+
+
+router = APIRouter(prefix="/music", tags=["music"])
+
+
+@router.get("")
+async def get_music_tracks(tts_engine: TTSEngine = Depends(get_tts_engine)):
+    """선택 가능한 배경음악 목록 조회"""
+    return {
+        "tracks": tts_engine.get_music_tracks(),
+        "description": "팟캐스트 생성 시 background_music 파라미터에 트랙 이름(name)을 지정하세요"
+    }
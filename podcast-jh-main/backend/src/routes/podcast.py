@@ -1,21 +1,70 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
+from fastapi.responses import FileResponse, RedirectResponse, Response, StreamingResponse
 from pathlib import Path
+from typing import Optional
+import asyncio
 import os
+import time
 import uuid
 import json
 
-from src.models.podcast import PodcastRequest, PodcastResponse
-from src.podcast.generator import PodcastGenerator
+from src.models.podcast import PodcastRequest, PodcastResponse, DialogueUpdateRequest, DialogueUpdateResponse
+from src.podcast.generator import LINE_INDEX_FILENAME, PodcastGenerator
+from src.routes.dependencies import get_generator
 from src.utils.pdf_parser import extract_text_from_pdf, validate_pdf_file
+from src.utils.metrics import AUDIO_POOL_REJECTED
+from src.utils.tracing import waterfall
 
 
 router = APIRouter(prefix="/podcasts", tags=["podcasts"])
-podcast_generator = PodcastGenerator()
+
+# 오디오 처리 대기열이 가득 찼을 때 클라이언트에게 알려줄 재시도 간격 (초)
+AUDIO_POOL_RETRY_AFTER = 30
+
+# 오디오 형식 → (작업 디렉토리 안의 경로, media type, 다운로드 확장자)
+AUDIO_FORMATS = {
+    "mp3": ("podcast.mp3", "audio/mpeg", "mp3"),
+    "opus": ("podcast.opus", "audio/ogg", "opus"),
+    "aac": ("podcast.m4a", "audio/mp4", "m4a"),
+    "hls": ("hls/master.m3u8", "application/vnd.apple.mpegurl", None),
+}
+# Accept 헤더의 media type → 오디오 형식
+ACCEPT_AUDIO_FORMATS = {
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/ogg": "opus",
+    "audio/opus": "opus",
+    "audio/mp4": "aac",
+    "audio/aac": "aac",
+    "audio/x-m4a": "aac",
+    "application/vnd.apple.mpegurl": "hls",
+    "application/x-mpegurl": "hls",
+}
+
+
+def _reject_if_audio_pool_saturated(generator: PodcastGenerator):
+    """오디오 처리 대기열이 가득 차 있으면 LLM/TTS 비용을 쓰기 전에 503으로 거절"""
+    if generator.tts_engine.audio_pool.saturated:
+        AUDIO_POOL_REJECTED.inc()
+        raise HTTPException(
+            status_code=503,
+            detail="서버가 오디오 처리 중인 작업으로 바쁩니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(AUDIO_POOL_RETRY_AFTER)}
+        )
+
+
+def _validate_background_music(generator: PodcastGenerator, name: Optional[str]):
+    """배경음악을 선택했으면 LLM/TTS 비용을 쓰기 전에 트랙이 있는지 확인"""
+    if not name:
+        return
+    try:
+        generator.tts_engine.resolve_music(name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/generate", response_model=PodcastResponse)
-async def generate_podcast(request: PodcastRequest):
+async def generate_podcast(request: PodcastRequest, generator: PodcastGenerator = Depends(get_generator)):
     """다중 화자 대화형 팟캐스트 생성 요청 (동기식 처리)
 
     LLM이 자동으로 2~3명의 진행자가 대화하는 스크립트를 생성하고,
@@ -32,6 +81,8 @@ async def generate_podcast(request: PodcastRequest):
             - num_speakers: 화자 수 (2 또는 3, 기본값: 2)
             - custom_voices: 화자 음성 매핑 (필수)
                 예: {"화자A": "rachel", "화자B": "adam"}
+            - background_music: 배경음악 트랙 이름 (선택, GET /music)
+            - music_volume: 배경음악 크기 (0~1, 기본값: 0.1)
     """
     # topic 또는 url 중 하나는 필수
     if not request.topic and not request.url:
@@ -58,6 +109,8 @@ async def generate_podcast(request: PodcastRequest):
                 detail=f"화자 '{speaker}'에 대한 음성이 필요합니다. {num_speakers}명 모드에서는 {', '.join(expected_speakers)}에 대한 음성을 모두 지정해야 합니다."
             )
 
+    _validate_background_music(generator, request.background_music)
+    _reject_if_audio_pool_saturated(generator)
     podcast_id = str(uuid.uuid4())
 
     try:
@@ -66,7 +119,7 @@ async def generate_podcast(request: PodcastRequest):
         turns = duration_minutes * 8
 
         # 팟캐스트 생성이 완료될 때까지 대기
-        result = await podcast_generator.generate_podcast(
+        result = await generator.generate_podcast(
             podcast_id=podcast_id,
             topic=request.topic,
             url=request.url,
@@ -75,7 +128,9 @@ async def generate_podcast(request: PodcastRequest):
             num_speakers=request.num_speakers or 2,
             custom_voices=request.custom_voices,
             turns=turns,
-            style=request.style or "casual"
+            style=request.style or "casual",
+            background_music=request.background_music,
+            music_volume=request.music_volume if request.music_volume is not None else 0.1
         )
 
         # 생성 완료 후 결과 반환
@@ -106,7 +161,10 @@ async def generate_podcast_from_pdf(
     tts_engine: str = Form("elevenlabs"),
     num_speakers: int = Form(2),
     custom_voices: str = Form(..., description="JSON 형식의 화자 매핑"),
-    style: str = Form("casual", description="팟캐스트 스타일 (casual, professional, educational, storytelling)")
+    style: str = Form("casual", description="팟캐스트 스타일 (casual, professional, educational, storytelling)"),
+    background_music: Optional[str] = Form(None, description="배경음악 트랙 이름 (GET /music)"),
+    music_volume: float = Form(0.1, ge=0.0, le=1.0, description="배경음악 크기 (0~1)"),
+    generator: PodcastGenerator = Depends(get_generator)
 ):
     """PDF 파일 업로드를 통한 팟캐스트 생성
 
@@ -121,6 +179,8 @@ async def generate_podcast_from_pdf(
         num_speakers: 화자 수 (2 또는 3)
         custom_voices: 화자 음성 매핑 (JSON 문자열)
             예: '{"화자A": "rachel", "화자B": "adam"}'
+        background_music: 배경음악 트랙 이름 (선택)
+        music_volume: 배경음악 크기 (0~1)
     """
     # PDF 파일 검증
     if not pdf_file.filename or not pdf_file.filename.lower().endswith('.pdf'):
@@ -129,6 +189,9 @@ async def generate_podcast_from_pdf(
             detail="PDF 파일만 업로드 가능합니다."
         )
 
+    _validate_background_music(generator, background_music)
+    _reject_if_audio_pool_saturated(generator)
+
     # custom_voices JSON 파싱
     try:
         custom_voices_dict = json.loads(custom_voices)
@@ -164,7 +227,7 @@ async def generate_podcast_from_pdf(
         turns = duration_minutes * 8
 
         # 팟캐스트 생성 (PDF 텍스트를 content로 전달)
-        result = await podcast_generator.generate_podcast_from_content(
+        result = await generator.generate_podcast_from_content(
             podcast_id=podcast_id,
             content=pdf_text,
             content_type="pdf",
@@ -174,7 +237,9 @@ async def generate_podcast_from_pdf(
             num_speakers=num_speakers,
             custom_voices=custom_voices_dict,
             turns=turns,
-            style=style
+            style=style,
+            background_music=background_music,
+            music_volume=music_volume
         )
 
         # 생성 완료 후 결과 반환
@@ -203,139 +268,302 @@ async def generate_podcast_from_pdf(
         )
 
 
-@router.get("/status/{podcast_id}")
-async def get_podcast_status(podcast_id: str):
-    """팟캐스트 생성 상태 조회 (완전 비동기, 비블로킹)"""
-    import json
-    import time
-    import aiofiles
-    import aiofiles.os
+@router.put("/{podcast_id}/dialogues", response_model=DialogueUpdateResponse)
+async def update_dialogues(
+    podcast_id: str,
+    request: DialogueUpdateRequest,
+    generator: PodcastGenerator = Depends(get_generator)
+):
+    """수정된 대사 목록으로 기존 팟캐스트 다시 렌더링
 
-    status_file = Path(f"output/{podcast_id}/status.txt")
+    dialogue_metadata.json과 비교하여 바뀐 대사만 다시 합성하고,
+    에피소드 오디오와 타임스탬프 메타데이터를 갱신합니다.
 
-    # 비동기로 파일 존재 확인 (블로킹 제거)
-    try:
-        file_exists = await aiofiles.os.path.exists(status_file)
-    except Exception:
-        file_exists = False
+    생성 요청처럼 렌더링이 끝날 때까지 대기합니다. TTS는 바뀐 대사 수에 비례하지만 후처리와
+    렌디션 인코딩은 에피소드 전체를 다시 처리하므로, 바뀐 대사가 하나여도 에피소드 길이에 따라
+    수십 초가 걸릴 수 있습니다 (클라이언트 타임아웃을 생성 요청과 같게 설정). 진행 상황은 상태 조회에서 확인할 수 있습니다.
 
-    # 파일이 없으면 404 대신 기본 응답 반환 (더 안정적)
-    if not file_exists:
-        return {
-            "podcast_id": podcast_id,
-            "status": "not_found",
-            "message": "팟캐스트를 찾을 수 없습니다. ID를 확인해주세요.",
-            "progress": 0,
-            "updated_at": time.time()
-        }
+    Args:
+        podcast_id: 팟캐스트 ID
+        request: 전체 대사 목록
+            - dialogues: [{"speaker": "rachel", "text": "수정된 대사"}, ...]
+    """
+    if not request.dialogues:
+        raise HTTPException(status_code=400, detail="대사 목록이 비어있습니다.")
 
-    # 비동기 파일 읽기 (완전히 비블로킹)
     try:
-        async with aiofiles.open(status_file, 'r', encoding='utf-8') as f:
-            content = await f.read()
-            status_data = json.loads(content)
-    except json.JSONDecodeError:
-        # JSON 파싱 실패 시 이전 형식으로 시도
-        try:
-            # content는 이미 읽혀있음
-            old_status = content.strip()
-            status_data = {
-                "status": "processing" if old_status != "완료" and not old_status.startswith("오류") else ("completed" if old_status == "완료" else "failed"),
-                "message": old_status,
-                "progress": 0,
-                "updated_at": time.time()
-            }
-        except Exception as read_err:
-            # 파일 읽기 완전 실패 시에도 응답 반환
-            return {
-                "podcast_id": podcast_id,
-                "status": "error",
-                "message": f"상태 파일 읽기 오류: {str(read_err)}",
-                "progress": 0,
-                "updated_at": time.time()
-            }
+        result = await generator.rerender_dialogues(
+            podcast_id,
+            [dialogue.model_dump() for dialogue in request.dialogues]
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
-        # 기타 예외 처리
+        raise HTTPException(
+            status_code=500,
+            detail=f"대사 수정 렌더링 중 오류가 발생했습니다: {str(e)}"
+        )
+
+    return DialogueUpdateResponse(
+        status="completed",
+        message=f"대사 {result['changed']}개를 다시 합성하여 팟캐스트를 갱신했습니다.",
+        **result
+    )
+
+
+@router.get("/{podcast_id}/trace")
+async def get_podcast_trace(podcast_id: str, generator: PodcastGenerator = Depends(get_generator)):
+    """팟캐스트 생성 작업의 트레이스를 워터폴 형태로 조회
+
+    단계, LLM 호출, 대사별 TTS 요청/재시도 대기, 오디오 처리(ffmpeg) 스팬을
+    시작 시각 순으로 반환하며, summary에서 종류별 소요 시간 합계를 확인할 수 있습니다.
+    """
+    trace_path = generator.output_root / podcast_id / "trace.json"
+    if not trace_path.exists():
+        raise HTTPException(status_code=404, detail="트레이스를 찾을 수 없습니다.")
+
+    with open(trace_path, 'r', encoding='utf-8') as f:
+        trace_data = json.load(f)
+
+    return {"podcast_id": podcast_id, **waterfall(trace_data)}
+
+
+def _check_line_index(line_index: dict, audio_bytes: int):
+    """다시 렌더링하는 중에는 인덱스가 podcast.mp3보다 먼저 교체되므로 크기로 짝이 맞는지 확인"""
+    if audio_bytes != line_index["audio_bytes"]:
+        raise HTTPException(
+            status_code=409,
+            detail="오디오를 다시 렌더링하는 중입니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "5"}
+        )
+
+
+def _read_line_clip(generator: PodcastGenerator, output_dir: Path, index: int) -> bytes:
+    """대사 인덱스의 바이트 구간을 podcast.mp3(블롭 저장소에 있으면 블롭)에서 읽음 (다시 인코딩하지 않음)"""
+    index_path = output_dir / LINE_INDEX_FILENAME
+    audio_path = output_dir / "podcast.mp3"
+    if not index_path.exists() or not audio_path.exists():
+        raise HTTPException(status_code=404, detail="대사 인덱스를 찾을 수 없습니다.")
+
+    with open(index_path, 'r', encoding='utf-8') as f:
+        line_index = json.load(f)
+    lines = line_index["lines"]
+    if not 0 <= index < len(lines):
+        raise HTTPException(status_code=404, detail=f"대사 번호는 0~{len(lines) - 1} 범위여야 합니다.")
+    byte_start, byte_end = lines[index]["byte_start"], lines[index]["byte_end"]
+
+    blob_store = generator.blob_store
+    entry = blob_store.lookup(output_dir, "podcast.mp3") if blob_store is not None else None
+    if entry is not None:
+        _check_line_index(line_index, entry["size"])
+        return blob_store.read_range(entry["digest"], byte_start, byte_end)
+
+    with open(audio_path, 'rb') as f:
+        _check_line_index(line_index, os.fstat(f.fileno()).st_size)
+        f.seek(byte_start)
+        return f.read(byte_end - byte_start)
+
+
+@router.get("/{podcast_id}/lines/{index}/audio")
+async def get_line_audio(podcast_id: str, index: int, generator: PodcastGenerator = Depends(get_generator)):
+    """대사 한 줄의 오디오 (podcast.mp3에서 해당 대사를 덮는 MP3 프레임만 잘라서 전송)
+
+    구간은 후처리 때 만든 line_index.json의 프레임 경계 바이트 위치이며, 비트 저장소 때문에
+    대사 앞의 프레임 하나를 함께 보냅니다.
+    """
+    clip = await asyncio.to_thread(_read_line_clip, generator, generator.output_root / podcast_id, index)
+    generator.record_access(podcast_id)
+    return Response(
+        content=clip,
+        media_type="audio/mpeg",
+        headers={"Content-Disposition": f'inline; filename="{podcast_id}_line_{index:04d}.mp3"'}
+    )
+
+
+@router.get("/status/{podcast_id}")
+async def get_podcast_status(podcast_id: str, generator: PodcastGenerator = Depends(get_generator)):
+    """팟캐스트 생성 상태 조회
+
+    상태는 메모리의 작업 상태 저장소에서 바로 응답하며 파일을 읽지 않습니다.
+    """
+    record = await generator.status_store.get_async(podcast_id)
+
+    # 없는 작업이면 404 대신 기본 응답 반환 (더 안정적)
+    if record is None:
         return {
             "podcast_id": podcast_id,
-            "status": "error",
-            "message": f"상태 확인 중 오류: {str(e)}",
+            "status": "not_found",
+            "message": "팟캐스트를 찾을 수 없습니다. ID를 확인해주세요.",
             "progress": 0,
             "updated_at": time.time()
         }
 
-    # 비동기로 스크립트 및 오디오 파일 존재 확인
-    script_path = Path(f"output/{podcast_id}/script.txt")
-    audio_path = Path(f"output/{podcast_id}/podcast.mp3")
-
     response_data = {
         "podcast_id": podcast_id,
-        "status": status_data.get("status", "processing"),
-        "message": status_data.get("message", "처리 중..."),
-        "progress": status_data.get("progress", 0),
-        "updated_at": status_data.get("updated_at", time.time())
+        "status": record["status"],
+        "message": record["message"],
+        "progress": record["progress"],
+        "updated_at": record["updated_at"]
     }
 
-    # 비동기 파일 존재 체크 (블로킹 완전 제거)
-    try:
-        if await aiofiles.os.path.exists(script_path):
-            response_data["script_path"] = f"/static/{podcast_id}/script.txt"
-
-        if await aiofiles.os.path.exists(audio_path):
-            response_data["audio_path"] = f"/static/{podcast_id}/podcast.mp3"
-    except Exception:
-        # 파일 체크 실패해도 기본 응답은 반환
-        pass
+    files = record.get("files", {})
+    if files.get("script"):
+        response_data["script_path"] = f"/static/{podcast_id}/script.txt"
+    if files.get("audio"):
+        response_data["audio_path"] = f"/static/{podcast_id}/podcast.mp3"
 
     return response_data
 
 
+def _negotiate_audio_format(accept: str, output_dir: Path) -> str:
+    """Accept 헤더의 q 값 순서대로 만들어져 있는 형식을 고름 (맞는 형식이 없으면 MP3)"""
+    preferences = []
+    for position, item in enumerate(accept.split(",")):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            preferences.append((-quality, position, media_type.lower()))
+
+    for _, _, media_type in sorted(preferences):
+        audio_format = ACCEPT_AUDIO_FORMATS.get(media_type)
+        if audio_format and (output_dir / AUDIO_FORMATS[audio_format][0]).exists():
+            return audio_format
+    return "mp3"
+
+
+def _artifact_response(generator: PodcastGenerator, output_dir: Path, relative_path: str, media_type: str, filename: str, headers: dict) -> Response:
+    """산출물 응답 (manifest.json에 있으면 블롭 저장소에서, 없으면 작업 디렉토리의 파일에서)
+
+    블롭 이름은 내용 해시이므로 그대로 ETag로 씁니다. 로컬 블롭은 파일로 바로 보내고,
+    로컬 경로가 없는 백엔드(오브젝트 스토리지)는 스트림으로 읽어 보냅니다.
+    """
+    blob_store = generator.blob_store
+    entry = blob_store.lookup(output_dir, relative_path) if blob_store is not None else None
+    if entry is None:
+        file_path = output_dir / relative_path
+        if not file_path.exists():
+            raise HTTPException(status_code=404, detail="File not found")
+        return FileResponse(path=file_path, media_type=media_type, filename=filename, headers=headers)
+
+    headers = dict(headers, ETag=f'"{entry["digest"]}"')
+    blob_path = blob_store.backend.local_path(entry["digest"])
+    if blob_path is not None:
+        return FileResponse(path=blob_path, media_type=media_type, filename=filename, headers=headers)
+    headers.update({
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Content-Length": str(entry["size"])
+    })
+    return StreamingResponse(blob_store.iter_blob(entry["digest"]), media_type=media_type, headers=headers)
+
+
 @router.get("/download/{podcast_id}/{file_type}")
-async def download_file(podcast_id: str, file_type: str):
-    """팟캐스트 파일 다운로드 (스크립트, 오디오, 메타데이터)"""
+async def download_file(
+    podcast_id: str, file_type: str, request: Request, format: Optional[str] = None,
+    generator: PodcastGenerator = Depends(get_generator)
+):
+    """팟캐스트 파일 다운로드 (스크립트, 오디오, 메타데이터, 파형 피크)
+
+    오디오는 Accept 헤더(audio/ogg, audio/mp4, application/vnd.apple.mpegurl 등)나 ?format=mp3|opus|aac|hls로
+    렌디션을 고를 수 있으며, HLS는 정적 파일 경로의 master.m3u8로 리다이렉트합니다.
+    블롭 저장소에 있는 산출물은 블롭에서 보내며 ETag는 내용 해시입니다.
+    """
+    generator.record_access(podcast_id)
+    if file_type == "audio":
+        output_dir = generator.output_root / podcast_id
+        if format is None:
+            audio_format = _negotiate_audio_format(request.headers.get("accept", ""), output_dir)
+        elif format in AUDIO_FORMATS:
+            audio_format = format
+        else:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 오디오 형식: {format} (사용 가능: {', '.join(AUDIO_FORMATS)})")
+
+        relative_path, media_type, extension = AUDIO_FORMATS[audio_format]
+        headers = {"Vary": "Accept"}
+        if audio_format == "hls":
+            if not os.path.exists(output_dir / relative_path):
+                raise HTTPException(status_code=404, detail="File not found")
+            return RedirectResponse(f"/output/{podcast_id}/{relative_path}", status_code=307, headers=headers)
+        return await asyncio.to_thread(
+            _artifact_response, generator, output_dir, relative_path, media_type, f"{podcast_id}_audio.{extension}", headers
+        )
+
     if file_type == "script":
-        file_path = f"output/{podcast_id}/script.txt"
+        relative_path = "script.txt"
         media_type = "text/plain"
         filename = f"{podcast_id}_script.txt"
-    elif file_type == "audio":
-        file_path = f"output/{podcast_id}/podcast.mp3"
-        media_type = "audio/mpeg"
-        filename = f"{podcast_id}_audio.mp3"
     elif file_type == "metadata":
-        file_path = f"output/{podcast_id}/dialogue_metadata.json"
+        relative_path = "dialogue_metadata.json"
         media_type = "application/json"
         filename = f"{podcast_id}_metadata.json"
+    elif file_type == "peaks":
+        # 플레이어 파형/탐색 막대용 다중 해상도 피크 (src/tts/waveform.py)
+        relative_path = "peaks.json"
+        media_type = "application/json"
+        filename = f"{podcast_id}_peaks.json"
     else:
         raise HTTPException(status_code=400, detail="Invalid file type")
 
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="File not found")
-
-    return FileResponse(
-        path=file_path,
-        media_type=media_type,
-        filename=filename
+    return await asyncio.to_thread(
+        _artifact_response, generator, generator.output_root / podcast_id, relative_path, media_type, filename, {}
     )
 
 
+@router.delete("/{podcast_id}")
+async def delete_podcast(podcast_id: str, generator: PodcastGenerator = Depends(get_generator)):
+    """팟캐스트 삭제 (오디오, 대사 파일, 스크립트, 상태 모두)"""
+    try:
+        reclaimed_bytes = await generator.delete_podcast(podcast_id)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return {"podcast_id": podcast_id, "deleted": True, "reclaimed_bytes": reclaimed_bytes}
+
+
+def _set_pinned(generator: PodcastGenerator, podcast_id: str, pinned: bool) -> dict:
+    try:
+        generator.set_pinned(podcast_id, pinned)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"podcast_id": podcast_id, "pinned": pinned}
+
+
+@router.put("/{podcast_id}/pin")
+async def pin_podcast(podcast_id: str, generator: PodcastGenerator = Depends(get_generator)):
+    """팟캐스트 고정 (보존 기간/용량 한도 정리에서 제외)"""
+    return _set_pinned(generator, podcast_id, True)
+
+
+@router.delete("/{podcast_id}/pin")
+async def unpin_podcast(podcast_id: str, generator: PodcastGenerator = Depends(get_generator)):
+    """팟캐스트 고정 해제"""
+    return _set_pinned(generator, podcast_id, False)
+
+
 @router.get("/list")
-async def list_podcasts():
-    """팟캐스트 목록 조회"""
-    output_dir = Path("output")
-    podcasts = []
-
-    if output_dir.exists():
-        for podcast_dir in output_dir.iterdir():
-            if podcast_dir.is_dir():
-                status_file = podcast_dir / "status.txt"
-                if status_file.exists():
-                    with open(status_file, 'r', encoding='utf-8') as f:
-                        status = f.read().strip()
-
-                    podcasts.append({
-                        "podcast_id": podcast_dir.name,
-                        "status": status,
-                        "created_at": podcast_dir.stat().st_ctime
-                    })
+async def list_podcasts(generator: PodcastGenerator = Depends(get_generator)):
+    """팟캐스트 목록 조회 (메모리의 작업 상태 저장소 기준)"""
+    podcasts = [
+        {
+            "podcast_id": podcast_id,
+            "status": record["status"],
+            "message": record["message"],
+            "progress": record["progress"],
+            "created_at": record["created_at"]
+        }
+        for podcast_id, record in await generator.status_store.items_async()
+    ]
+    podcasts.sort(key=lambda podcast: podcast["created_at"], reverse=True)
 
     return {"podcasts": podcasts}
@@ -1,5 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from src.routes.dependencies import get_tts_engine
 from src.tts.engine import TTSEngine
 
 
@@ -7,10 +8,8 @@ router = APIRouter(prefix="/voices", tags=["voices"])
 
 
 @router.get("")
-async def get_voices():
+async def get_voices(tts_engine: TTSEngine = Depends(get_tts_engine)):
     """사용 가능한 음성(화자) 목록 조회"""
-    tts_engine = TTSEngine()
-
     return {
         "speakers": tts_engine.get_podcast_voices(),
         "description": "팟캐스트 생성 시 speaker 파라미터에 화자 이름(예: 'rachel', 'adam')을 지정하세요"
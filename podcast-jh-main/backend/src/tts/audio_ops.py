@@ -0,0 +1,782 @@
+"""
+오디오 후처리 작업 (pydub/ffmpeg)
+
+프로세스 풀(audio_pool.py)의 워커 프로세스에서 실행되므로 모두 모듈 수준 함수이며,
+인자와 반환값은 피클 가능한 값(경로, 숫자)만 사용합니다. 메트릭과 트레이스는 워커 프로세스에서
+기록할 수 없으므로 각 함수는 구간별 소요 시간(초)을 돌려주고, 호출한 쪽(TTSEngine)이 기록합니다.
+
+렌더링 방식 (AUDIO_RENDER_MODE):
+    - pydub: 에피소드 전체를 PCM으로 메모리에 올려 처리. 정규화/게인/페이드마다 전체 복사본이 생겨
+      60분 에피소드는 작업당 수 GB를 사용합니다.
+    - streaming (*_streaming 함수): ffmpeg 디코더/인코더를 파이프로 연결하고 고정 크기 블록 단위로
+      게인과 페이드를 적용합니다. 메모리 사용량이 에피소드 길이와 무관하게 일정합니다
+      (가장 긴 대사 하나 + 블록 몇 개).
+"""
+import math
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.utils import mediainfo_json
+
+from src.tts import loudness, mp3_index, music, waveform
+from src.utils.files import atomic_write_json
+
+try:
+    import audioop
+except ImportError:
+    # Python 3.13+ (pydub과 같은 대체 모듈)
+    import pyaudioop as audioop
+
+
+RENDER_MODES = ("pydub", "streaming")
+
+# 스트리밍 처리 단위: 16비트 PCM, 페이드 계단 1ms, 블록 1000계단(약 1초)
+SAMPLE_WIDTH = 2
+MAX_AMPLITUDE = float(1 << (8 * SAMPLE_WIDTH - 1))
+STEPS_PER_BLOCK = 1000
+
+# MP3 외 추가 렌디션 (느린 회선의 모바일 청취자용): 이름 → 작업 디렉토리 안의 파일/디렉토리 이름
+RENDITIONS = {
+    "opus": "podcast.opus",  # Ogg Opus 32k
+    "aac": "podcast.m4a",    # AAC-LC 64k (MP4)
+    "hls": "hls",            # HLS: AAC 48k/128k 6초 세그먼트 + master.m3u8
+}
+HLS_MASTER_PLAYLIST = "master.m3u8"
+HLS_SEGMENT_SECONDS = 6
+
+
+def _rendition_output_args(name: str, output_path: str) -> List[str]:
+    """렌디션별 ffmpeg 출력 인자 (hls는 output_path가 디렉토리)"""
+    if name == "opus":
+        return ["-c:a", "libopus", "-b:a", "32k", "-ar", "48000", "-application", "audio", "-f", "ogg", output_path]
+    if name == "aac":
+        return ["-c:a", "aac", "-b:a", "64k", "-movflags", "+faststart", "-f", "mp4", output_path]
+    if name == "hls":
+        Path(output_path).mkdir(parents=True, exist_ok=True)
+        return [
+            "-map", "0:a", "-map", "0:a", "-c:a", "aac", "-b:a:0", "48k", "-b:a:1", "128k",
+            "-f", "hls", "-hls_time", str(HLS_SEGMENT_SECONDS), "-hls_playlist_type", "vod",
+            "-hls_segment_filename", os.path.join(output_path, "%v_%03d.ts"),
+            "-master_pl_name", HLS_MASTER_PLAYLIST, "-var_stream_map", "a:0,name:48k a:1,name:128k",
+            os.path.join(output_path, "%v.m3u8")
+        ]
+    raise ValueError(f"알 수 없는 렌디션: {name}")
+
+
+def _peak_dbfs(peak: int, max_amplitude: float = MAX_AMPLITUDE) -> Optional[float]:
+    """최대 진폭 → dBFS (무음이면 None, JSON에 -inf를 쓰지 않도록)"""
+    return round(20 * math.log10(peak / max_amplitude), 3) if peak else None
+
+
+def _mix_segment(audio: AudioSegment, music_path: str, music_volume: float, music_cache_directory: str) -> AudioSegment:
+    """AudioSegment 전체에 디코딩 캐시의 배경음악을 겹침"""
+    audio = audio.set_sample_width(SAMPLE_WIDTH)
+    track = music.decoded_track(music_path, audio.frame_rate, audio.channels, music_cache_directory)
+    speech = np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, audio.channels)
+    music_factor = music.music_gain(music_volume)
+
+    # 에피소드 전체 크기의 float 버퍼를 만들지 않도록 블록 단위로 합성
+    block_frames = audio.frame_rate * STEPS_PER_BLOCK // 1000
+    mixed = bytearray(len(audio.raw_data))
+    output = np.frombuffer(mixed, dtype=np.int16).reshape(-1, audio.channels)
+    for start in range(0, len(speech), block_frames):
+        output[start:start + block_frames] = music.overlay(
+            speech[start:start + block_frames], track, start, music_gain_factor=music_factor
+        )
+    return audio._spawn(bytes(mixed))
+
+
+def worker_ready() -> int:
+    """워커 프로세스 준비 확인 (이 모듈과 pydub/numpy를 미리 임포트시키는 용도, AudioProcessPool.warmup)"""
+    return os.getpid()
+
+
+def measure_loudness(line_file: str) -> Tuple[Dict, Dict[str, float]]:
+    """대사 오디오 하나의 라우드니스 측정 (TTS 결과가 도착하는 대로 실행)
+
+    Returns:
+        (loudness.measure() 결과 + {"peak_dbfs": 최대 레벨}, {"measure": 초})
+    """
+    started = time.perf_counter()
+    segment = AudioSegment.from_mp3(line_file)
+    samples = np.array(segment.get_array_of_samples(), dtype=np.float64).reshape(-1, segment.channels)
+    stats = loudness.measure(samples / segment.max_possible_amplitude, segment.frame_rate)
+    stats["peak_dbfs"] = _peak_dbfs(segment.max, segment.max_possible_amplitude)
+    return stats, {"measure": time.perf_counter() - started}
+
+
+def merge_lines(
+    line_files: List[str],
+    output_path: str,
+    pause_ms: int = 500,
+    gains_db: Optional[List[float]] = None
+) -> Tuple[List[int], List[Optional[float]], Dict[str, float]]:
+    """대사별 오디오를 무음을 사이에 두고 하나로 병합
+
+    Args:
+        line_files: 대사 순서대로의 오디오 파일 경로
+        output_path: 출력 파일 경로
+        pause_ms: 대사 사이 무음 길이 (밀리초)
+        gains_db: 대사별로 적용할 게인 (화자별 라우드니스 맞춤, 없으면 그대로)
+
+    Returns:
+        (대사별 길이(밀리초) 리스트, 게인 적용 후 대사별 최대 레벨(dBFS) 리스트, {"merge": 초, "encode": 초})
+    """
+    started = time.perf_counter()
+    combined_audio = None
+    durations: List[int] = []
+    peaks: List[Optional[float]] = []
+
+    for position, line_file in enumerate(line_files):
+        dialogue_audio = AudioSegment.from_mp3(line_file)
+        if gains_db and gains_db[position]:
+            dialogue_audio = dialogue_audio.apply_gain(gains_db[position])
+        durations.append(len(dialogue_audio))
+        peaks.append(_peak_dbfs(dialogue_audio.max, dialogue_audio.max_possible_amplitude))
+
+        if combined_audio is None:
+            combined_audio = dialogue_audio
+        else:
+            # 대사 사이에 약간의 무음 추가 (자연스러운 대화 흐름)
+            silence = AudioSegment.silent(duration=pause_ms)
+            combined_audio = combined_audio + silence + dialogue_audio
+
+    if combined_audio is None:
+        raise Exception("병합할 오디오가 없습니다")
+
+    encode_started = time.perf_counter()
+    combined_audio.export(output_path, format="mp3", bitrate="192k")
+    finished = time.perf_counter()
+    return durations, peaks, {"merge": encode_started - started, "encode": finished - encode_started}
+
+
+def enhance(
+    input_path: str,
+    output_path: str,
+    apply_speed_adjustment: bool = False,
+    peak_dbfs: Optional[float] = None,
+    gain_db: Optional[float] = None,
+    music_path: Optional[str] = None,
+    music_volume: float = 0.1,
+    music_cache_directory: str = ".music_cache",
+    renditions: Optional[Dict[str, str]] = None,
+    peaks_path: Optional[str] = None
+) -> Dict[str, float]:
+    """정규화, 볼륨 부스트, 배경음악 합성, 페이드 인/아웃 후 인코딩
+
+    peak_dbfs는 enhance_streaming과 인자를 맞추기 위한 것으로, 여기서는 normalize가 직접 계산합니다.
+    gain_db를 주면 정규화와 볼륨 부스트 대신 그 게인만 적용합니다 (병합 때 라우드니스를 맞춘 경우 0).
+    music_path를 주면 배경음악을 겹친 뒤 페이드를 적용하므로 인코딩은 한 번입니다.
+    renditions를 주면 같은 PCM을 MP3와 각 렌디션 인코더에 동시에 보냅니다.
+    peaks_path를 주면 최종 PCM의 파형 피크(waveform.py)를 함께 저장합니다.
+
+    Returns:
+        {"enhance": 초, "encode": 초} (배경음악이 있으면 "mix": 초, 렌디션이 있으면 "encode_<이름>": CPU 초,
+        피크를 저장하면 "peaks": 초 추가)
+    """
+    started = time.perf_counter()
+    audio = AudioSegment.from_mp3(input_path)
+
+    # 1. 오디오 레벨 정규화 (너무 작거나 큰 소리 방지)
+    if gain_db is None:
+        audio = audio.normalize()
+
+    # 2. 속도 조정 (선택적, 한국어는 보통 적용하지 않음)
+    if apply_speed_adjustment:
+        # 2% 속도 감소로 더 명확한 발음
+        audio = audio._spawn(audio.raw_data, overrides={
+            "frame_rate": int(audio.frame_rate * 0.98)
+        }).set_frame_rate(audio.frame_rate)
+
+    # 3. 볼륨 부스트 (명확성 향상, 너무 크지 않게)
+    audio = audio + (1.5 if gain_db is None else gain_db)
+
+    # 4. 배경음악 (음성 길이만큼 반복)
+    mix_seconds = 0.0
+    if music_path:
+        mix_started = time.perf_counter()
+        audio = _mix_segment(audio, music_path, music_volume, music_cache_directory)
+        mix_seconds = time.perf_counter() - mix_started
+
+    # 5. 자연스러운 시작/끝을 위한 페이드 인/아웃
+    # 페이드 시간을 더 길게 하여 부드러운 전환
+    audio = audio.fade_in(800).fade_out(1000)
+
+    # 6. 플레이어용 파형 피크
+    peaks_seconds = 0.0
+    if renditions or peaks_path:
+        audio = audio.set_sample_width(SAMPLE_WIDTH)
+        block_bytes = audio.frame_rate * audio.channels * SAMPLE_WIDTH
+    if peaks_path:
+        peaks_started = time.perf_counter()
+        peaks = waveform.PeakAccumulator(audio.frame_rate, audio.channels)
+        data = audio.raw_data
+        for offset in range(0, len(data), block_bytes):
+            peaks.add(data[offset:offset + block_bytes])
+        atomic_write_json(peaks_path, peaks.result())
+        peaks_seconds = time.perf_counter() - peaks_started
+
+    # 7. 고품질로 내보내기
+    # 팟캐스트 표준 비트레이트 192k (320k는 과도하게 큰 파일 크기)
+    encode_started = time.perf_counter()
+    encode_timings = {}
+    if renditions:
+        # 렌디션과 함께: 디코딩된 PCM을 1초 단위로 모든 인코더에 전달
+        data = audio.raw_data
+        encoder = _open_encoders(output_path, audio.frame_rate, audio.channels, renditions)
+        try:
+            for offset in range(0, len(data), block_bytes):
+                encoder.write(data[offset:offset + block_bytes])
+            encoder.close()
+        except BaseException:
+            encoder.abort()
+            raise
+        encode_timings = encoder.cpu_timings()
+    else:
+        audio.export(output_path, format="mp3", bitrate="192k",
+                     parameters=["-q:a", "0"])  # 최고 품질 인코딩
+    finished = time.perf_counter()
+    timings = {"enhance": encode_started - started - mix_seconds - peaks_seconds, "encode": finished - encode_started}
+    if music_path:
+        timings["mix"] = mix_seconds
+    if peaks_path:
+        timings["peaks"] = peaks_seconds
+    timings.update(encode_timings)
+    return timings
+
+
+def mix_background(
+    speech_path: str,
+    music_path: str,
+    output_path: str,
+    music_volume: float = 0.1,
+    music_cache_directory: str = ".music_cache"
+) -> Dict[str, float]:
+    """완성된 에피소드에 배경음악을 음성 길이만큼 반복해 합성 (생성 파이프라인은 enhance에서 함께 처리)
+
+    Returns:
+        {"mix": 초, "encode": 초}
+    """
+    started = time.perf_counter()
+    speech = AudioSegment.from_mp3(speech_path)
+    combined = _mix_segment(speech, music_path, music_volume, music_cache_directory)
+    encode_started = time.perf_counter()
+    combined.export(output_path, format="mp3", bitrate="320k")
+    finished = time.perf_counter()
+    return {"mix": encode_started - started, "encode": finished - encode_started}
+
+
+def extract_segment(episode_path: str, start_time: float, end_time: float, output_path: str) -> Dict[str, float]:
+    """에피소드에서 구간을 잘라 저장 (불완전한 파일이 남지 않도록 임시 경로에 쓴 뒤 교체)
+
+    Returns:
+        {"encode": 초}
+    """
+    episode = AudioSegment.from_mp3(episode_path)
+    segment = episode[int(start_time * 1000):int(end_time * 1000)]
+
+    partial_path = Path(output_path).with_suffix(".part.mp3")
+    encode_started = time.perf_counter()
+    segment.export(str(partial_path), format="mp3", bitrate="192k")
+    os.replace(partial_path, output_path)
+    return {"encode": time.perf_counter() - encode_started}
+
+
+def _probe(path: str) -> Tuple[int, int]:
+    """(샘플레이트, 채널 수)"""
+    info = mediainfo_json(path)
+    stream = next(stream for stream in info["streams"] if stream["codec_type"] == "audio")
+    return int(stream["sample_rate"]), int(stream["channels"])
+
+
+class _PcmEncoder:
+    """16비트 PCM을 파이프로 받아 인코딩하는 ffmpeg 프로세스 하나 (기본 MP3, output_args로 다른 형식)"""
+
+    def __init__(
+        self,
+        output_path: str,
+        frame_rate: int,
+        channels: int,
+        bitrate: str = "192k",
+        parameters: Sequence[str] = (),
+        output_args: Optional[Sequence[str]] = None
+    ):
+        if output_args is None:
+            output_args = ["-b:a", bitrate, *parameters, "-f", "mp3", output_path]
+        self._stderr = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            [AudioSegment.converter, "-y", "-v", "error",
+             "-f", "s16le", "-ar", str(frame_rate), "-ac", str(channels), "-i", "pipe:0", *output_args],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self._stderr
+        )
+        self.seconds = 0.0
+        # 인코더 프로세스가 사용한 CPU 시간 (종료 후 기록, wait4가 없는 플랫폼은 대기 시간으로 대신함)
+        self.cpu_seconds = 0.0
+
+    def write(self, data: bytes):
+        started = time.perf_counter()
+        try:
+            self.process.stdin.write(data)
+        except BrokenPipeError:
+            # ffmpeg가 먼저 종료됨 → close()에서 ffmpeg 오류 메시지와 함께 실패
+            self.close()
+            raise
+        self.seconds += time.perf_counter() - started
+
+    def close(self):
+        started = time.perf_counter()
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        if self.process.returncode is None and hasattr(os, "wait4"):
+            _, status, usage = os.wait4(self.process.pid, 0)
+            self.process.returncode = os.waitstatus_to_exitcode(status)
+            self.cpu_seconds = usage.ru_utime + usage.ru_stime
+        else:
+            self.process.wait()
+            self.cpu_seconds = time.perf_counter() - started
+        self.seconds += time.perf_counter() - started
+
+        self._stderr.seek(0)
+        message = self._stderr.read().decode("utf-8", "ignore").strip()
+        self._stderr.close()
+        if self.process.returncode != 0:
+            raise Exception(f"ffmpeg 인코딩 실패 (코드 {self.process.returncode}): {message}")
+
+    def abort(self):
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self._stderr.close()
+
+
+class _EncoderGroup:
+    """같은 PCM을 여러 인코더 프로세스(MP3 + 렌디션)에 보냄
+
+    인코더마다 쓰기 스레드를 두어, 한 인코더의 파이프가 차 있어도 다른 인코더는 계속 받아 병렬로 인코딩합니다.
+    대기열 크기가 정해져 있으므로 메모리에는 인코더당 블록 몇 개만 머뭅니다.
+    """
+
+    def __init__(self, encoders: Dict[str, _PcmEncoder], max_pending_blocks: int = 4):
+        self.encoders = encoders
+        self.seconds = 0.0
+        self._queues = {name: queue.Queue(maxsize=max_pending_blocks) for name in encoders}
+        self._failed = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._feed, args=(encoders[name], self._queues[name]), daemon=True)
+            for name in encoders
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _feed(self, encoder: _PcmEncoder, blocks: queue.Queue):
+        while True:
+            data = blocks.get()
+            if data is None:
+                return
+            if self._failed.is_set():
+                continue
+            try:
+                encoder.process.stdin.write(data)
+            except (BrokenPipeError, OSError, ValueError):
+                # ffmpeg가 먼저 종료됨 → close()에서 ffmpeg 오류 메시지와 함께 실패
+                self._failed.set()
+
+    def write(self, data: bytes):
+        started = time.perf_counter()
+        if self._failed.is_set():
+            self.close()
+        for blocks in self._queues.values():
+            blocks.put(data)
+        self.seconds += time.perf_counter() - started
+
+    def _stop_feeding(self):
+        for blocks in self._queues.values():
+            blocks.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def close(self):
+        started = time.perf_counter()
+        self._stop_feeding()
+        for encoder in self.encoders.values():
+            encoder.close()
+        self.seconds += time.perf_counter() - started
+
+    def abort(self):
+        for encoder in self.encoders.values():
+            encoder.abort()
+        if any(thread.is_alive() for thread in self._threads):
+            self._stop_feeding()
+
+    def cpu_timings(self) -> Dict[str, float]:
+        """{"encode_<이름>": 인코더 프로세스 CPU 시간(초)}"""
+        return {f"encode_{name}": encoder.cpu_seconds for name, encoder in self.encoders.items()}
+
+
+def _open_encoders(
+    output_path: str,
+    frame_rate: int,
+    channels: int,
+    renditions: Optional[Dict[str, str]] = None
+):
+    """최종 MP3 인코더 (렌디션이 있으면 같은 PCM을 받는 인코더 묶음)
+
+    Args:
+        renditions: 렌디션 이름 → 출력 경로 (hls는 디렉토리)
+    """
+    mp3 = _PcmEncoder(output_path, frame_rate, channels, "192k", parameters=["-q:a", "0"])
+    if not renditions:
+        return mp3
+
+    encoders = {"mp3": mp3}
+    try:
+        for name, path in renditions.items():
+            encoders[name] = _PcmEncoder(
+                path, frame_rate, channels, output_args=_rendition_output_args(name, path)
+            )
+    except BaseException:
+        for encoder in encoders.values():
+            encoder.abort()
+        raise
+    return _EncoderGroup(encoders)
+
+
+def _encode_timings(encoder) -> Dict[str, float]:
+    timings = {"encode": encoder.seconds}
+    if isinstance(encoder, _EncoderGroup):
+        timings.update(encoder.cpu_timings())
+    return timings
+
+
+def _pcm_blocks(
+    input_path: str,
+    frame_rate: int,
+    channels: int,
+    block_bytes: int,
+    input_options: Sequence[str] = (),
+    filters: Optional[str] = None
+) -> Iterator[bytes]:
+    """ffmpeg로 디코딩한 16비트 PCM을 block_bytes 단위로 읽음 (마지막 블록은 더 짧을 수 있음)"""
+    command = [AudioSegment.converter, "-v", "error", *input_options, "-i", input_path]
+    if filters:
+        command += ["-af", filters]
+    command += ["-f", "s16le", "-ar", str(frame_rate), "-ac", str(channels), "pipe:1"]
+
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr)
+        finished = False
+        try:
+            while True:
+                block = process.stdout.read(block_bytes)
+                if not block:
+                    break
+                yield block
+            finished = True
+        finally:
+            if not finished and process.poll() is None:
+                # 호출한 쪽이 중간에 멈춤 (예: 예외로 인코딩 중단)
+                process.kill()
+            process.stdout.close()
+            process.wait()
+
+        if process.returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode("utf-8", "ignore").strip()
+            raise Exception(f"ffmpeg 디코딩 실패 (코드 {process.returncode}): {message}")
+
+
+def _ramp(data: bytes, step_bytes: int, first_step: int, total_steps: int, rising: bool) -> bytes:
+    """1ms 계단마다 선형으로 바뀌는 배율 적용 (pydub fade와 같은 방식)
+
+    Args:
+        data: 페이드 구간 안의 PCM
+        step_bytes: 계단 하나의 바이트 수
+        first_step: data의 첫 계단이 페이드 구간에서 몇 번째인지
+        total_steps: 페이드 구간 전체 계단 수
+        rising: True면 페이드 인(0→1), False면 페이드 아웃(1→0)
+    """
+    chunks = []
+    for offset in range(0, len(data), step_bytes):
+        step = first_step + offset // step_bytes
+        if step >= total_steps:
+            chunks.append(data[offset:])
+            break
+        ratio = step / total_steps if rising else 1 - step / total_steps
+        chunks.append(audioop.mul(data[offset:offset + step_bytes], SAMPLE_WIDTH, ratio))
+    return b"".join(chunks)
+
+
+def merge_lines_streaming(
+    line_files: List[str],
+    output_path: str,
+    pause_ms: int = 500,
+    gains_db: Optional[List[float]] = None
+) -> Tuple[List[int], List[Optional[float]], Dict[str, float]]:
+    """merge_lines의 스트리밍 버전: 대사를 하나씩 디코딩해 인코더 하나에 이어서 보냄
+
+    모든 대사는 첫 대사의 샘플레이트/채널 수에 맞추며, 메모리에는 대사 하나만 올라갑니다.
+
+    Returns:
+        (대사별 길이(밀리초) 리스트, 게인 적용 후 대사별 최대 레벨(dBFS) 리스트, {"merge": 초, "encode": 초})
+    """
+    started = time.perf_counter()
+    durations: List[int] = []
+    peaks: List[Optional[float]] = []
+    encoder: Optional[_PcmEncoder] = None
+    silence = b""
+
+    try:
+        for position, line_file in enumerate(line_files):
+            segment = AudioSegment.from_mp3(line_file)
+            if encoder is None:
+                frame_rate, channels = segment.frame_rate, segment.channels
+                encoder = _PcmEncoder(output_path, frame_rate, channels, "192k")
+                # 대사 사이에 약간의 무음 추가 (자연스러운 대화 흐름)
+                silence = b"\0" * (int(frame_rate * pause_ms / 1000) * channels * SAMPLE_WIDTH)
+            else:
+                encoder.write(silence)
+
+            segment = segment.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(SAMPLE_WIDTH)
+            if gains_db and gains_db[position]:
+                segment = segment.apply_gain(gains_db[position])
+            durations.append(len(segment))
+            peaks.append(_peak_dbfs(segment.max))
+            encoder.write(segment.raw_data)
+
+        if encoder is None:
+            raise Exception("병합할 오디오가 없습니다")
+        encoder.close()
+    except BaseException:
+        if encoder is not None:
+            encoder.abort()
+        raise
+
+    total = time.perf_counter() - started
+    return durations, peaks, {"merge": total - encoder.seconds, "encode": encoder.seconds}
+
+
+def enhance_streaming(
+    input_path: str,
+    output_path: str,
+    apply_speed_adjustment: bool = False,
+    peak_dbfs: Optional[float] = None,
+    gain_db: Optional[float] = None,
+    music_path: Optional[str] = None,
+    music_volume: float = 0.1,
+    music_cache_directory: str = ".music_cache",
+    renditions: Optional[Dict[str, str]] = None,
+    peaks_path: Optional[str] = None
+) -> Dict[str, float]:
+    """enhance의 스트리밍 버전: 정규화 게인 + 1.5dB, 배경음악, 페이드 인 800ms/아웃 1000ms를 블록 단위로 적용
+
+    페이드 아웃은 마지막 1초를 붙잡아 두었다가 끝에서 적용하므로 전체 길이를 미리 알 필요가 없습니다.
+
+    Args:
+        input_path: 입력 오디오 파일 경로
+        output_path: 출력 오디오 파일 경로
+        apply_speed_adjustment: 2% 속도 감소 (ffmpeg asetrate 필터)
+        peak_dbfs: 입력 전체의 최대 레벨. 병합 때 기록한 대사별 최대 레벨 중 최댓값을 주면 분석 패스를 생략하고,
+            없으면 한 번 디코딩하면서 블록별 최대값으로 계산
+        gain_db: 정규화 + 볼륨 부스트 대신 적용할 게인 (병합 때 라우드니스를 맞춘 경우 0)
+        music_path: 겹칠 배경음악 (디코딩 캐시를 memory-map으로 읽음)
+        music_volume: 배경음악 크기 (0~1)
+        music_cache_directory: 배경음악 디코딩 캐시 디렉토리
+        renditions: 렌디션 이름 → 출력 경로. 같은 PCM 블록을 MP3와 함께 각 인코더에 보내 병렬로 인코딩
+        peaks_path: 인코더로 보내는 블록에서 계산한 파형 피크(waveform.py)를 저장할 경로
+
+    Returns:
+        {"enhance": 초, "encode": 초} (배경음악이 있으면 "mix": 초, 렌디션이 있으면 "encode_<이름>": CPU 초,
+        피크를 저장하면 "peaks": 초 추가)
+    """
+    started = time.perf_counter()
+    frame_rate, channels = _probe(input_path)
+    step_frames = max(1, frame_rate // 1000)
+    step_bytes = step_frames * channels * SAMPLE_WIDTH
+    block_bytes = step_bytes * STEPS_PER_BLOCK
+    filters = f"asetrate={int(frame_rate * 0.98)},aresample={frame_rate}" if apply_speed_adjustment else None
+
+    def blocks() -> Iterator[bytes]:
+        return _pcm_blocks(input_path, frame_rate, channels, block_bytes, filters=filters)
+
+    # 1. 정규화 게인 (pydub normalize와 같은 headroom 0.1dB) + 2. 볼륨 부스트 1.5dB
+    if gain_db is None:
+        if peak_dbfs is None:
+            peak_dbfs = _peak_dbfs(max((audioop.max(block, SAMPLE_WIDTH) for block in blocks()), default=0))
+        gain_db = (-peak_dbfs - 0.1 if peak_dbfs is not None else 0.0) + 1.5
+    factor = 10 ** (gain_db / 20)
+
+    track = music.decoded_track(music_path, frame_rate, channels, music_cache_directory) if music_path else None
+    music_factor = music.music_gain(music_volume)
+    mix_seconds = 0.0
+    frame_position = 0
+
+    fade_in_steps = 800 * frame_rate // (1000 * step_frames)
+    fade_out_bytes = 1000 * frame_rate // (1000 * step_frames) * step_bytes
+
+    peaks = waveform.PeakAccumulator(frame_rate, channels) if peaks_path else None
+    peaks_seconds = 0.0
+
+    def emit(data: bytes):
+        nonlocal peaks_seconds
+        if peaks is not None:
+            peaks_started = time.perf_counter()
+            peaks.add(data)
+            peaks_seconds += time.perf_counter() - peaks_started
+        encoder.write(data)
+
+    encoder = _open_encoders(output_path, frame_rate, channels, renditions)
+    try:
+        held = b""
+        step = 0
+        for block in blocks():
+            if track is None:
+                block = audioop.mul(block, SAMPLE_WIDTH, factor)
+            else:
+                # 게인과 배경음악을 한 번에 적용
+                mix_started = time.perf_counter()
+                speech = np.frombuffer(block, dtype=np.int16).reshape(-1, channels)
+                block = music.overlay(speech, track, frame_position, factor, music_factor).tobytes()
+                frame_position += len(speech)
+                mix_seconds += time.perf_counter() - mix_started
+            # 3. 페이드 인
+            if step < fade_in_steps:
+                block = _ramp(block, step_bytes, step, fade_in_steps, rising=True)
+            step += len(block) // step_bytes
+
+            # 페이드 아웃할 마지막 1초는 끝날 때까지 붙잡아 둠
+            held += block
+            if len(held) > fade_out_bytes:
+                cut = len(held) - fade_out_bytes
+                emit(held[:cut])
+                held = held[cut:]
+
+        # 4. 페이드 아웃
+        emit(_ramp(held, step_bytes, 0, max(1, len(held) // step_bytes), rising=False))
+        encoder.close()
+    except BaseException:
+        encoder.abort()
+        raise
+
+    if peaks is not None:
+        peaks_started = time.perf_counter()
+        atomic_write_json(peaks_path, peaks.result())
+        peaks_seconds += time.perf_counter() - peaks_started
+
+    total = time.perf_counter() - started
+    timings = {"enhance": total - encoder.seconds - mix_seconds - peaks_seconds, **_encode_timings(encoder)}
+    if track is not None:
+        timings["mix"] = mix_seconds
+    if peaks is not None:
+        timings["peaks"] = peaks_seconds
+    return timings
+
+
+def mix_background_streaming(
+    speech_path: str,
+    music_path: str,
+    output_path: str,
+    music_volume: float = 0.1,
+    music_cache_directory: str = ".music_cache"
+) -> Dict[str, float]:
+    """mix_background의 스트리밍 버전: 음성 블록마다 디코딩 캐시의 배경음악 구간을 겹침
+
+    Returns:
+        {"mix": 초, "encode": 초}
+    """
+    started = time.perf_counter()
+    frame_rate, channels = _probe(speech_path)
+    block_bytes = frame_rate * channels * SAMPLE_WIDTH
+    track = music.decoded_track(music_path, frame_rate, channels, music_cache_directory)
+    music_factor = music.music_gain(music_volume)
+
+    encoder = _PcmEncoder(output_path, frame_rate, channels, "320k")
+    try:
+        frame_position = 0
+        for block in _pcm_blocks(speech_path, frame_rate, channels, block_bytes):
+            speech = np.frombuffer(block, dtype=np.int16).reshape(-1, channels)
+            encoder.write(music.overlay(speech, track, frame_position, music_gain_factor=music_factor).tobytes())
+            frame_position += len(speech)
+        encoder.close()
+    except BaseException:
+        encoder.abort()
+        raise
+
+    total = time.perf_counter() - started
+    return {"mix": total - encoder.seconds, "encode": encoder.seconds}
+
+
+def extract_segment_streaming(episode_path: str, start_time: float, end_time: float, output_path: str) -> Dict[str, float]:
+    """extract_segment의 스트리밍 버전: ffmpeg가 해당 구간만 디코딩/인코딩
+
+    Returns:
+        {"encode": 초}
+    """
+    partial_path = Path(output_path).with_suffix(".part.mp3")
+    encode_started = time.perf_counter()
+    subprocess.run(
+        [AudioSegment.converter, "-y", "-v", "error", "-ss", f"{start_time:.3f}", "-i", episode_path,
+         "-t", f"{end_time - start_time:.3f}", "-b:a", "192k", "-f", "mp3", str(partial_path)],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    os.replace(partial_path, output_path)
+    return {"encode": time.perf_counter() - encode_started}
+
+
+def index_lines(audio_path: str, spans: List[Tuple[float, float]], index_path: str) -> Dict[str, float]:
+    """완성된 MP3의 대사별 바이트 구간 인덱스(mp3_index.py) 저장 (디코딩 없이 프레임 헤더만 읽음)
+
+    Args:
+        audio_path: 인코딩이 끝난 MP3 경로
+        spans: 대사별 (시작 초, 끝 초)
+        index_path: 인덱스 JSON을 저장할 경로
+
+    Returns:
+        {"index": 초}
+    """
+    started = time.perf_counter()
+    frames = mp3_index.scan(audio_path)
+    ranges = mp3_index.line_ranges(frames, spans)
+    atomic_write_json(index_path, {
+        "version": 1,
+        "audio_bytes": os.path.getsize(audio_path),
+        "frame_rate": frames["frame_rate"],
+        "samples_per_frame": frames["samples_per_frame"],
+        "encoder_delay": frames["encoder_delay"],
+        "frame_count": len(frames["offsets"]) - 1,
+        "lines": [
+            {"start_time": start_time, "end_time": end_time, **line_range}
+            for (start_time, end_time), line_range in zip(spans, ranges)
+        ]
+    })
+    return {"index": time.perf_counter() - started}
+
+
+# 렌더링 방식별 작업 함수 (대사 하나만 디코딩하는 라우드니스 측정과 프레임 헤더만 읽는 인덱스는 두 방식이 같음)
+OPERATIONS = {
+    "pydub": {
+        "measure": measure_loudness,
+        "merge": merge_lines,
+        "enhance": enhance,
+        "mix": mix_background,
+        "extract": extract_segment,
+        "index": index_lines,
+    },
+    "streaming": {
+        "measure": measure_loudness,
+        "merge": merge_lines_streaming,
+        "enhance": enhance_streaming,
+        "mix": mix_background_streaming,
+        "extract": extract_segment_streaming,
+        "index": index_lines,
+    },
+}
@@ -0,0 +1,115 @@
+"""
+오디오 처리 프로세스 풀
+
+pydub 디코딩/병합/정규화와 ffmpeg 인코딩은 수 초~수 분 동안 CPU를 쓰므로 이벤트 루프에서 실행하면
+그동안 모든 요청이 멈춥니다. 이 풀은 audio_ops의 작업을 크기가 고정된 별도 프로세스에서 실행하며,
+크기(AUDIO_WORKERS)는 HTTP 워커 수와 따로 정합니다 (uvicorn 워커마다 풀이 하나씩 생깁니다).
+
+빈 워커가 없으면 작업은 이벤트 루프를 막지 않고 대기하며, 대기 중인 작업이 AUDIO_MAX_PENDING 이상이면
+saturated가 True가 되어 생성 라우트가 새 요청을 받지 않습니다 (이미 LLM/TTS 비용을 쓴 작업은 실패시키지 않음).
+"""
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from src.utils.metrics import AUDIO_POOL_BUSY, AUDIO_POOL_PENDING, AUDIO_POOL_WAIT_SECONDS
+from src.utils.tracing import span
+
+
+class AudioProcessPool:
+    """크기가 고정된 오디오 처리 프로세스 풀
+
+    Args:
+        size: 워커 프로세스 수 (동시에 실행되는 오디오 작업 수)
+        max_pending: 이 수 이상 대기하면 포화(saturated)로 판단 (0이면 판단하지 않음)
+    """
+
+    def __init__(self, size: int, max_pending: int):
+        self.size = max(1, size)
+        self.max_pending = max(0, max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.pending = 0
+
+    @classmethod
+    def from_settings(cls, settings) -> "AudioProcessPool":
+        return cls(settings.audio_workers, settings.audio_max_pending)
+
+    @property
+    def saturated(self) -> bool:
+        return self.max_pending > 0 and self.pending >= self.max_pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # fork는 이벤트 루프/스레드 상태까지 복제하므로 spawn 사용 (워커는 첫 작업 때 시작됨)
+            self._executor = ProcessPoolExecutor(max_workers=self.size, mp_context=get_context("spawn"))
+            logger.info(f"오디오 처리 프로세스 풀 시작: 워커 {self.size}개")
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.size)
+            self._slots_loop = loop
+        return self._slots
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """빈 워커를 기다린 뒤 fn(*args)를 워커 프로세스에서 실행
+
+        Args:
+            fn: audio_ops의 모듈 수준 함수 (피클 가능해야 함)
+            *args: fn 인자 (피클 가능해야 함)
+
+        Returns:
+            fn의 반환값
+        """
+        slots = self._get_slots()
+        started = time.perf_counter()
+
+        self.pending += 1
+        AUDIO_POOL_PENDING.inc()
+        try:
+            with span("audio.queue", kind="audio_queue", pending=self.pending):
+                await slots.acquire()
+        finally:
+            self.pending -= 1
+            AUDIO_POOL_PENDING.dec()
+        AUDIO_POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+        AUDIO_POOL_BUSY.inc()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료(OOM 등)되면 풀을 버리고 다음 작업에서 새로 시작
+            logger.error("오디오 처리 워커가 비정상 종료되어 프로세스 풀을 다시 시작합니다.")
+            self.shutdown(wait=False)
+            raise
+        finally:
+            AUDIO_POOL_BUSY.dec()
+            slots.release()
+
+    async def warmup(self, fn: Callable[[], Any]) -> int:
+        """워커 프로세스를 모두 미리 시작 (spawn과 모듈 임포트 시간을 첫 작업에서 제거)
+
+        Args:
+            fn: 워커에서 실행할 가벼운 함수 (audio_ops.worker_ready, 워커의 PID 반환)
+
+        Returns:
+            시작된 워커 수
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        # 작업을 풀 크기만큼 한꺼번에 넣으면 빈 워커가 없어 매번 새 프로세스를 시작함
+        pids = await asyncio.gather(*(loop.run_in_executor(executor, fn) for _ in range(self.size)))
+        return len(set(pids))
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
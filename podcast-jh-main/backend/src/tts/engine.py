@@ -1,13 +1,71 @@
 from elevenlabs import VoiceSettings, save
 from elevenlabs.client import ElevenLabs
-from pydub import AudioSegment
-from src.utils.config import Settings
+from elevenlabs.core.api_error import ApiError
+from src.tts import audio_ops, loudness, music
+from src.tts.audio_pool import AudioProcessPool
+from src.tts.normalizer import korean_normalizer, normalize_korean
+from src.utils.cassette import Cassette
+from src.utils.config import Settings, get_settings
+from src.utils.files import atomic_write_json
 from loguru import logger
+from pathlib import Path
+from typing import Optional
 import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+
+from src.utils.metrics import (
+    ENCODE_CPU_SECONDS,
+    ENCODE_SECONDS,
+    ENHANCE_SECONDS,
+    INDEX_SECONDS,
+    LOUDNESS_LIMITED_DB,
+    MEASURE_SECONDS,
+    MERGE_SECONDS,
+    MIX_SECONDS,
+    PEAKS_SECONDS,
+    TTS_CHARACTERS,
+    TTS_CHARACTERS_PER_SECOND,
+    TTS_LINE_SECONDS,
+    TTS_QUEUE_DEPTH,
+    TTS_REQUEST_ERROR_SECONDS,
+    TTS_REQUEST_OK_SECONDS,
+    TTS_RETRIES,
+)
+from src.utils.tracing import span
+
+# audio_ops가 돌려주는 구간 이름 → 메트릭
+AUDIO_OPERATION_SECONDS = {
+    "measure": MEASURE_SECONDS,
+    "merge": MERGE_SECONDS,
+    "enhance": ENHANCE_SECONDS,
+    "mix": MIX_SECONDS,
+    "peaks": PEAKS_SECONDS,
+    "index": INDEX_SECONDS,
+    "encode": ENCODE_SECONDS,
+    **{f"encode_{name}": histogram for name, histogram in ENCODE_CPU_SECONDS.items()},
+}
 
 class TTSEngine:
-    def __init__(self):
-        self.settings = Settings()
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
+        self.cassette = Cassette.from_settings(self.settings)
+        # 모든 대사가 같은 클라이언트(연결 풀)를 공유 (호출마다 만들면 대사마다 새 TCP/TLS 연결)
+        self.elevenlabs = ElevenLabs(api_key=self.settings.elevenlabs_api_key, base_url=self.settings.elevenlabs_base_url)
+        self.audio_pool = AudioProcessPool.from_settings(self.settings)
+        if self.settings.audio_render_mode not in audio_ops.RENDER_MODES:
+            raise ValueError(
+                f"지원하지 않는 AUDIO_RENDER_MODE: {self.settings.audio_render_mode} (사용 가능: {', '.join(audio_ops.RENDER_MODES)})"
+            )
+        self.audio_ops = audio_ops.OPERATIONS[self.settings.audio_render_mode]
+        unknown = [name for name in self.settings.audio_renditions if name not in audio_ops.RENDITIONS]
+        if unknown:
+            raise ValueError(
+                f"지원하지 않는 AUDIO_RENDITIONS: {', '.join(unknown)} (사용 가능: {', '.join(audio_ops.RENDITIONS)})"
+            )
 
         # 다중 화자를 위한 음성 매핑 (팟캐스트 대화 지원)
         # 각 화자는 고유한 voice_id를 가지며, 성별 구분 없이 사용 가능
@@ -81,12 +139,107 @@ class TTSEngine:
             "news": ["lily", "sam"]               # 뉴스 형식
         }
 
+    async def check_ffmpeg(self) -> str:
+        """ffmpeg/ffprobe가 PATH에 있고 실행되는지 확인 (병합, 후처리, 렌디션 인코딩에 필요)
+
+        Returns:
+            ffmpeg 버전 (예: "ffmpeg version 7.0.2")
+
+        Raises:
+            RuntimeError: ffmpeg 또는 ffprobe를 찾을 수 없거나 실행할 수 없음
+        """
+        missing = [name for name in ("ffmpeg", "ffprobe") if shutil.which(name) is None]
+        if missing:
+            raise RuntimeError(f"{', '.join(missing)}를 PATH에서 찾을 수 없습니다. 오디오 처리에 필요합니다.")
+
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-hide_banner", "-version",
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg 실행 실패 (종료 코드 {process.returncode})")
+        # "ffmpeg version 7.0.2 Copyright ..." → "ffmpeg version 7.0.2"
+        return " ".join(stdout.decode(errors="replace").split()[:3]) if stdout else "ffmpeg"
+
+    async def warmup(self, connect: bool = True) -> dict:
+        """시작 시 준비 작업: ffmpeg 확인, 오디오 워커 프로세스 시작, ElevenLabs 연결 열기
+
+        Args:
+            connect: 오디오 워커와 ElevenLabs 연결도 미리 준비할지 (False면 ffmpeg 확인만)
+
+        Returns:
+            {"ffmpeg": 버전, "audio_workers": 시작한 워커 수, "elevenlabs": 연결 여부}
+
+        Raises:
+            RuntimeError: ffmpeg를 사용할 수 없음
+        """
+        result = {"ffmpeg": await self.check_ffmpeg(), "audio_workers": 0, "elevenlabs": False}
+        if not connect:
+            return result
+
+        async def connect_elevenlabs() -> bool:
+            if self.cassette is not None and self.cassette.mode == "replay":
+                return False
+            try:
+                # 문자를 쓰지 않는 음성 목록 조회 (오류 응답이어도 연결은 풀에 남음)
+                await asyncio.to_thread(self.elevenlabs.voices.get_all)
+            except ApiError:
+                pass
+            except Exception as e:
+                logger.warning(f"ElevenLabs 연결 실패 (워밍업): {str(e)}")
+                return False
+            return True
+
+        result["audio_workers"], result["elevenlabs"] = await asyncio.gather(
+            self.audio_pool.warmup(audio_ops.worker_ready), connect_elevenlabs()
+        )
+        return result
+
+    def line_key(self, speaker: str, text: str, language: str = "ko") -> str:
+        """대사 오디오 캐시 키 (화자 음성, 언어, 텍스트가 같으면 같은 오디오)"""
+        voice_info = self.podcast_voices.get(speaker, self.podcast_voices["rachel"])
+        digest = hashlib.sha1(f"{voice_info['id']}|{language}|{text}".encode('utf-8')).hexdigest()
+        return digest[:16]
+
+    async def synthesize_line(
+        self,
+        speaker: str,
+        text: str,
+        language: str,
+        output_path: str,
+        index: Optional[int] = None
+    ) -> str:
+        """대사 한 줄을 화자 음성으로 합성"""
+        voice_info = self.podcast_voices.get(speaker)
+        if not voice_info:
+            logger.warning(f"알 수 없는 화자 '{speaker}', 기본값 'rachel' 사용")
+            voice_info = self.podcast_voices["rachel"]
+
+        voice_id = voice_info["id"]
+        started = time.perf_counter()
+        with span("tts.line", kind="tts_line", index=index, speaker=speaker, chars=len(text)) as line_span:
+            if language == "ko":
+                await self.text_to_speech_korean_optimized(text, voice_id, output_path)
+            else:
+                await self.text_to_speech(text, voice_id, output_path)
+            if line_span:
+                line_span.set_attribute("bytes", os.path.getsize(output_path))
+
+        elapsed = time.perf_counter() - started
+        TTS_LINE_SECONDS.observe(elapsed)
+        TTS_CHARACTERS.inc(len(text))
+        if elapsed > 0:
+            TTS_CHARACTERS_PER_SECOND.observe(len(text) / elapsed)
+        return output_path
+
     async def generate_dialogue_podcast(
         self,
         dialogue_script: list[dict],
         language: str = "ko",
         tts_engine: str = "elevenlabs",
-        output_path: str = "podcast.mp3"
+        output_path: str = "podcast.mp3",
+        lines_dir: Optional[str] = None
     ) -> tuple[str, list[dict]]:
         """다중 화자 대화형 팟캐스트 오디오 생성
 
@@ -99,21 +252,44 @@ class TTSEngine:
             language: 언어 코드 (ko, en)
             tts_engine: TTS 엔진 (elevenlabs)
             output_path: 출력 파일 경로
+            lines_dir: 대사별 오디오 체크포인트 디렉토리.
+                지정하면 {line_key}.mp3로 보관하고 이미 있는 대사는 다시 합성하지 않음
+                (라우드니스 측정값도 {line_key}.loudness.json으로 보관).
+                지정하지 않으면 임시 파일을 사용하고 병합 후 삭제함
 
         Returns:
             tuple: (생성된 오디오 파일 경로, 타임스탬프 메타데이터)
         """
         import tempfile
-        import os
 
         logger.info(f"다중 화자 대화형 팟캐스트 생성 시작 - 대화 수: {len(dialogue_script)}")
 
         if not dialogue_script:
             raise Exception("대화 스크립트가 비어있습니다")
 
+        line_files: list[tuple[int, str]] = []  # (대사 인덱스, 오디오 파일)
         temp_files = []
-        dialogue_metadata = []  # 타임스탬프 메타데이터
-        current_time = 0  # 현재 누적 시간 (밀리초)
+        # 대사별 라우드니스 측정 (다음 대사를 합성하는 동안 오디오 처리 풀에서 실행)
+        measurements: dict[int, asyncio.Task] = {}
+        measure_loudness = self.settings.loudness_target is not None
+
+        if lines_dir:
+            Path(lines_dir).mkdir(parents=True, exist_ok=True)
+
+        # 이 작업에서 합성을 기다리는 대사 수 (전체 TTS 대기열 깊이 메트릭에 반영)
+        pending = sum(
+            1 for dialogue in dialogue_script
+            if dialogue.get("text", "").strip() and not (
+                lines_dir and (Path(lines_dir) / f"{self.line_key(dialogue.get('speaker', 'rachel'), dialogue['text'], language)}.mp3").exists()
+            )
+        )
+        TTS_QUEUE_DEPTH.inc(pending)
+
+        if language == "ko":
+            # 모든 대사를 한 번에 정규화해 캐시에 넣어 둠 (대사별 합성에서는 캐시 조회만)
+            korean_normalizer.normalize_batch(
+                dialogue["text"] for dialogue in dialogue_script if dialogue.get("text", "").strip()
+            )
 
         try:
             # 각 대사를 개별적으로 TTS 처리
@@ -125,72 +301,64 @@ class TTSEngine:
                     logger.warning(f"대화 {i+1}: 빈 텍스트, 건너뜀")
                     continue
 
-                # 화자 정보 가져오기
-                voice_info = self.podcast_voices.get(speaker)
-                if not voice_info:
-                    logger.warning(f"알 수 없는 화자 '{speaker}', 기본값 'rachel' 사용")
-                    voice_info = self.podcast_voices["rachel"]
-
-                logger.info(f"대화 {i+1}/{len(dialogue_script)} - 화자: {voice_info['name']}")
-
-                # 임시 파일 생성
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f"_dialogue_{i}.mp3")
-                temp_files.append(temp_file.name)
-                temp_file.close()
-
-                # TTS 변환
-                voice_id = voice_info["id"]
-                if language == "ko":
-                    await self.text_to_speech_korean_optimized(text, voice_id, temp_file.name)
-                else:
-                    await self.text_to_speech(text, voice_id, temp_file.name)
-
-            # 모든 대사 오디오를 하나로 병합하면서 타임스탬프 기록
-            logger.info("대화 오디오 파일 병합 중...")
-            combined_audio = None
-            for i, temp_file in enumerate(temp_files):
-                dialogue_audio = AudioSegment.from_mp3(temp_file)
-                duration_ms = len(dialogue_audio)  # 오디오 길이 (밀리초)
-
-                # 현재 대사의 화자 정보
-                dialogue = dialogue_script[i]
-                speaker = dialogue.get("speaker", "rachel")
-                text = dialogue.get("text", "")
-
-                # 타임스탬프 메타데이터 기록
-                voice_info = self.podcast_voices.get(speaker, self.podcast_voices["rachel"])
-                dialogue_metadata.append({
-                    "index": i,
-                    "speaker": speaker,
-                    "speaker_name": voice_info["name"],
-                    "gender": voice_info["gender"],
-                    "text": text,
-                    "start_time": current_time / 1000,  # 초 단위로 변환
-                    "end_time": (current_time + duration_ms) / 1000,  # 초 단위로 변환
-                    "duration": duration_ms / 1000  # 초 단위로 변환
-                })
-
-                if combined_audio is None:
-                    combined_audio = dialogue_audio
+                if lines_dir:
+                    line_path = Path(lines_dir) / f"{self.line_key(speaker, text, language)}.mp3"
+                    line_files.append((i, str(line_path)))
+
+                    if line_path.exists():
+                        logger.info(f"대화 {i+1}/{len(dialogue_script)} - 체크포인트 오디오 재사용: {line_path.name}")
+                        with span("tts.line", kind="tts_line", index=i, speaker=speaker, chars=len(text), cached=True):
+                            pass
+                    else:
+                        # 합성 도중 중단되어도 불완전한 파일이 체크포인트로 남지 않도록 임시 경로에 쓴 뒤 교체
+                        partial_path = line_path.with_suffix(".part.mp3")
+                        logger.info(f"대화 {i+1}/{len(dialogue_script)} - 화자: {speaker}")
+                        await self.synthesize_line(speaker, text, language, str(partial_path), index=i)
+                        os.replace(partial_path, line_path)
+                        pending -= 1
+                        TTS_QUEUE_DEPTH.dec()
+
+                    if measure_loudness:
+                        measurements[i] = asyncio.create_task(
+                            self.measure_line(str(line_path), line_path.with_suffix(".loudness.json"))
+                        )
                 else:
-                    # 대사 사이에 약간의 무음 추가 (자연스러운 대화 흐름)
-                    silence = AudioSegment.silent(duration=500)  # 500ms 무음
-                    combined_audio = combined_audio + silence + dialogue_audio
-                    current_time += 500  # 무음 시간 추가
-
-                current_time += duration_ms
-
-            # 최종 파일로 내보내기
-            if combined_audio:
-                combined_audio.export(output_path, format="mp3", bitrate="192k")
-                logger.info(f"다중 화자 팟캐스트 생성 완료: {output_path}")
-                logger.info(f"타임스탬프 메타데이터 {len(dialogue_metadata)}개 생성")
-            else:
-                raise Exception("병합할 오디오가 없습니다")
-
+                    # 임시 파일 생성
+                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f"_dialogue_{i}.mp3")
+                    temp_files.append(temp_file.name)
+                    line_files.append((i, temp_file.name))
+                    temp_file.close()
+
+                    logger.info(f"대화 {i+1}/{len(dialogue_script)} - 화자: {speaker}")
+                    await self.synthesize_line(speaker, text, language, temp_file.name, index=i)
+                    pending -= 1
+                    TTS_QUEUE_DEPTH.dec()
+
+                    if measure_loudness:
+                        measurements[i] = asyncio.create_task(self.measure_line(temp_file.name))
+
+            line_loudness = None
+            if measurements:
+                line_loudness = await asyncio.gather(*(measurements[i] for i, _ in line_files))
+
+            dialogue_metadata = await self.merge_dialogue_audio(
+                dialogue_script, line_files, output_path, line_loudness=line_loudness
+            )
+            if not lines_dir:
+                # 임시 파일 이름은 병합 후 의미가 없으므로 메타데이터에서 제외
+                for entry in dialogue_metadata:
+                    entry.pop("audio_file", None)
             return output_path, dialogue_metadata
 
         finally:
+            TTS_QUEUE_DEPTH.dec(pending)
+
+            # 합성 실패 등으로 남은 측정 작업 정리 (임시 파일을 지우기 전에)
+            unfinished = [task for task in measurements.values() if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
             # 임시 파일 정리
             for temp_file in temp_files:
                 try:
@@ -199,6 +367,178 @@ class TTSEngine:
                 except Exception as e:
                     logger.warning(f"임시 파일 삭제 실패 {temp_file}: {str(e)}")
 
+    async def measure_line(self, line_path: str, cache_path: Optional[Path] = None) -> dict:
+        """대사 하나의 라우드니스 측정 (오디오 처리 프로세스 풀에서 실행)
+
+        Args:
+            line_path: 대사 오디오 파일 경로
+            cache_path: 측정값을 보관할 파일 경로 (있으면 다시 측정하지 않음, 대사 오디오처럼 내용 주소 기반)
+
+        Returns:
+            loudness.measure() 결과 + {"peak_dbfs": 최대 레벨}
+        """
+        if cache_path is not None and cache_path.exists():
+            try:
+                stats = json.loads(cache_path.read_text(encoding="utf-8"))
+                if "hops" in stats and "peak_dbfs" in stats:
+                    return stats
+            except (OSError, ValueError) as e:
+                logger.warning(f"라우드니스 측정값을 읽지 못해 다시 측정합니다 {cache_path.name}: {str(e)}")
+
+        with span("audio.measure", kind="audio") as measure_span:
+            stats, timings = await self.audio_pool.run(self.audio_ops["measure"], line_path)
+            self._record_audio_timings(timings, measure_span)
+            if measure_span:
+                measure_span.set_attribute("lufs", stats["lufs"])
+
+        if cache_path is not None:
+            atomic_write_json(cache_path, stats)
+        return stats
+
+    async def merge_dialogue_audio(
+        self,
+        dialogue_script: list[dict],
+        line_files: list[tuple[int, str]],
+        output_path: str,
+        pause_ms: int = 500,
+        line_loudness: Optional[list[dict]] = None
+    ) -> list[dict]:
+        """대사별 오디오를 하나로 병합하면서 타임스탬프 메타데이터 생성 (오디오 처리 프로세스 풀에서 실행)
+
+        Args:
+            dialogue_script: 대화 스크립트 리스트
+            line_files: (대사 인덱스, 오디오 파일 경로) 리스트
+            output_path: 출력 파일 경로
+            pause_ms: 대사 사이 무음 길이 (밀리초)
+            line_loudness: line_files 순서의 대사별 라우드니스 측정값.
+                주면 화자별 게인을 적용해 에피소드를 LOUDNESS_TARGET에 맞춤 (후처리에서 정규화하지 않음)
+
+        Returns:
+            타임스탬프 메타데이터 리스트
+        """
+        logger.info("대화 오디오 파일 병합 중...")
+
+        speakers = [dialogue_script[i].get("speaker", "rachel") for i, _ in line_files]
+        line_gains = None
+        if line_loudness is not None:
+            levels = loudness.speaker_gains(
+                line_loudness, speakers, [stats["peak_dbfs"] for stats in line_loudness],
+                self.settings.loudness_target, pause_ms
+            )
+            line_gains = [levels["gains_db"][speaker] for speaker in speakers]
+            LOUDNESS_LIMITED_DB.observe(levels["limited_db"])
+            logger.info(
+                f"화자별 라우드니스 게인: {levels['gains_db']} "
+                f"(예상 {levels['episode_lufs']} LUFS, 목표 {self.settings.loudness_target}, 피크 제한 {levels['limited_db']}dB)"
+            )
+
+        with span("audio.merge", kind="audio", lines=len(line_files), mode=self.settings.audio_render_mode) as merge_span:
+            durations, peaks, timings = await self.audio_pool.run(
+                self.audio_ops["merge"], [line_file for _, line_file in line_files], output_path, pause_ms, line_gains
+            )
+            self._record_audio_timings(timings, merge_span)
+
+        dialogue_metadata = []  # 타임스탬프 메타데이터
+        current_time = 0  # 현재 누적 시간 (밀리초)
+        for position, ((i, line_file), duration_ms, peak_dbfs) in enumerate(zip(line_files, durations, peaks)):
+            if position > 0:
+                current_time += pause_ms  # 무음 시간 추가
+
+            # 현재 대사의 화자 정보
+            dialogue = dialogue_script[i]
+            speaker = dialogue.get("speaker", "rachel")
+            voice_info = self.podcast_voices.get(speaker, self.podcast_voices["rachel"])
+
+            # 타임스탬프 메타데이터 기록
+            dialogue_metadata.append({
+                "index": i,
+                "speaker": speaker,
+                "speaker_name": voice_info["name"],
+                "gender": voice_info["gender"],
+                "text": dialogue.get("text", ""),
+                "start_time": current_time / 1000,  # 초 단위로 변환
+                "end_time": (current_time + duration_ms) / 1000,  # 초 단위로 변환
+                "duration": duration_ms / 1000,  # 초 단위로 변환
+                "peak_dbfs": peak_dbfs,  # 대사 최대 레벨 (스트리밍 후처리의 정규화 게인 계산용)
+                "audio_file": os.path.basename(line_file)
+            })
+            if line_loudness is not None:
+                # 게인 적용 전 대사 라우드니스와 병합 때 적용한 화자별 게인
+                dialogue_metadata[-1]["loudness_lufs"] = line_loudness[position]["lufs"]
+                dialogue_metadata[-1]["gain_db"] = line_gains[position]
+
+            current_time += duration_ms
+
+        logger.info(f"다중 화자 팟캐스트 생성 완료: {output_path}")
+        logger.info(f"타임스탬프 메타데이터 {len(dialogue_metadata)}개 생성")
+
+        return dialogue_metadata
+
+    async def extract_line_audio(
+        self,
+        episode_path: str,
+        start_time: float,
+        end_time: float,
+        output_path: str
+    ) -> str:
+        """완성된 에피소드에서 대사 한 줄 구간을 잘라 저장 (대사별 오디오가 없는 이전 작업용)
+
+        Args:
+            episode_path: 에피소드 오디오 파일 경로
+            start_time: 시작 시간 (초)
+            end_time: 끝 시간 (초)
+            output_path: 출력 파일 경로
+        """
+        with span("audio.extract", kind="audio") as extract_span:
+            timings = await self.audio_pool.run(self.audio_ops["extract"], episode_path, start_time, end_time, output_path)
+            self._record_audio_timings(timings, extract_span)
+        return output_path
+
+    def _record_audio_timings(self, timings: dict, current_span=None):
+        """워커 프로세스가 돌려준 구간별 소요 시간을 메트릭과 스팬 속성으로 기록"""
+        for operation, seconds in timings.items():
+            AUDIO_OPERATION_SECONDS[operation].observe(seconds)
+            if current_span:
+                current_span.set_attribute(f"{operation}_seconds", round(seconds, 4))
+
+    def _synthesize(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str,
+        voice_settings: VoiceSettings,
+        output_path: str
+    ) -> str:
+        """ElevenLabs 동기 호출 (블로킹 I/O이므로 asyncio.to_thread로 실행)"""
+        def convert():
+            audio = self.elevenlabs.text_to_speech.convert(
+                voice_id=voice_id,
+                text=text,
+                voice_settings=voice_settings,
+                model_id=model_id
+            )
+
+            save(audio, output_path)
+
+        started = time.perf_counter()
+        try:
+            if self.cassette is not None:
+                request = {
+                    "voice_id": voice_id,
+                    "model_id": model_id,
+                    "text": text,
+                    "voice_settings": voice_settings.model_dump()
+                }
+                self.cassette.speech(request, output_path, convert)
+            else:
+                convert()
+        except Exception:
+            TTS_REQUEST_ERROR_SECONDS.observe(time.perf_counter() - started)
+            raise
+
+        TTS_REQUEST_OK_SECONDS.observe(time.perf_counter() - started)
+        return output_path
+
     async def text_to_speech(
         self,
         text: str,
@@ -207,21 +547,20 @@ class TTSEngine:
     ) -> str:
         """ElevenLabs를 사용한 텍스트 음성 변환"""
         try:
-            client = ElevenLabs(api_key=self.settings.elevenlabs_api_key)
-
-            audio = client.text_to_speech.convert(
-                voice_id=voice_id,
-                text=text,
-                model_id="eleven_multilingual_v2",
-                voice_settings=VoiceSettings(
-                    stability=0.5,      # 안정성 증가로 더 자연스러운 음성
-                    similarity_boost=0.8, # 음성 유사성 증가
-                    style=0.1,           # 약간의 스타일 추가로 생동감 향상
-                    use_speaker_boost=True
+            with span("tts.request", kind="tts_request", attempt=1, model="eleven_multilingual_v2"):
+                await asyncio.to_thread(
+                    self._synthesize,
+                    text,
+                    voice_id,
+                    "eleven_multilingual_v2",
+                    VoiceSettings(
+                        stability=0.5,      # 안정성 증가로 더 자연스러운 음성
+                        similarity_boost=0.8, # 음성 유사성 증가
+                        style=0.1,           # 약간의 스타일 추가로 생동감 향상
+                        use_speaker_boost=True
+                    ),
+                    output_path
                 )
-            )
-
-            save(audio, output_path)
             return output_path
         except Exception as e:
             raise Exception(f"ElevenLabs TTS 변환 중 오류: {str(e)}")
@@ -253,16 +592,15 @@ class TTSEngine:
         last_error = None
         for attempt in range(max_retries):
             try:
-                client = ElevenLabs(api_key=self.settings.elevenlabs_api_key)
-
-                audio = client.text_to_speech.convert(
-                    voice_id=voice_id,
-                    text=processed_text,
-                    voice_settings=korean_optimized_settings,
-                    model_id="eleven_turbo_v2_5"
-                )
-
-                save(audio, output_path)
+                with span("tts.request", kind="tts_request", attempt=attempt + 1, model="eleven_turbo_v2_5"):
+                    await asyncio.to_thread(
+                        self._synthesize,
+                        processed_text,
+                        voice_id,
+                        "eleven_turbo_v2_5",
+                        korean_optimized_settings,
+                        output_path
+                    )
                 logger.info(f"한국어 TTS 변환 성공: {output_path}")
                 return output_path
 
@@ -271,71 +609,75 @@ class TTSEngine:
                 logger.warning(f"TTS 변환 시도 {attempt + 1}/{max_retries} 실패: {str(e)}")
 
                 if attempt < max_retries - 1:
+                    TTS_RETRIES.inc()
                     # 지수 백오프 전략으로 재시도 대기
                     wait_time = 2 ** attempt
                     logger.info(f"{wait_time}초 후 재시도...")
-                    await asyncio.sleep(wait_time)
+                    with span("tts.retry_wait", kind="tts_wait", seconds=wait_time):
+                        await asyncio.sleep(wait_time)
 
         # 모든 재시도 실패
         logger.error(f"한국어 TTS 변환 최종 실패 (모든 재시도 소진): {str(last_error)}")
         raise Exception(f"한국어 최적화 TTS 변환 중 오류 (재시도 {max_retries}회 실패): {str(last_error)}")
 
     def _preprocess_korean_text(self, text: str) -> str:
-        """한국어 텍스트 전처리 (발음 개선)"""
-        # 숫자를 한글로 변환하는 기본적인 처리
-        import re
-
-        # 영어 단어 앞뒤에 적절한 공백 추가
-        text = re.sub(r'([\가-\힣])([A-Za-z])', r'\1 \2', text)
-        text = re.sub(r'([A-Za-z])([\가-\힣])', r'\1 \2', text)
-
-        # 문장 끝 쉼표와 마침표 뒤에 적절한 간격 추가
-        text = re.sub(r'([,.])([^\s])', r'\1 \2', text)
+        """한국어 텍스트 전처리 (숫자/단위/약어를 읽는 그대로의 한글로, 간격 정리, src/tts/normalizer.py)"""
+        return normalize_korean(text)
 
-        # 연속된 공백 제거
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        return text
-
-    def enhance_audio(self, input_path: str, output_path: str, apply_speed_adjustment: bool = False) -> str:
-        """오디오 품질 향상 처리
+    async def enhance_audio(
+        self,
+        input_path: str,
+        output_path: str,
+        apply_speed_adjustment: bool = False,
+        peak_dbfs: Optional[float] = None,
+        gain_db: Optional[float] = None,
+        music_path: Optional[str] = None,
+        music_volume: float = 0.1,
+        renditions: Optional[dict[str, str]] = None,
+        peaks_path: Optional[str] = None
+    ) -> str:
+        """오디오 품질 향상 처리 (오디오 처리 프로세스 풀에서 실행)
 
         Args:
             input_path: 입력 오디오 파일 경로
             output_path: 출력 오디오 파일 경로
             apply_speed_adjustment: 속도 조정 적용 여부 (기본값: False, ElevenLabs는 이미 최적화됨)
+            peak_dbfs: 입력의 최대 레벨 (streaming 방식에서 정규화 분석 패스 생략용, 병합 메타데이터에서 계산)
+            gain_db: 정규화 대신 적용할 게인 (병합 때 라우드니스를 이미 맞춘 경우 0)
+            music_path: 함께 합성할 배경음악 (resolve_music() 결과, 인코딩은 한 번)
+            music_volume: 배경음악 크기 (0~1)
+            renditions: 렌디션 이름 → 출력 경로 (MP3와 같은 PCM에서 함께 인코딩, hls는 디렉토리)
+            peaks_path: 플레이어용 파형 피크를 저장할 경로 (인코딩하는 PCM에서 함께 계산)
         """
         try:
-            audio = AudioSegment.from_mp3(input_path)
-
-            # 1. 오디오 레벨 정규화 (너무 작거나 큰 소리 방지)
-            audio = audio.normalize()
-
-            # 2. 속도 조정 (선택적, 한국어는 보통 적용하지 않음)
-            if apply_speed_adjustment:
-                # 2% 속도 감소로 더 명확한 발음
-                audio = audio._spawn(audio.raw_data, overrides={
-                    "frame_rate": int(audio.frame_rate * 0.98)
-                }).set_frame_rate(audio.frame_rate)
-
-            # 3. 볼륨 부스트 (명확성 향상, 너무 크지 않게)
-            audio = audio + 1.5
-
-            # 4. 자연스러운 시작/끝을 위한 페이드 인/아웃
-            # 페이드 시간을 더 길게 하여 부드러운 전환
-            audio = audio.fade_in(800).fade_out(1000)
-
-            # 5. 고품질로 내보내기
-            # 팟캐스트 표준 비트레이트 192k (320k는 과도하게 큰 파일 크기)
-            audio.export(output_path, format="mp3", bitrate="192k",
-                        parameters=["-q:a", "0"])  # 최고 품질 인코딩
-
+            with span("audio.enhance", kind="audio", mode=self.settings.audio_render_mode,
+                      music=os.path.basename(music_path) if music_path else None,
+                      renditions=",".join(renditions) if renditions else None) as enhance_span:
+                timings = await self.audio_pool.run(
+                    self.audio_ops["enhance"], input_path, output_path, apply_speed_adjustment, peak_dbfs, gain_db,
+                    music_path, music_volume, self.settings.music_cache_directory, renditions, peaks_path
+                )
+                self._record_audio_timings(timings, enhance_span)
             return output_path
 
         except Exception as e:
             raise Exception(f"오디오 향상 중 오류: {str(e)}")
 
-    def add_background_music(
+    async def index_line_audio(self, audio_path: str, dialogue_metadata: list[dict], index_path: str) -> str:
+        """완성된 MP3에서 대사별 바이트 구간 인덱스 생성 (대사 하나만 재생할 때 해당 바이트만 전송)
+
+        Args:
+            audio_path: 인코딩이 끝난 에피소드 MP3 경로
+            dialogue_metadata: 타임스탬프 메타데이터 (start_time/end_time)
+            index_path: 인덱스 JSON을 저장할 경로
+        """
+        spans = [(entry["start_time"], entry["end_time"]) for entry in dialogue_metadata]
+        with span("audio.index", kind="audio", lines=len(spans)) as index_span:
+            timings = await self.audio_pool.run(self.audio_ops["index"], audio_path, spans, index_path)
+            self._record_audio_timings(timings, index_span)
+        return index_path
+
+    async def add_background_music(
         self,
         speech_path: str,
         music_path: str,
@@ -343,25 +685,25 @@ class TTSEngine:
         music_volume: float = 0.1
     ) -> str:
         try:
-            speech = AudioSegment.from_mp3(speech_path)
-            music = AudioSegment.from_mp3(music_path)
-
-            music = music - (20 - (music_volume * 20))
-
-            if len(music) < len(speech):
-                loops_needed = (len(speech) // len(music)) + 1
-                music = music * loops_needed
-
-            music = music[:len(speech)]
-
-            combined = speech.overlay(music)
-            combined.export(output_path, format="mp3", bitrate="320k")
-
+            with span("audio.mix", kind="audio") as mix_span:
+                timings = await self.audio_pool.run(
+                    self.audio_ops["mix"], speech_path, music_path, output_path, music_volume,
+                    self.settings.music_cache_directory
+                )
+                self._record_audio_timings(timings, mix_span)
             return output_path
 
         except Exception as e:
             raise Exception(f"배경음악 추가 중 오류: {str(e)}")
 
+    def resolve_music(self, name: str) -> str:
+        """배경음악 이름 → MUSIC_DIRECTORY 안의 파일 경로 (없으면 ValueError)"""
+        return str(music.resolve_track(self.settings.music_directory, name))
+
+    def get_music_tracks(self) -> list:
+        """선택 가능한 배경음악 목록"""
+        return music.list_tracks(self.settings.music_directory)
+
     def get_podcast_voices(self) -> dict:
         """팟캐스트용 음성 목록 반환"""
         return self.podcast_voices
@@ -369,8 +711,7 @@ class TTSEngine:
     async def get_available_voices(self) -> list:
         """ElevenLabs에서 사용 가능한 음성 목록 조회"""
         try:
-            client = ElevenLabs(api_key=self.settings.elevenlabs_api_key)
-            voices_response = client.voices.get_all()
+            voices_response = self.elevenlabs.voices.get_all()
 
             voice_list = []
             for voice in voices_response.voices:
@@ -0,0 +1,201 @@
+"""
+라우드니스 측정과 화자별 레벨 맞춤 (ITU-R BS.1770 / EBU R128 방식)
+
+peak 기반 normalize는 가장 큰 순간 하나만 보므로 목소리가 다른 화자들의 체감 음량이 맞지 않습니다.
+여기서는 대사마다 K-가중 라우드니스를 NumPy로 측정해 두고(TTS 결과가 도착하는 대로),
+병합할 때 화자별 게인을 적용해 에피소드 전체가 목표 통합 라우드니스(LUFS)에 맞도록 합니다.
+대사별 측정값(100ms 구간 에너지)을 대사 사이 무음과 함께 이어 붙이면 병합된 파일의 400ms 블록을 그대로 재구성할 수
+있으므로, 에피소드 통합 라우드니스를 계산하려고 병합된 파일을 다시 읽지 않습니다.
+
+K-가중 필터(고역 셸빙 + RLB 고역 통과)는 재귀 필터 대신 주파수 응답을 FFT 스펙트럼에 곱해 적용합니다
+(대사 길이의 신호에서는 결과가 같고, 샘플 단위 루프가 없음).
+"""
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+BLOCK_SECONDS = 0.4
+HOP_SECONDS = 0.1
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+# 게인 적용 후 대사 최대 레벨 상한 (인코딩 오버슈트 여유)
+PEAK_CEILING_DBFS = -1.0
+
+
+def _biquad_response(b: Sequence[float], a: Sequence[float], z_inv: np.ndarray) -> np.ndarray:
+    return (b[0] + b[1] * z_inv + b[2] * z_inv ** 2) / (a[0] + a[1] * z_inv + a[2] * z_inv ** 2)
+
+
+def k_weighting_response(frame_rate: int, n_fft: int) -> np.ndarray:
+    """K-가중 필터의 rfft 주파수 응답 (BS.1770 계수를 샘플레이트에 맞춰 계산)"""
+    z_inv = np.exp(-2j * np.pi * np.fft.rfftfreq(n_fft))
+
+    # 1단계: 머리 효과를 반영한 고역 셸빙 (+4dB, 1.5kHz)
+    gain_db, q, fc = 4.0, 1 / np.sqrt(2), 1500.0
+    amplitude = 10 ** (gain_db / 40)
+    w0 = 2 * np.pi * fc / frame_rate
+    alpha = np.sin(w0) / (2 * q)
+    cos_w0 = np.cos(w0)
+    shelf = _biquad_response(
+        (amplitude * ((amplitude + 1) + (amplitude - 1) * cos_w0 + 2 * np.sqrt(amplitude) * alpha),
+         -2 * amplitude * ((amplitude - 1) + (amplitude + 1) * cos_w0),
+         amplitude * ((amplitude + 1) + (amplitude - 1) * cos_w0 - 2 * np.sqrt(amplitude) * alpha)),
+        ((amplitude + 1) - (amplitude - 1) * cos_w0 + 2 * np.sqrt(amplitude) * alpha,
+         2 * ((amplitude - 1) - (amplitude + 1) * cos_w0),
+         (amplitude + 1) - (amplitude - 1) * cos_w0 - 2 * np.sqrt(amplitude) * alpha),
+        z_inv
+    )
+
+    # 2단계: RLB 고역 통과 (38Hz)
+    q, fc = 0.5, 38.0
+    w0 = 2 * np.pi * fc / frame_rate
+    alpha = np.sin(w0) / (2 * q)
+    cos_w0 = np.cos(w0)
+    high_pass = _biquad_response(
+        ((1 + cos_w0) / 2, -(1 + cos_w0), (1 + cos_w0) / 2),
+        (1 + alpha, -2 * cos_w0, 1 - alpha),
+        z_inv
+    )
+    return shelf * high_pass
+
+
+HOPS_PER_BLOCK = int(round(BLOCK_SECONDS / HOP_SECONDS))
+
+
+def hop_energies(samples: np.ndarray, frame_rate: int) -> np.ndarray:
+    """K-가중 후 100ms 구간별 평균 제곱 에너지 (채널 합, 마지막 짧은 구간은 무음으로 채운 것으로 봄)
+
+    Args:
+        samples: (프레임 수, 채널 수) 모양의 -1~1 범위 float 배열
+        frame_rate: 샘플레이트
+
+    Returns:
+        구간 에너지 배열
+    """
+    frames = samples.shape[0]
+    if frames == 0:
+        return np.zeros(0)
+
+    # IIR 꼬리가 앞쪽으로 감기지 않도록 0.1초 여유를 두고 FFT
+    n_fft = 1 << int(np.ceil(np.log2(frames + int(frame_rate * 0.1))))
+    spectrum = np.fft.rfft(samples, n=n_fft, axis=0)
+    weighted = np.fft.irfft(spectrum * k_weighting_response(frame_rate, n_fft)[:, None], n=n_fft, axis=0)[:frames]
+
+    power = np.square(weighted).sum(axis=1)
+    hop = int(round(HOP_SECONDS * frame_rate))
+    power = np.concatenate((power, np.zeros(-frames % hop)))
+    return power.reshape(-1, hop).mean(axis=1)
+
+
+def block_energies(hops: np.ndarray) -> np.ndarray:
+    """100ms 구간 에너지 → 400ms 블록(75% 겹침) 에너지 (400ms보다 짧으면 전체를 블록 하나로 봄)"""
+    hops = np.asarray(hops, dtype=float)
+    if hops.size == 0:
+        return hops
+    if hops.size < HOPS_PER_BLOCK:
+        return np.array([hops.mean()])
+    cumulative = np.concatenate(([0.0], np.cumsum(hops)))
+    return (cumulative[HOPS_PER_BLOCK:] - cumulative[:-HOPS_PER_BLOCK]) / HOPS_PER_BLOCK
+
+
+def _to_lufs(energy: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore"):
+        return -0.691 + 10 * np.log10(energy)
+
+
+def integrated_loudness(energies: np.ndarray) -> Optional[float]:
+    """블록 에너지로 통합 라우드니스 계산 (절대 게이트 -70 LUFS, 상대 게이트 -10 LU)
+
+    Returns:
+        LUFS, 게이트를 통과한 블록이 없으면(무음) None
+    """
+    energies = np.asarray(energies, dtype=float)
+    gated = energies[_to_lufs(energies) > ABSOLUTE_GATE_LUFS]
+    if gated.size == 0:
+        return None
+
+    relative_gate = _to_lufs(gated.mean()) + RELATIVE_GATE_LU
+    gated = gated[_to_lufs(gated) > relative_gate]
+    return float(_to_lufs(gated.mean()))
+
+
+def measure(samples: np.ndarray, frame_rate: int) -> Dict:
+    """대사 하나의 라우드니스 측정
+
+    Returns:
+        {"lufs": 통합 라우드니스 또는 None, "hops": 100ms 구간 에너지 리스트}
+    """
+    hops = hop_energies(samples, frame_rate)
+    loudness = integrated_loudness(block_energies(hops))
+    return {
+        "lufs": round(loudness, 3) if loudness is not None else None,
+        "hops": hops.tolist()
+    }
+
+
+def speaker_gains(
+    line_stats: List[Dict],
+    speakers: List[str],
+    peaks_dbfs: List[Optional[float]],
+    target_lufs: float,
+    pause_ms: int = 500,
+    peak_ceiling_dbfs: float = PEAK_CEILING_DBFS
+) -> Dict:
+    """화자별 게인 계산: 화자마다 같은 라우드니스로 맞춘 뒤 에피소드 전체를 목표 LUFS로 보정
+
+    게인을 적용한 어떤 대사의 최대 레벨이 peak_ceiling_dbfs를 넘으면 모든 화자의 게인을 같은 만큼 낮춥니다
+    (화자 간 균형은 유지하고 목표보다 조용해짐).
+
+    Args:
+        line_stats: 대사별 measure() 결과
+        speakers: 대사별 화자
+        peaks_dbfs: 대사별 최대 레벨 (무음이면 None)
+        target_lufs: 목표 통합 라우드니스
+        pause_ms: 병합 때 대사 사이에 넣는 무음 길이 (에피소드 블록 재구성용)
+
+    Returns:
+        {"gains_db": {화자: 게인}, "episode_lufs": 게인 적용 후 예상 통합 라우드니스, "limited_db": 피크 때문에 낮춘 양}
+    """
+    line_hops = [np.asarray(stats["hops"], dtype=float) for stats in line_stats]
+
+    blocks_by_speaker: Dict[str, List[np.ndarray]] = {}
+    for hops, speaker in zip(line_hops, speakers):
+        blocks_by_speaker.setdefault(speaker, []).append(block_energies(hops))
+
+    gains: Dict[str, float] = {}
+    for speaker, blocks in blocks_by_speaker.items():
+        loudness = integrated_loudness(np.concatenate(blocks))
+        gains[speaker] = target_lufs - loudness if loudness is not None else 0.0
+
+    # 화자별로 맞춘 뒤에도 대사 사이 무음에 걸친 블록과 게이트 때문에 전체 통합 라우드니스는
+    # 목표와 조금 다를 수 있으므로, 병합될 순서대로 이어 붙인 에너지로 전체 보정
+    pause = np.zeros(int(round(pause_ms / 1000 / HOP_SECONDS)))
+
+    def episode_loudness() -> Optional[float]:
+        sequence: List[np.ndarray] = []
+        for position, (hops, speaker) in enumerate(zip(line_hops, speakers)):
+            if position > 0:
+                sequence.append(pause)
+            sequence.append(hops * 10 ** (gains[speaker] / 10))
+        return integrated_loudness(block_energies(np.concatenate(sequence))) if sequence else None
+
+    loudness = episode_loudness()
+    if loudness is not None:
+        correction = target_lufs - loudness
+        gains = {speaker: gain + correction for speaker, gain in gains.items()}
+
+    overshoot = max(
+        (peak + gains[speaker] - peak_ceiling_dbfs for peak, speaker in zip(peaks_dbfs, speakers) if peak is not None),
+        default=0.0
+    )
+    limited = max(0.0, overshoot)
+    if limited:
+        gains = {speaker: gain - limited for speaker, gain in gains.items()}
+
+    loudness = episode_loudness()
+    return {
+        "gains_db": {speaker: round(gain, 3) for speaker, gain in gains.items()},
+        "episode_lufs": round(loudness, 3) if loudness is not None else None,
+        "limited_db": round(limited, 3)
+    }
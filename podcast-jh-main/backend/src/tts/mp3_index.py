@@ -0,0 +1,143 @@
+"""
+MP3 프레임 인덱스와 대사별 바이트 구간
+
+완성된 podcast.mp3의 프레임 헤더를 읽어 프레임마다 파일 안의 바이트 위치를 구하고, dialogue_metadata의
+대사 시작/끝 시간을 그 프레임 경계의 바이트 구간으로 바꿉니다. MP3 프레임은 그대로 이어 붙여도 재생 가능한
+스트림이므로, 대사 하나를 들을 때 전체 파일을 받거나 다시 인코딩하지 않고 해당 바이트만 잘라 보낼 수 있습니다.
+
+시간 → 프레임 변환에는 LAME/Info 태그의 인코더 지연(앞쪽 무음 샘플 수)을 더합니다. 또한 각 프레임은
+비트 저장소(bit reservoir)로 이전 프레임의 바이트를 참조할 수 있으므로 대사 앞에 프레임 하나를 더 포함합니다
+(첫 프레임만 디코딩되지 않고 버려져 대사의 시작은 온전히 재생됨).
+"""
+import mmap
+from typing import Dict, List, Optional, Tuple
+
+# MPEG 버전 비트 → (비트레이트 표, 샘플레이트 표, 프레임당 샘플 수) (Layer III만)
+_MPEG1_BITRATES = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MPEG2_BITRATES = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_VERSIONS = {
+    3: (_MPEG1_BITRATES, (44100, 48000, 32000), 1152),  # MPEG-1
+    2: (_MPEG2_BITRATES, (22050, 24000, 16000), 576),   # MPEG-2
+    0: (_MPEG2_BITRATES, (11025, 12000, 8000), 576),    # MPEG-2.5
+}
+# Info/LAME 태그가 없을 때의 인코더 지연 (LAME 기본값 576 + 디코더 지연 529)
+DEFAULT_ENCODER_DELAY = 1105
+# 대사 앞에 더 포함할 프레임 수 (비트 저장소)
+PREROLL_FRAMES = 1
+
+
+def _id3v2_size(data) -> int:
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _parse_header(data, position: int) -> Optional[Tuple[int, int, int, int]]:
+    """position의 프레임 헤더 → (프레임 길이, 샘플레이트, 프레임당 샘플 수, 사이드 정보 길이), 헤더가 아니면 None"""
+    if position + 4 > len(data) or data[position] != 0xFF or data[position + 1] & 0xE0 != 0xE0:
+        return None
+    version = (data[position + 1] >> 3) & 0x03
+    layer = (data[position + 1] >> 1) & 0x03
+    bitrate_index = data[position + 2] >> 4
+    rate_index = (data[position + 2] >> 2) & 0x03
+    if version not in _VERSIONS or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    bitrates, rates, samples = _VERSIONS[version]
+    frame_rate = rates[rate_index]
+    padding = (data[position + 2] >> 1) & 0x01
+    mono = (data[position + 3] >> 6) == 3
+    length = samples // 8 * bitrates[bitrate_index] * 1000 // frame_rate + padding
+    if version == 3:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    return length, frame_rate, samples, side_info
+
+
+def scan(path: str) -> Dict:
+    """MP3 파일의 오디오 프레임 위치
+
+    Returns:
+        {"offsets": 프레임별 시작 바이트 (마지막 값은 마지막 프레임의 끝), "frame_rate": 샘플레이트,
+         "samples_per_frame": 프레임당 샘플 수, "encoder_delay": 앞쪽 지연 샘플 수}
+
+    Raises:
+        ValueError: MP3 프레임을 찾을 수 없음
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        position = _id3v2_size(data)
+        offsets: List[int] = []
+        frame_rate = samples_per_frame = None
+        encoder_delay = DEFAULT_ENCODER_DELAY
+
+        while position + 4 <= len(data):
+            header = _parse_header(data, position)
+            if header is None:
+                # 프레임 사이의 쓰레기 바이트나 끝의 ID3v1 태그는 다음 동기 패턴까지 건너뜀
+                next_sync = data.find(b"\xff", position + 1)
+                if next_sync < 0:
+                    break
+                position = next_sync
+                continue
+
+            length, frame_rate, samples_per_frame, side_info = header
+            if position + length > len(data):
+                break
+            if not offsets:
+                tag_position = position + 4 + side_info
+                tag = data[tag_position:tag_position + 4]
+                if tag in (b"Xing", b"Info"):
+                    # 첫 프레임은 오디오가 아닌 Info 태그: LAME 확장 부분(120바이트 뒤)의 인코더 지연을 읽음
+                    delay_position = tag_position + 141
+                    if data[tag_position + 120:tag_position + 124] in (b"LAME", b"Lavc", b"Lavf"):
+                        encoder_delay = (data[delay_position] << 4) | (data[delay_position + 1] >> 4)
+                        encoder_delay += 529
+                    position += length
+                    continue
+            offsets.append(position)
+            position += length
+
+        if not offsets:
+            raise ValueError(f"MP3 프레임을 찾을 수 없습니다: {path}")
+        offsets.append(position)
+
+    return {
+        "offsets": offsets,
+        "frame_rate": frame_rate,
+        "samples_per_frame": samples_per_frame,
+        "encoder_delay": encoder_delay
+    }
+
+
+def line_ranges(frames: Dict, spans: List[Tuple[float, float]]) -> List[Dict]:
+    """대사 시간 구간 → 프레임 경계의 바이트 구간
+
+    Args:
+        frames: scan() 결과
+        spans: 대사별 (시작 초, 끝 초)
+
+    Returns:
+        대사별 {"start_frame", "end_frame", "byte_start", "byte_end"} (byte_end는 포함하지 않는 끝,
+        HTTP Range로는 byte_end - 1까지)
+    """
+    offsets = frames["offsets"]
+    frame_count = len(offsets) - 1
+    samples_per_frame = frames["samples_per_frame"]
+    delay = frames["encoder_delay"]
+
+    ranges = []
+    for start_time, end_time in spans:
+        start_sample = round(start_time * frames["frame_rate"]) + delay
+        end_sample = round(end_time * frames["frame_rate"]) + delay
+        start_frame = min(max(0, start_sample // samples_per_frame - PREROLL_FRAMES), frame_count - 1)
+        end_frame = min(max(start_frame + 1, -(-end_sample // samples_per_frame)), frame_count)
+        ranges.append({
+            "start_frame": start_frame,
+            "end_frame": end_frame,
+            "byte_start": offsets[start_frame],
+            "byte_end": offsets[end_frame]
+        })
+    return ranges
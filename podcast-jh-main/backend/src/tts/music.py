@@ -0,0 +1,127 @@
+"""
+배경음악 트랙과 디코딩 캐시
+
+배경음악은 MUSIC_DIRECTORY의 오디오 파일 이름으로 선택합니다. 합성할 때마다 MP3를 디코딩하지 않도록
+트랙을 에피소드의 샘플레이트/채널 수에 맞춘 16비트 PCM 파일로 한 번만 디코딩해 MUSIC_CACHE_DIRECTORY에
+두고, 오디오 처리 워커 프로세스에서는 memory-map으로 엽니다 (여러 워커가 같은 페이지 캐시를 공유).
+
+반복 재생은 트랙을 이어 붙여 복사하지 않고, 음성 위치를 트랙 길이로 나눈 나머지 위치의 구간을 잘라 더합니다.
+"""
+import hashlib
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+from pydub import AudioSegment
+
+
+MUSIC_EXTENSIONS = (".mp3", ".wav", ".ogg", ".m4a", ".flac")
+
+# 워커 프로세스별로 열어 둔 트랙 ((경로, 수정 시각, 크기, 샘플레이트, 채널 수) → memmap)
+_decoded: Dict[Tuple, np.ndarray] = {}
+
+
+def list_tracks(music_directory: Union[str, Path]) -> List[dict]:
+    """선택 가능한 배경음악 트랙 목록"""
+    directory = Path(music_directory)
+    if not directory.is_dir():
+        return []
+    return [
+        {"name": path.name, "size": path.stat().st_size}
+        for path in sorted(directory.iterdir())
+        if path.is_file() and path.suffix.lower() in MUSIC_EXTENSIONS
+    ]
+
+
+def resolve_track(music_directory: Union[str, Path], name: str) -> Path:
+    """트랙 이름 → 파일 경로 (디렉토리 밖을 가리키는 이름은 거부)
+
+    Raises:
+        ValueError: 없는 트랙이거나 허용되지 않는 이름
+    """
+    directory = Path(music_directory).resolve()
+    path = (directory / name).resolve()
+    if path.parent != directory or path.suffix.lower() not in MUSIC_EXTENSIONS or not path.is_file():
+        available = ", ".join(track["name"] for track in list_tracks(directory)) or "없음"
+        raise ValueError(f"배경음악을 찾을 수 없습니다: {name} (사용 가능: {available})")
+    return path
+
+
+def music_gain(music_volume: float) -> float:
+    """music_volume(0~1) → 배경음악 배율 (0.1이면 -18dB, 1이면 원래 크기)"""
+    return 10 ** (-(20 - music_volume * 20) / 20)
+
+
+def decoded_track(path: Union[str, Path], frame_rate: int, channels: int, cache_directory: Union[str, Path]) -> np.ndarray:
+    """16비트 PCM으로 디코딩된 트랙 ((프레임 수, 채널 수) int16 memmap)
+
+    캐시 파일 이름에 원본의 수정 시각과 크기가 들어가므로 트랙을 교체하면 다시 디코딩합니다.
+    여러 프로세스가 동시에 디코딩해도 임시 파일에 쓴 뒤 교체하므로 불완전한 캐시를 읽지 않습니다.
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size, frame_rate, channels)
+    track = _decoded.get(key)
+    if track is not None:
+        return track
+
+    digest = hashlib.sha1("|".join(map(str, key[:3])).encode("utf-8")).hexdigest()[:16]
+    cache_directory = Path(cache_directory)
+    cache_path = cache_directory / f"{path.stem}-{digest}-{frame_rate}-{channels}.s16le"
+    if not cache_path.exists():
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        fd, partial_path = tempfile.mkstemp(dir=cache_directory, suffix=".part")
+        os.close(fd)
+        try:
+            subprocess.run(
+                [AudioSegment.converter, "-y", "-v", "error", "-i", str(path),
+                 "-f", "s16le", "-ar", str(frame_rate), "-ac", str(channels), partial_path],
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+            os.replace(partial_path, cache_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.unlink(partial_path)
+
+    if cache_path.stat().st_size == 0:
+        raise ValueError(f"배경음악에 오디오가 없습니다: {path.name}")
+    track = np.memmap(cache_path, dtype=np.int16, mode="r").reshape(-1, channels)
+    _decoded[key] = track
+    return track
+
+
+def overlay(
+    speech: np.ndarray,
+    music: np.ndarray,
+    start_frame: int,
+    speech_gain: float = 1.0,
+    music_gain_factor: float = 1.0
+) -> np.ndarray:
+    """음성 블록에 배경음악을 겹침 (트랙 끝에 닿으면 처음부터 반복)
+
+    Args:
+        speech: (프레임 수, 채널 수) int16 음성 블록
+        music: decoded_track() 결과
+        start_frame: 에피소드에서 이 블록의 시작 위치 (프레임)
+        speech_gain: 음성에 곱할 배율
+        music_gain_factor: 배경음악에 곱할 배율 (music_gain())
+
+    Returns:
+        (프레임 수, 채널 수) int16 합성 결과
+    """
+    mixed = speech.astype(np.float32)
+    if speech_gain != 1.0:
+        mixed *= speech_gain
+
+    position = 0
+    music_position = start_frame % len(music)
+    while position < len(mixed):
+        count = min(len(mixed) - position, len(music) - music_position)
+        mixed[position:position + count] += music[music_position:music_position + count] * np.float32(music_gain_factor)
+        position += count
+        music_position = 0
+
+    return np.clip(mixed, -32768, 32767).astype(np.int16)
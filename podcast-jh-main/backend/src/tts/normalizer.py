@@ -0,0 +1,319 @@
+"""
+TTS 입력용 한국어 텍스트 정규화 (숫자 → 한글, 단위, 약어)
+
+ElevenLabs는 "2024년", "3.5km", "GPT-4", "AI" 같은 표기를 잘못 읽는 경우가 많아 대사를 다시 렌더링하게
+됩니다. 합성 전에 읽는 그대로의 한글로 바꿉니다.
+
+- 숫자: 한자어 수사(이천이십사년, 삼 점 일사), 고유어 수사와 함께 쓰는 단위 명사는 고유어(세 시, 다섯 명, 첫 번째),
+  6월/10월은 유월/시월, 천 단위 쉼표 제거
+- 날짜/시각: 2024-03-05, 2024.3.5 → 년/월/일, 14:30 → 시/분, 1:1 → 일 대 일, -5 → 마이너스 오
+- 전화/계좌번호: 하이픈으로 이은 숫자 묶음은 한 자리씩(010-1234-5678 → 공일공 일이삼사 오육칠팔)
+- 단위/통화: km, kg, GB, %, ℃, $, € 등 (숫자 뒤/앞에 있을 때만)
+- 영문 약어: 대문자 약어는 한 글자씩(AI → 에이아이), 단어로 읽는 약어는 사전(NASA → 나사),
+  약어 뒤의 번호는 영어로(GPT-4 → 지피티 포, MP3 → 엠피 쓰리)
+- 간격: 한글과 영문 사이, 쉼표/마침표 뒤 공백, 연속 공백 정리
+
+규칙은 모듈 임포트 때 한 번만 컴파일하고, 같은 대사의 결과는 LRU 캐시에 둡니다 (재렌더링과 재시도에서
+같은 대사를 다시 합성). normalize_batch()는 캐시에 없는 대사들을 구분자로 이어 규칙마다 정규식을 한 번만 실행합니다.
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+
+# 캐시할 대사 수 (대사 하나가 수백 바이트이므로 수 MB 이내)
+CACHE_SIZE = 4096
+# 배치 처리에서 대사를 잇는 구분자 (어떤 규칙의 패턴에도 걸리지 않는 문자)
+BATCH_SEPARATOR = "\x00"
+
+SINO_DIGITS = "영일이삼사오육칠팔구"
+# 전화/계좌번호는 0을 "공"으로 읽음
+PHONE_DIGITS = "공" + SINO_DIGITS[1:]
+SINO_POSITIONS = ("천", "백", "십", "")
+SINO_GROUPS = ("", "만", "억", "조", "경")
+NATIVE_ONES = ("", "하나", "둘", "셋", "넷", "다섯", "여섯", "일곱", "여덟", "아홉")
+NATIVE_ONES_PRENOMINAL = ("", "한", "두", "세", "네", "다섯", "여섯", "일곱", "여덟", "아홉")
+NATIVE_TENS = ("", "열", "스물", "서른", "마흔", "쉰", "예순", "일흔", "여든", "아흔")
+ENGLISH_NUMBERS = (
+    "제로", "원", "투", "쓰리", "포", "파이브", "식스", "세븐", "에잇", "나인", "텐", "일레븐", "트웰브"
+)
+MONTHS = {6: "유월", 10: "시월"}
+
+# 고유어 수사와 함께 쓰는 단위 명사 (긴 것부터, 1~99만 고유어로 읽음)
+NATIVE_COUNTERS = (
+    "번째", "시간", "마리", "가지", "군데", "그루", "송이", "켤레", "사람",
+    "개", "명", "살", "시", "권", "잔", "병", "곳", "벌", "달", "번"
+)
+# 고유어 단위 명사로 시작하지만 한자어 수사로 읽는 단어
+SINO_COUNTERS = ("개월", "개국", "달러", "시즌", "번지", "명절")
+
+UNITS = {
+    "kWh": "킬로와트시", "mAh": "밀리암페어시", "GHz": "기가헤르츠", "MHz": "메가헤르츠",
+    "km": "킬로미터", "cm": "센티미터", "mm": "밀리미터", "kg": "킬로그램", "mg": "밀리그램",
+    "ml": "밀리리터", "mL": "밀리리터", "TB": "테라바이트", "GB": "기가바이트", "MB": "메가바이트",
+    "KB": "킬로바이트", "Hz": "헤르츠", "kW": "킬로와트", "ms": "밀리초",
+    "㎞": "킬로미터", "㎝": "센티미터", "㎜": "밀리미터", "㎏": "킬로그램", "㎖": "밀리리터",
+    "°C": "도", "℃": "도", "%": "퍼센트",
+    "m": "미터", "g": "그램", "L": "리터", "W": "와트", "V": "볼트"
+}
+CURRENCIES = {"$": "달러", "€": "유로", "£": "파운드", "¥": "엔", "₩": "원"}
+
+LETTERS = {
+    "A": "에이", "B": "비", "C": "씨", "D": "디", "E": "이", "F": "에프", "G": "지", "H": "에이치",
+    "I": "아이", "J": "제이", "K": "케이", "L": "엘", "M": "엠", "N": "엔", "O": "오", "P": "피",
+    "Q": "큐", "R": "알", "S": "에스", "T": "티", "U": "유", "V": "브이", "W": "더블유", "X": "엑스",
+    "Y": "와이", "Z": "지", "&": "앤"
+}
+# 한 글자씩이 아니라 단어로 읽는 약어
+ACRONYM_WORDS = {
+    "NASA": "나사", "NATO": "나토", "UNESCO": "유네스코", "UNICEF": "유니세프", "OPEC": "오펙",
+    "ASEAN": "아세안", "FIFA": "피파", "COVID": "코비드", "LAN": "랜", "RAM": "램", "ROM": "롬"
+}
+ABBREVIATIONS = {"vs": "대", "etc": "등", "e.g": "예를 들어", "i.e": "즉"}
+
+NUMBER = r"\d+(?:\.\d+)?"
+
+DATE_PATTERN = re.compile(r"(?<![\d.])(\d{4})[./-](\d{1,2})[./-](\d{1,2})(?![\d])\.?")
+# 하이픈으로 이은 숫자 묶음이 셋 이상이거나 0으로 시작하면 범위(3-4명)가 아니라 번호
+DIGIT_GROUPS_PATTERN = re.compile(r"(?<![\d.\-])(?:0\d+(?:-\d+)+|\d+(?:-\d+){2,})(?![\d.\-])")
+TIME_PATTERN = re.compile(r"(?<![\d:])(\d{1,2}):(\d{2})(?![\d:])")
+THOUSANDS_PATTERN = re.compile(r"(?<=\d),(?=\d{3}(?!\d))")
+SPEED_PATTERN = re.compile(rf"(?:시속\s?)?({NUMBER})\s?km/h(?![A-Za-z])")
+CURRENCY_PATTERN = re.compile(rf"([{''.join(map(re.escape, CURRENCIES))}])\s?({NUMBER})")
+UNIT_PATTERN = re.compile(
+    rf"({NUMBER})\s?({'|'.join(map(re.escape, sorted(UNITS, key=len, reverse=True)))})(?![A-Za-z])"
+)
+# 버전 뒤의 소문자 한 글자(GPT-4o)는 버전에 붙여 읽음
+VERSION_PATTERN = re.compile(r"(?<![A-Za-z])([A-Z]{2,6})-?(\d{1,2})(?:([a-z])(?![A-Za-z]))?(?![\d.])")
+LETTER_AFTER_NUMBER_PATTERN = re.compile(r"(?<=\d)([A-Z])(?![A-Za-z])")
+SCORE_PATTERN = re.compile(r"(?<![\d:])(\d{1,2}):(\d)(?![\d:])")
+NEGATIVE_PATTERN = re.compile(r"(?<![\w.])-(?=\d)")
+RANGE_PATTERN = re.compile(r"(?<=\d)\s*~\s*(?=-?\d)")
+# 붙여 쓴 "3-4명"도 범위 (전화번호처럼 하이픈으로 셋 이상 이어진 숫자는 제외)
+HYPHEN_RANGE_PATTERN = re.compile(rf"(?<![\d.\-])({NUMBER})-(?={NUMBER}(?![\d.\-]))")
+NUMBER_PATTERN = re.compile(
+    rf"(?<![\d.])({NUMBER})(?:(\s?)({'|'.join(SINO_COUNTERS + NATIVE_COUNTERS)})|(월))?"
+)
+ACRONYM_PATTERN = re.compile(r"(?<![A-Za-z])([A-Z](?:&?[A-Z]){1,5})(?![A-Za-z])")
+ABBREVIATION_PATTERN = re.compile(
+    rf"(?<![A-Za-z])({'|'.join(map(re.escape, ABBREVIATIONS))})\.?(?![A-Za-z])", re.IGNORECASE
+)
+HANGUL_LATIN_PATTERN = re.compile(r"([가-힣])([A-Za-z])")
+LATIN_HANGUL_PATTERN = re.compile(r"([A-Za-z])([가-힣])")
+PUNCTUATION_PATTERN = re.compile(r"([,.])(?=[^\s,.])")
+SPACES_PATTERN = re.compile(r"\s+")
+
+
+def sino_number(value: int) -> str:
+    """정수 → 한자어 수사 (12345 → 만 이천삼백사십오, 만 단위로 띄어 씀)"""
+    if value == 0:
+        return SINO_DIGITS[0]
+    if value >= 10 ** (4 * len(SINO_GROUPS)):
+        return "".join(SINO_DIGITS[int(digit)] for digit in str(value))
+
+    groups = []
+    for index, group_name in enumerate(SINO_GROUPS):
+        group = value // 10 ** (4 * index) % 10000
+        if not group:
+            continue
+        digits = str(group).zfill(4)
+        words = "".join(
+            (SINO_DIGITS[int(digit)] if digit != "1" or not position else "") + position
+            for digit, position in zip(digits, SINO_POSITIONS) if digit != "0"
+        )
+        # "일만"이 아니라 "만"
+        if group == 1 and group_name == "만":
+            words = ""
+        groups.append(words + group_name)
+    return " ".join(reversed(groups))
+
+
+def native_number(value: int, prenominal: bool = True) -> str:
+    """1~99 → 고유어 수사 (단위 명사 앞이면 한/두/세/네/스무)"""
+    tens, ones = divmod(value, 10)
+    if prenominal and ones == 0 and tens == 2:
+        return "스무"
+    return NATIVE_TENS[tens] + (NATIVE_ONES_PRENOMINAL if prenominal else NATIVE_ONES)[ones]
+
+
+def read_number(text: str) -> str:
+    """숫자 문자열 → 한자어 읽기 (소수점 아래는 한 자리씩: 3.14 → 삼 점 일사)"""
+    integer, _, fraction = text.partition(".")
+    words = sino_number(int(integer))
+    if fraction:
+        words += " 점 " + "".join(SINO_DIGITS[int(digit)] for digit in fraction)
+    return words
+
+
+def spell_acronym(acronym: str) -> str:
+    return ACRONYM_WORDS.get(acronym) or "".join(LETTERS[letter] for letter in acronym)
+
+
+def _date(match: re.Match) -> str:
+    year, month, day = match.groups()
+    return f"{year}년 {int(month)}월 {int(day)}일"
+
+
+def _digit_groups(match: re.Match) -> str:
+    return " ".join("".join(PHONE_DIGITS[int(digit)] for digit in group) for group in match.group(0).split("-"))
+
+
+def _time(match: re.Match) -> str:
+    hour, minute = match.groups()
+    return f"{int(hour)}시" + (f" {int(minute)}분" if int(minute) else "")
+
+
+def _number(match: re.Match) -> str:
+    number, space, counter, month = match.groups()
+    if month:
+        if "." in number:
+            return read_number(number) + "월"
+        return MONTHS.get(int(number)) or read_number(number) + "월"
+    if counter in NATIVE_COUNTERS and "." not in number and 0 < int(number) < 100:
+        value = int(number)
+        if counter == "번째" and value == 1:
+            return "첫 번째"
+        return f"{native_number(value)} {counter}"
+    return read_number(number) + (space or "") + (counter or "")
+
+
+def _version(match: re.Match) -> str:
+    acronym, number, suffix = match.groups()
+    value = int(number)
+    spoken = ENGLISH_NUMBERS[value] if value < len(ENGLISH_NUMBERS) else read_number(number)
+    return f"{spell_acronym(acronym)} {spoken}" + (LETTERS[suffix.upper()] if suffix else "")
+
+
+# 규칙이 적용될 수 있는 입력인지 보는 관문 (대부분의 대사에는 숫자나 영문이 없음)
+HAS_LATIN = re.compile(r"[A-Za-z]")
+HAS_UPPER = re.compile(r"[A-Z]")
+HAS_DIGIT = re.compile(r"\d")
+HAS_COLON = re.compile(r"\d:\d")
+HAS_SPEED = re.compile(r"km/h")
+
+# (관문, 패턴, 치환) 순서대로 적용: 숫자를 읽기 전에 날짜/시각/단위/통화를 숫자 + 한글 단위로 바꿔 둠.
+# 규칙은 숫자나 영문을 새로 만들지 않으므로 관문은 원래 입력에서 한 번만 검사함
+RULES = (
+    (HAS_LATIN, ABBREVIATION_PATTERN, lambda match: ABBREVIATIONS[match.group(1).lower()]),
+    (HAS_DIGIT, DATE_PATTERN, _date),
+    (HAS_DIGIT, DIGIT_GROUPS_PATTERN, _digit_groups),
+    (HAS_COLON, TIME_PATTERN, _time),
+    (HAS_DIGIT, THOUSANDS_PATTERN, ""),
+    (HAS_SPEED, SPEED_PATTERN, r"시속 \1 킬로미터"),
+    (HAS_DIGIT, CURRENCY_PATTERN, lambda match: f"{match.group(2)} {CURRENCIES[match.group(1)]}"),
+    (HAS_DIGIT, UNIT_PATTERN, lambda match: f"{match.group(1)} {UNITS[match.group(2)]}"),
+    (HAS_UPPER, VERSION_PATTERN, _version),
+    (HAS_UPPER, LETTER_AFTER_NUMBER_PATTERN, lambda match: " " + LETTERS[match.group(1)]),
+    (HAS_COLON, SCORE_PATTERN, r"\1 대 \2"),
+    (HAS_DIGIT, RANGE_PATTERN, "에서 "),
+    (HAS_DIGIT, HYPHEN_RANGE_PATTERN, r"\1에서 "),
+    (HAS_DIGIT, NEGATIVE_PATTERN, "마이너스 "),
+    (HAS_DIGIT, NUMBER_PATTERN, _number),
+    (HAS_UPPER, ACRONYM_PATTERN, lambda match: spell_acronym(match.group(1))),
+    (HAS_LATIN, HANGUL_LATIN_PATTERN, r"\1 \2"),
+    (HAS_LATIN, LATIN_HANGUL_PATTERN, r"\1 \2"),
+    (None, PUNCTUATION_PATTERN, r"\1 "),
+    (None, SPACES_PATTERN, " "),
+)
+
+
+def apply_rules(text: str) -> str:
+    """캐시 없이 모든 규칙 적용"""
+    gates = {}
+    for gate, pattern, replacement in RULES:
+        if gate is not None:
+            passed = gates.get(gate)
+            if passed is None:
+                passed = gates[gate] = gate.search(text) is not None
+            if not passed:
+                continue
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+class TextNormalizer:
+    """대사별 LRU 캐시가 있는 정규화기
+
+    Args:
+        cache_size: 캐시할 대사 수 (0이면 캐시하지 않음)
+    """
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, text: str):
+        with self._lock:
+            result = self._cache.get(text)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._cache.move_to_end(text)
+            return result
+
+    def _put(self, text: str, result: str):
+        if not self.cache_size:
+            return
+        with self._lock:
+            self._cache[text] = result
+            self._cache.move_to_end(text)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def normalize(self, text: str) -> str:
+        cached = self._get(text)
+        if cached is not None:
+            return cached
+        result = apply_rules(text)
+        self._put(text, result)
+        return result
+
+    def normalize_batch(self, texts: Iterable[str]) -> List[str]:
+        """여러 대사를 한 번에 정규화 (캐시에 없는 대사만 이어 붙여 규칙마다 한 번씩 실행)
+
+        구분자가 들어 있는 대사는 따로 처리합니다.
+        """
+        texts = list(texts)
+        results: Dict[str, str] = {}
+        pending: List[str] = []
+        for text in texts:
+            if text in results:
+                continue
+            cached = self._get(text)
+            if cached is not None:
+                results[text] = cached
+            elif BATCH_SEPARATOR in text:
+                results[text] = self.normalize(text)
+            else:
+                results[text] = ""
+                pending.append(text)
+
+        if pending:
+            joined = apply_rules(BATCH_SEPARATOR.join(pending))
+            for text, result in zip(pending, joined.split(BATCH_SEPARATOR)):
+                result = result.strip()
+                results[text] = result
+                self._put(text, result)
+
+        return [results[text] for text in texts]
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "max_size": self.cache_size}
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+# 프로세스 전체에서 공유하는 기본 정규화기
+korean_normalizer = TextNormalizer()
+
+
+def normalize_korean(text: str) -> str:
+    return korean_normalizer.normalize(text)
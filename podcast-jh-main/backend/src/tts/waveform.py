@@ -0,0 +1,94 @@
+"""
+플레이어용 파형 피크 (다중 해상도 int8 최소/최대값)
+
+프론트엔드가 파형이나 탐색 막대를 그리려고 MP3 전체를 받아 디코딩하지 않도록, 후처리에서 최종 PCM을
+인코더로 보내는 동안 구간(bucket)별 최소/최대값을 함께 계산해 peaks.json으로 저장합니다.
+
+가장 세밀한 단계는 20ms 구간이고, 다음 단계는 앞 단계의 4개 구간을 합친 것입니다 (구간 수가
+MIN_LEVEL_LENGTH 이하가 될 때까지). 채널은 하나로 합쳐 모든 채널의 최소/최대를 쓰며, 값은 16비트 샘플의
+상위 8비트(int8)입니다. 1시간 에피소드도 수백 KB이므로 화면 폭에 맞는 단계를 골라 바로 그릴 수 있습니다.
+
+파일 형식:
+    {"version": 1, "sample_rate": 44100, "duration": 초, "bits": 8,
+     "levels": [{"samples_per_bucket": 882, "length": 구간 수,
+                 "data": base64(int8 [min0, max0, min1, max1, ...])}, ...]}
+"""
+import base64
+from typing import Dict, List
+
+import numpy as np
+
+
+BUCKETS_PER_SECOND = 50
+LEVEL_FACTOR = 4
+MIN_LEVEL_LENGTH = 512
+FORMAT_VERSION = 1
+
+
+class PeakAccumulator:
+    """PCM 블록을 받는 대로 가장 세밀한 단계의 구간별 최소/최대값을 누적"""
+
+    def __init__(self, frame_rate: int, channels: int):
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.samples_per_bucket = max(1, frame_rate // BUCKETS_PER_SECOND)
+        self.frames = 0
+        self._mins: List[np.ndarray] = []
+        self._maxs: List[np.ndarray] = []
+        # 아직 구간 하나를 채우지 못한 프레임 (채널별 최소/최대)
+        self._carry_min = np.zeros(0, dtype=np.int16)
+        self._carry_max = np.zeros(0, dtype=np.int16)
+
+    def add(self, data: bytes):
+        """16비트 interleaved PCM 블록 추가"""
+        samples = np.frombuffer(data, dtype=np.int16).reshape(-1, self.channels)
+        self.frames += len(samples)
+        lows = np.concatenate((self._carry_min, samples.min(axis=1)))
+        highs = np.concatenate((self._carry_max, samples.max(axis=1)))
+
+        complete = len(lows) - len(lows) % self.samples_per_bucket
+        if complete:
+            self._mins.append(lows[:complete].reshape(-1, self.samples_per_bucket).min(axis=1))
+            self._maxs.append(highs[:complete].reshape(-1, self.samples_per_bucket).max(axis=1))
+        self._carry_min = lows[complete:]
+        self._carry_max = highs[complete:]
+
+    def result(self) -> Dict:
+        """peaks.json 내용 (마지막 짧은 구간 포함)"""
+        mins, maxs = list(self._mins), list(self._maxs)
+        if len(self._carry_min):
+            mins.append(self._carry_min.min(keepdims=True))
+            maxs.append(self._carry_max.max(keepdims=True))
+        # 상위 8비트 (산술 시프트이므로 -32768 → -128, 32767 → 127)
+        lows = (np.concatenate(mins) >> 8).astype(np.int8) if mins else np.zeros(0, dtype=np.int8)
+        highs = (np.concatenate(maxs) >> 8).astype(np.int8) if maxs else np.zeros(0, dtype=np.int8)
+
+        levels = []
+        samples_per_bucket = self.samples_per_bucket
+        while True:
+            levels.append(_level(samples_per_bucket, lows, highs))
+            if len(lows) <= MIN_LEVEL_LENGTH:
+                break
+            starts = np.arange(0, len(lows), LEVEL_FACTOR)
+            lows = np.minimum.reduceat(lows, starts)
+            highs = np.maximum.reduceat(highs, starts)
+            samples_per_bucket *= LEVEL_FACTOR
+
+        return {
+            "version": FORMAT_VERSION,
+            "sample_rate": self.frame_rate,
+            "duration": round(self.frames / self.frame_rate, 3),
+            "bits": 8,
+            "levels": levels
+        }
+
+
+def _level(samples_per_bucket: int, lows: np.ndarray, highs: np.ndarray) -> Dict:
+    interleaved = np.empty(len(lows) * 2, dtype=np.int8)
+    interleaved[0::2] = lows
+    interleaved[1::2] = highs
+    return {
+        "samples_per_bucket": samples_per_bucket,
+        "length": len(lows),
+        "data": base64.b64encode(interleaved.tobytes()).decode("ascii")
+    }
@@ -0,0 +1,180 @@
+"""
+LLM/TTS 호출 기록·재생(cassette) 모듈
+
+record 모드에서는 실제 OpenAI/ElevenLabs 호출의 요청, 응답(오디오 바이트 포함), 오류, 지연 시간을
+디렉토리에 저장하고, replay 모드에서는 네트워크 없이 저장된 응답을 같은 순서로 돌려줍니다.
+네트워크와 API 비용 없이 실제 운영과 같은 형태의 작업으로 PodcastGenerator를 프로파일링하는 데 사용합니다.
+
+저장 구조:
+    <dir>/llm/<요청 키>/<순번>.json        요청, 응답(ChatCompletion) 또는 오류, 지연 시간
+    <dir>/tts/<요청 키>/<순번>.json, .mp3  요청, 오류, 지연 시간과 오디오
+
+요청 키는 요청 내용(JSON 정규화)의 해시이며, 같은 요청이 여러 번 기록되면(재시도 등) 순번으로 구분해
+재생 시에도 같은 순서로 돌려줍니다. 기록보다 많이 호출되면 마지막 기록을 반복합니다.
+"""
+import asyncio
+import hashlib
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+from src.utils.files import atomic_write_json
+
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+
+class CassetteMissError(Exception):
+    """replay 모드에서 요청에 해당하는 기록이 없음"""
+
+
+class RecordedCallError(Exception):
+    """기록 당시 실패했던 호출을 재생할 때 발생하는 오류"""
+
+
+class Cassette:
+    """LLM/TTS 요청-응답 기록 저장소
+
+    Args:
+        directory: 기록 디렉토리
+        mode: "record" 또는 "replay"
+        latency_scale: replay 시 기록된 지연 시간에 곱할 배율 (0: 지연 없음, 1: 실제 시간 재현)
+    """
+
+    def __init__(self, directory: str, mode: str, latency_scale: float = 0.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"지원하지 않는 cassette 모드: {mode}")
+
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings) -> Optional["Cassette"]:
+        """설정의 CASSETTE_MODE가 off가 아니면 Cassette 생성"""
+        if settings.cassette_mode == "off":
+            return None
+        logger.info(f"LLM/TTS cassette {settings.cassette_mode} 모드: {settings.cassette_dir}")
+        return cls(settings.cassette_dir, settings.cassette_mode, settings.cassette_latency_scale)
+
+    @staticmethod
+    def request_key(request: Dict[str, Any]) -> str:
+        canonical = json.dumps(request, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:20]
+
+    def _next_entry(self, kind: str, request: Dict[str, Any]) -> Path:
+        """이번 호출에 해당하는 기록 파일 경로 (확장자 제외)"""
+        key = self.request_key(request)
+        entry_dir = self.directory / kind / key
+
+        with self._lock:
+            cursor_key = f"{kind}/{key}"
+            if cursor_key not in self._cursors:
+                # record는 기존 기록 뒤에 이어서, replay는 처음부터
+                existing = len(list(entry_dir.glob("*.json"))) if entry_dir.exists() else 0
+                self._cursors[cursor_key] = existing if self.mode == "record" else 0
+            index = self._cursors[cursor_key]
+            self._cursors[cursor_key] = index + 1
+
+        if self.mode == "replay":
+            if not (entry_dir / f"{index:04d}.json").exists():
+                recorded = sorted(entry_dir.glob("*.json")) if entry_dir.exists() else []
+                if not recorded:
+                    raise CassetteMissError(f"기록되지 않은 {kind} 요청입니다 (키: {key})")
+                return recorded[-1].with_suffix("")
+        else:
+            entry_dir.mkdir(parents=True, exist_ok=True)
+
+        return entry_dir / f"{index:04d}"
+
+    def _load(self, entry: Path) -> Dict[str, Any]:
+        with open(entry.with_suffix(".json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _replay_delay(self, record: Dict[str, Any]) -> float:
+        return record.get("latency", 0.0) * self.latency_scale
+
+    @staticmethod
+    def _raise_recorded(record: Dict[str, Any]):
+        error = record["error"]
+        raise RecordedCallError(f"{error['type']}: {error['message']}")
+
+    async def chat_completion(self, request: Dict[str, Any], send: Callable[[], Awaitable[Any]]) -> Any:
+        """chat.completions.create 호출 기록/재생
+
+        Args:
+            request: chat.completions.create 인자
+            send: 실제 API 호출 (record 모드에서만 실행)
+
+        Returns:
+            ChatCompletion 객체
+        """
+        from openai.types.chat import ChatCompletion
+
+        entry = self._next_entry("llm", request)
+
+        if self.mode == "replay":
+            record = self._load(entry)
+            delay = self._replay_delay(record)
+            if delay:
+                await asyncio.sleep(delay)
+            if "error" in record:
+                self._raise_recorded(record)
+            return ChatCompletion.model_validate(record["response"])
+
+        record: Dict[str, Any] = {"request": request}
+        started = time.perf_counter()
+        try:
+            response = await send()
+            record["response"] = response.model_dump(mode="json")
+            return response
+        except Exception as e:
+            record["error"] = {"type": type(e).__name__, "message": str(e)}
+            raise
+        finally:
+            record["latency"] = time.perf_counter() - started
+            atomic_write_json(entry.with_suffix(".json"), record)
+
+    def speech(self, request: Dict[str, Any], output_path: str, send: Callable[[], Any]) -> str:
+        """TTS 호출 기록/재생 (동기, 스레드에서 실행)
+
+        Args:
+            request: 음성, 모델, 텍스트, 음성 설정
+            output_path: 오디오를 저장할 경로
+            send: output_path에 오디오를 저장하는 실제 API 호출 (record 모드에서만 실행)
+
+        Returns:
+            output_path
+        """
+        entry = self._next_entry("tts", request)
+
+        if self.mode == "replay":
+            record = self._load(entry)
+            delay = self._replay_delay(record)
+            if delay:
+                time.sleep(delay)
+            if "error" in record:
+                self._raise_recorded(record)
+            shutil.copyfile(entry.with_suffix(".mp3"), output_path)
+            return output_path
+
+        record: Dict[str, Any] = {"request": request}
+        started = time.perf_counter()
+        try:
+            send()
+            record["latency"] = time.perf_counter() - started
+            shutil.copyfile(output_path, entry.with_suffix(".mp3"))
+            return output_path
+        except Exception as e:
+            record["latency"] = time.perf_counter() - started
+            record["error"] = {"type": type(e).__name__, "message": str(e)}
+            raise
+        finally:
+            atomic_write_json(entry.with_suffix(".json"), record)
@@ -1,18 +1,63 @@
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import List, Optional
 from dotenv import load_dotenv
 
-load_dotenv()
 
 class Settings:
     def __init__(self):
         self.openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
         self.elevenlabs_api_key: str = os.getenv("ELEVENLABS_API_KEY", "")
+        # OpenAI 호환 서버/로컬 대역(stand-in) 서버를 쓰는 경우에만 지정 (비우면 공식 엔드포인트)
+        self.openai_base_url: Optional[str] = os.getenv("OPENAI_BASE_URL") or None
+        self.elevenlabs_base_url: Optional[str] = os.getenv("ELEVENLABS_BASE_URL") or None
+        # LLM 호출 종류별 후보 모델/엔드포인트 (JSON, src/llm/routing.py)와 장애 조치 기준
+        self.llm_routes: Optional[str] = os.getenv("LLM_ROUTES") or None
+        self.llm_p95_threshold: float = float(os.getenv("LLM_P95_THRESHOLD", "30"))
+        self.llm_error_rate_threshold: float = float(os.getenv("LLM_ERROR_RATE_THRESHOLD", "0.5"))
+        self.llm_health_window: float = float(os.getenv("LLM_HEALTH_WINDOW", "300"))
+        self.llm_health_min_samples: int = int(os.getenv("LLM_HEALTH_MIN_SAMPLES", "5"))
+        # 스크립트 턴 수/화자 구성이 모자랄 때 나머지만 이어서 요청하는 최대 횟수 (src/llm/script_format.py)
+        self.script_repair_attempts: int = int(os.getenv("SCRIPT_REPAIR_ATTEMPTS", "2"))
+        # LLM/TTS 호출 기록·재생: off, record, replay (src/utils/cassette.py)
+        self.cassette_mode: str = os.getenv("CASSETTE_MODE", "off")
+        self.cassette_dir: str = os.getenv("CASSETTE_DIR", "cassettes")
+        self.cassette_latency_scale: float = float(os.getenv("CASSETTE_LATENCY_SCALE", "0"))
         self.default_voice_type: str = os.getenv("DEFAULT_VOICE_TYPE", "female")
         self.default_language: str = os.getenv("DEFAULT_LANGUAGE", "ko")
         self.default_duration: int = int(os.getenv("DEFAULT_DURATION", "5"))
         self.output_directory: str = os.getenv("OUTPUT_DIRECTORY", "output")
+        # 작업 상태 백엔드: file(단일 워커), sqlite(여러 워커/노드가 OUTPUT_DIRECTORY를 공유)
+        self.state_backend: str = os.getenv("STATE_BACKEND", "file")
+        self.state_db_path: Optional[str] = os.getenv("STATE_DB_PATH") or None
+        self.job_lease_ttl: float = float(os.getenv("JOB_LEASE_TTL", "60"))
+        # 산출물 블롭 저장소: local(해시별로 한 벌만 저장하고 작업 디렉토리는 하드링크), off. 기본 위치는 <OUTPUT_DIRECTORY>/.blobs
+        self.blob_backend: str = os.getenv("BLOB_BACKEND", "local").strip().lower()
+        self.blob_directory: Optional[str] = os.getenv("BLOB_DIRECTORY") or None
+        # 출력 디렉토리 보존 정책: 마지막 접근 후 보존 일수, 전체 용량 한도(MB), 정리 주기(초). 0이면 사용 안 함
+        self.output_ttl_days: float = float(os.getenv("OUTPUT_TTL_DAYS", "0"))
+        self.output_quota_mb: float = float(os.getenv("OUTPUT_QUOTA_MB", "0"))
+        self.gc_interval: float = float(os.getenv("GC_INTERVAL", "600"))
+        # 오디오 후처리(pydub/ffmpeg) 프로세스 풀 크기 (HTTP 워커마다 하나의 풀)
+        self.audio_workers: int = int(os.getenv("AUDIO_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+        # 오디오 렌더링 방식: pydub(전체를 메모리에서 처리), streaming(ffmpeg 파이프로 블록 단위 처리, 메모리 일정)
+        self.audio_render_mode: str = os.getenv("AUDIO_RENDER_MODE", "pydub")
+        # 빈 워커를 기다리는 작업이 이 수 이상이면 새 생성 요청을 503으로 거절
+        self.audio_max_pending: int = int(os.getenv("AUDIO_MAX_PENDING", str(self.audio_workers * 4)))
+        # 목표 통합 라우드니스(LUFS): 대사별로 측정해 병합 때 화자별 게인으로 맞춤. off면 기존 peak 정규화
+        loudness_target = os.getenv("LOUDNESS_TARGET", "-16").strip().lower()
+        self.loudness_target: Optional[float] = None if loudness_target in ("", "off") else float(loudness_target)
+        # 배경음악 트랙 디렉토리 (요청의 background_music은 이 디렉토리의 파일 이름)와 디코딩 캐시 디렉토리
+        self.music_directory: str = os.getenv("MUSIC_DIRECTORY", "music")
+        self.music_cache_directory: str = os.getenv("MUSIC_CACHE_DIRECTORY", ".music_cache")
+        # 최종 MP3와 함께 같은 PCM에서 병렬로 인코딩할 렌디션 (opus, aac, hls 중 쉼표로 구분, 빈 값이면 MP3만)
+        self.audio_renditions: List[str] = [
+            name.strip().lower() for name in os.getenv("AUDIO_RENDITIONS", "opus,aac,hls").split(",") if name.strip()
+        ]
         self.max_script_length: int = int(os.getenv("MAX_SCRIPT_LENGTH", "10000"))
+        # 시작할 때 LLM/TTS 엔드포인트 연결과 오디오 워커 프로세스를 미리 열어 둘지 (ffmpeg 확인은 항상)
+        self.startup_warmup: bool = os.getenv("STARTUP_WARMUP", "true").strip().lower() not in ("0", "false", "off")
 
     def validate(self) -> bool:
         """설정 유효성 검사"""
@@ -26,3 +71,10 @@ class Settings:
         output_path.mkdir(exist_ok=True)
 
         return True
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """프로세스 전체에서 공유하는 설정 (.env와 환경 변수는 처음 호출할 때 한 번만 읽음)"""
+    load_dotenv()
+    return Settings()
@@ -0,0 +1,44 @@
+"""
+파일 쓰기 유틸리티 모듈
+
+체크포인트와 상태 파일은 중간에 프로세스가 종료되더라도 잘린 파일이 남지 않도록
+임시 파일에 먼저 쓴 뒤 os.replace로 교체합니다.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Union
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> Path:
+    """바이트 데이터를 원자적으로 파일에 기록
+
+    Args:
+        path: 대상 파일 경로
+        data: 기록할 데이터
+
+    Returns:
+        기록된 파일 경로
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(temp_path, path)
+    return path
+
+
+def atomic_write_text(path: Union[str, Path], text: str) -> Path:
+    """텍스트를 UTF-8로 원자적으로 파일에 기록"""
+    return atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def atomic_write_json(path: Union[str, Path], data: Any) -> Path:
+    """JSON 데이터를 원자적으로 파일에 기록 (한글은 이스케이프하지 않음)"""
+    return atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
@@ -0,0 +1,216 @@
+"""
+Prometheus 메트릭 정의 모듈
+
+모든 메트릭은 모듈 임포트 시 한 번만 등록되며, /metrics 엔드포인트에서 노출됩니다.
+라벨 값이 고정된 메트릭은 라벨 자식(child)을 미리 만들어 두어
+호출 경로에서는 잠금 한 번과 덧셈만 일어나도록 합니다.
+"""
+import asyncio
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+
+# LLM 호출은 수백 ms ~ 수십 초, TTS 대사는 수백 ms ~ 수 초, 오디오 처리는 수십 ms ~ 수 분
+LLM_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 15, 30, 60, 120)
+TTS_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30)
+AUDIO_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 180)
+STAGE_BUCKETS = (0.01, 0.1, 0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600)
+
+LLM_CALL_SECONDS = Histogram(
+    "podcast_llm_call_seconds",
+    "LLM 호출 지연 시간 (호출 종류별)",
+    ["call"],
+    buckets=LLM_BUCKETS
+)
+LLM_CALL_ERRORS = Counter(
+    "podcast_llm_call_errors_total",
+    "실패한 LLM 호출 수 (호출 종류별)",
+    ["call"]
+)
+LLM_ROUTED_CALLS = Counter(
+    "podcast_llm_routed_calls_total",
+    "라우팅으로 선택되어 성공한 LLM 호출 수 (호출 종류, 모델별)",
+    ["call", "model"]
+)
+LLM_FAILOVERS = Counter(
+    "podcast_llm_failovers_total",
+    "실패한 LLM 호출을 다음 후보 엔드포인트로 다시 보낸 횟수 (호출 종류별)",
+    ["call"]
+)
+LLM_TOKENS = Counter(
+    "podcast_llm_tokens_total",
+    "LLM 응답 usage의 토큰 수 (호출 종류별, type: prompt, cached(프롬프트 중 캐시 적중), completion)",
+    ["call", "type"]
+)
+SCRIPT_REPAIRS = Counter(
+    "podcast_script_repairs_total",
+    "스크립트의 모자란 부분만 이어서 요청한 횟수 (이유별: turns, speakers)",
+    ["reason"]
+)
+
+TTS_LINE_SECONDS = Histogram(
+    "podcast_tts_line_seconds",
+    "대사 한 줄의 TTS 지연 시간 (재시도 대기 포함)",
+    buckets=TTS_BUCKETS
+)
+TTS_REQUEST_SECONDS = Histogram(
+    "podcast_tts_request_seconds",
+    "ElevenLabs 요청 한 번의 지연 시간 (시도 단위)",
+    ["outcome"],
+    buckets=TTS_BUCKETS
+)
+TTS_RETRIES = Counter(
+    "podcast_tts_retries_total",
+    "TTS 재시도 횟수"
+)
+TTS_CHARACTERS = Counter(
+    "podcast_tts_characters_total",
+    "합성한 문자 수"
+)
+TTS_CHARACTERS_PER_SECOND = Histogram(
+    "podcast_tts_characters_per_second",
+    "대사별 TTS 처리량 (문자/초)",
+    buckets=(2, 5, 10, 20, 40, 80, 160, 320, 640)
+)
+TTS_QUEUE_DEPTH = Gauge(
+    "podcast_tts_queue_depth",
+    "모든 작업에서 합성을 기다리는 대사 수"
+)
+
+AUDIO_PROCESSING_SECONDS = Histogram(
+    "podcast_audio_processing_seconds",
+    "오디오 처리 시간 (measure: 대사 라우드니스 측정, merge: 디코딩/병합, enhance: 후처리, mix: 배경음악 합성, encode: MP3 인코딩)",
+    ["operation"],
+    buckets=AUDIO_BUCKETS
+)
+
+LOUDNESS_LIMITED_DB = Histogram(
+    "podcast_loudness_limited_db",
+    "라우드니스 맞춤에서 피크 상한 때문에 목표보다 낮춘 게인 (0이면 목표 LUFS 달성)",
+    buckets=(0, 0.5, 1, 2, 3, 6, 10, 20)
+)
+
+AUDIO_POOL_BUSY = Gauge(
+    "podcast_audio_pool_busy",
+    "오디오 처리 프로세스 풀에서 실행 중인 작업 수"
+)
+AUDIO_POOL_PENDING = Gauge(
+    "podcast_audio_pool_pending",
+    "오디오 처리 프로세스 풀의 빈 워커를 기다리는 작업 수"
+)
+AUDIO_POOL_WAIT_SECONDS = Histogram(
+    "podcast_audio_pool_wait_seconds",
+    "오디오 처리 작업이 빈 워커를 기다린 시간",
+    buckets=(0.001, 0.01, 0.1, 0.5, 1, 2, 5, 10, 30, 60, 180)
+)
+AUDIO_POOL_REJECTED = Counter(
+    "podcast_audio_pool_rejected_total",
+    "오디오 처리 대기열이 가득 차 거절된 생성 요청 수"
+)
+
+SOURCE_PARSE_SECONDS = Histogram(
+    "podcast_source_parse_seconds",
+    "원본 콘텐츠 파싱 시간 (pdf, url)",
+    ["source"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+)
+
+STAGE_SECONDS = Histogram(
+    "podcast_stage_seconds",
+    "파이프라인 단계별 소요 시간",
+    ["stage"],
+    buckets=STAGE_BUCKETS
+)
+
+GC_RECLAIMED_BYTES = Counter(
+    "podcast_gc_reclaimed_bytes_total",
+    "삭제한 작업 디렉토리 크기 (이유별: ttl, quota, manual)",
+    ["reason"]
+)
+GC_DELETED = Counter(
+    "podcast_gc_deleted_total",
+    "삭제한 작업 수 (이유별: ttl, quota, manual)",
+    ["reason"]
+)
+OUTPUT_BYTES = Gauge(
+    "podcast_output_bytes",
+    "마지막 정리 때 측정한 출력 디렉토리 전체 크기"
+)
+BLOB_STORED_BYTES = Counter(
+    "podcast_blob_stored_bytes_total",
+    "블롭 저장소에 새로 저장한 산출물 크기"
+)
+BLOB_DEDUPLICATED_BYTES = Counter(
+    "podcast_blob_deduplicated_bytes_total",
+    "이미 있는 블롭을 참조해 저장하지 않은 산출물 크기"
+)
+
+JOBS_IN_FLIGHT = Gauge(
+    "podcast_jobs_in_flight",
+    "현재 생성 중인 팟캐스트 수"
+)
+JOBS_TOTAL = Counter(
+    "podcast_jobs_total",
+    "종료된 팟캐스트 생성 작업 수 (결과별)",
+    ["outcome"]
+)
+
+STARTUP_SECONDS = Gauge(
+    "podcast_startup_seconds",
+    "서버 시작 단계별 소요 시간 (phase: import, init(설정/클라이언트 생성), warmup(ffmpeg 확인, 연결/워커 준비))",
+    ["phase"]
+)
+
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "podcast_event_loop_lag_seconds",
+    "이벤트 루프 지연 (예약한 깨어남 시각 대비 실제 지연, 블로킹 작업 감지용)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+
+# LLM 호출 종류는 고정이므로 첫 호출 전에도 0으로 노출되도록 미리 생성
+LLM_CALL_TYPES = ("generate_podcast_script", "generate_title", "extract_key_content")
+for _call in LLM_CALL_TYPES:
+    LLM_CALL_SECONDS.labels(call=_call)
+    LLM_CALL_ERRORS.labels(call=_call)
+    LLM_FAILOVERS.labels(call=_call)
+    for _type in ("prompt", "cached", "completion"):
+        LLM_TOKENS.labels(call=_call, type=_type)
+
+# 스크립트 복구 이유와 작업 삭제 이유도 고정이므로 미리 생성
+for _reason in ("ttl", "quota", "manual"):
+    GC_RECLAIMED_BYTES.labels(reason=_reason)
+    GC_DELETED.labels(reason=_reason)
+for _reason in ("turns", "speakers"):
+    SCRIPT_REPAIRS.labels(reason=_reason)
+
+# 라벨 값이 고정된 자식 메트릭 (호출 경로에서 라벨 조회 비용 제거)
+MEASURE_SECONDS = AUDIO_PROCESSING_SECONDS.labels(operation="measure")
+MERGE_SECONDS = AUDIO_PROCESSING_SECONDS.labels(operation="merge")
+ENHANCE_SECONDS = AUDIO_PROCESSING_SECONDS.labels(operation="enhance")
+ENCODE_SECONDS = AUDIO_PROCESSING_SECONDS.labels(operation="encode")
+MIX_SECONDS = AUDIO_PROCESSING_SECONDS.labels(operation="mix")
+PEAKS_SECONDS = AUDIO_PROCESSING_SECONDS.labels(operation="peaks")
+INDEX_SECONDS = AUDIO_PROCESSING_SECONDS.labels(operation="index")
+# 렌디션을 함께 인코딩할 때 인코더 프로세스별 CPU 시간
+ENCODE_CPU_SECONDS = {
+    name: AUDIO_PROCESSING_SECONDS.labels(operation=f"encode_{name}")
+    for name in ("mp3", "opus", "aac", "hls")
+}
+PDF_PARSE_SECONDS = SOURCE_PARSE_SECONDS.labels(source="pdf")
+URL_PARSE_SECONDS = SOURCE_PARSE_SECONDS.labels(source="url")
+TTS_REQUEST_OK_SECONDS = TTS_REQUEST_SECONDS.labels(outcome="success")
+TTS_REQUEST_ERROR_SECONDS = TTS_REQUEST_SECONDS.labels(outcome="error")
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus 텍스트 형식의 메트릭과 Content-Type 반환"""
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+async def monitor_event_loop_lag(interval: float = 0.1):
+    """이벤트 루프가 블로킹된 시간을 주기적으로 측정 (앱 수명 동안 백그라운드 태스크로 실행)"""
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG_SECONDS.observe(max(0.0, time.perf_counter() - started - interval))
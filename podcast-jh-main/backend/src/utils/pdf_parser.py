@@ -5,7 +5,10 @@ from PyPDF2 import PdfReader
 import io
 from loguru import logger
 
+from src.utils.metrics import PDF_PARSE_SECONDS
 
+
+@PDF_PARSE_SECONDS.time()
 def extract_text_from_pdf(pdf_file: bytes) -> str:
     """
     PDF 파일에서 텍스트를 추출합니다.
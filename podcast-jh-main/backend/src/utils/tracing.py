@@ -0,0 +1,204 @@
+"""
+작업(job)별 트레이스 기록 모듈
+
+팟캐스트 생성 작업 하나를 트레이스 하나로 보고, 각 단계/LLM 호출/TTS 대사/재시도 대기/
+오디오 처리를 스팬(span) 트리로 기록합니다. 현재 스팬은 contextvars로 전달되므로
+asyncio 태스크와 asyncio.to_thread 안에서도 부모-자식 관계가 유지됩니다.
+활성 트레이스가 없으면 span()은 아무것도 기록하지 않습니다.
+
+완료된 트레이스는 익스포터(기본: LocalFileExporter)를 통해
+output/<id>/trace.json으로 저장되며, waterfall()로 워터폴 형태로 변환할 수 있습니다.
+"""
+import contextvars
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.utils.files import atomic_write_json
+
+
+# 자식 스팬을 감싸는 스팬 종류 (워터폴 요약에서 제외)
+CONTAINER_KINDS = ("job", "stage", "tts_line", "internal")
+
+_current_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("current_trace", default=None)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """트레이스 안의 시간 구간 하나"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "start", "end", "attributes", "status")
+
+    def __init__(self, trace: "Trace", name: str, kind: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.attributes = attributes
+        self.status = "ok"
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        end = self.end if self.end is not None else time.perf_counter()
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ms": round((self.start - self.trace.start) * 1000, 3),
+            "duration_ms": round((end - self.start) * 1000, 3),
+            "status": self.status,
+            "attributes": self.attributes
+        }
+
+
+class Trace:
+    """작업 하나의 스팬 모음"""
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.start = time.perf_counter()
+        self.started_at = time.time()
+        self.spans: List[Span] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "started_at": self.started_at,
+            "spans": [span.to_dict() for span in self.spans]
+        }
+
+
+class SpanExporter:
+    """완료된 트레이스 내보내기 인터페이스"""
+
+    def export(self, trace: Trace, output_dir: Path) -> None:
+        raise NotImplementedError
+
+
+class LocalFileExporter(SpanExporter):
+    """트레이스를 팟캐스트 출력 디렉토리에 JSON 파일로 저장 (dialogue_metadata.json 옆)"""
+
+    def __init__(self, filename: str = "trace.json"):
+        self.filename = filename
+
+    def export(self, trace: Trace, output_dir: Path) -> None:
+        atomic_write_json(Path(output_dir) / self.filename, trace.to_dict())
+
+
+@contextmanager
+def start_trace(
+    trace_id: str,
+    name: str,
+    output_dir: Path,
+    exporter: Optional[SpanExporter] = None,
+    **attributes: Any
+) -> Iterator[Trace]:
+    """새 트레이스와 루트 스팬을 시작하고, 종료 시 익스포터로 내보냄 (실패해도 내보냄)"""
+    trace = Trace(trace_id)
+    trace_token = _current_trace.set(trace)
+    try:
+        with span(name, kind="job", **attributes):
+            yield trace
+    finally:
+        _current_trace.reset(trace_token)
+        (exporter or LocalFileExporter()).export(trace, output_dir)
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Optional[Span]]:
+    """현재 스팬의 자식 스팬 기록 (활성 트레이스가 없으면 None을 반환하고 아무것도 하지 않음)"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(trace, name, kind, parent.span_id if parent else None, attributes)
+    trace.spans.append(current)
+    span_token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.attributes["error"] = str(e) or type(e).__name__
+        raise
+    finally:
+        current.end = time.perf_counter()
+        _current_span.reset(span_token)
+
+
+def token_totals(spans: List[Dict[str, Any]]) -> Dict[str, int]:
+    """LLM 스팬에 기록된 토큰 수 합계 ({"prompt", "cached", "completion"})"""
+    tokens = {"prompt": 0, "cached": 0, "completion": 0}
+    for item in spans:
+        if item["kind"] == "llm":
+            for token_type in tokens:
+                tokens[token_type] += item["attributes"].get(f"{token_type}_tokens", 0)
+    return tokens
+
+
+def waterfall(trace_data: Dict[str, Any], width: int = 40) -> Dict[str, Any]:
+    """저장된 트레이스를 워터폴 형태로 변환
+
+    각 행은 시작 시각 순으로 정렬되며, 트리 깊이와 전체 작업 시간 대비 막대(bar)를 포함합니다.
+    summary는 스팬 종류(kind)별 소요 시간 합계로, 시간이 LLM/TTS/재시도 대기/ffmpeg 중
+    어디에 쓰였는지 한눈에 보여줍니다. tokens는 LLM 스팬에 기록된 토큰 수 합계
+    (prompt, 그중 캐시 적중인 cached, completion)입니다.
+
+    Args:
+        trace_data: LocalFileExporter가 저장한 트레이스 딕셔너리
+        width: 막대 문자열 너비
+
+    Returns:
+        {"trace_id", "total_ms", "summary", "tokens", "spans"} 딕셔너리
+    """
+    spans = trace_data.get("spans", [])
+    by_id = {s["span_id"]: s for s in spans}
+
+    def depth(item: Dict[str, Any]) -> int:
+        level = 0
+        while item.get("parent_id") in by_id:
+            item = by_id[item["parent_id"]]
+            level += 1
+        return level
+
+    total_ms = max((s["start_ms"] + s["duration_ms"] for s in spans), default=0.0)
+    scale = width / total_ms if total_ms else 0
+
+    rows = []
+    for item in sorted(spans, key=lambda s: s["start_ms"]):
+        offset = int(item["start_ms"] * scale)
+        length = max(1, int(item["duration_ms"] * scale)) if total_ms else 0
+        rows.append({
+            "name": item["name"],
+            "kind": item["kind"],
+            "depth": depth(item),
+            "start_ms": item["start_ms"],
+            "duration_ms": item["duration_ms"],
+            "status": item["status"],
+            "attributes": item["attributes"],
+            "bar": " " * offset + "█" * min(length, width - offset)
+        })
+
+    # 다른 스팬을 감싸는 종류는 중복 합산을 피하기 위해 요약에서 제외
+    summary: Dict[str, float] = {}
+    for item in spans:
+        if item["kind"] in CONTAINER_KINDS:
+            continue
+        summary[item["kind"]] = round(summary.get(item["kind"], 0.0) + item["duration_ms"], 3)
+
+    return {
+        "trace_id": trace_data.get("trace_id"),
+        "total_ms": total_ms,
+        "summary": summary,
+        "tokens": token_totals(spans),
+        "spans": rows
+    }
@@ -6,6 +6,8 @@ from bs4 import BeautifulSoup
 from typing import Optional
 import re
 
+from src.utils.metrics import URL_PARSE_SECONDS
+
 
 def fetch_html(url: str, timeout: int = 10) -> Optional[str]:
     """
@@ -60,6 +62,7 @@ def clean_html_text(html: str) -> str:
     return text.strip()
 
 
+@URL_PARSE_SECONDS.time()
 def parse_url_to_text(url: str) -> str:
     """
     URL에서 HTML을 가져와 텍스트를 추출합니다.